@@ -1,3 +1,3 @@
 """CLI commands for OpenSpec."""
 
-__all__ = ["change", "init", "show", "spec", "validate", "view", "archive", "update", "list_cmd"]
\ No newline at end of file
+__all__ = ["change", "init", "show", "spec", "validate", "view", "archive", "update", "list_cmd", "diff", "blame"]
\ No newline at end of file
@@ -3,12 +3,23 @@
 import click
 from pathlib import Path
 from rich.console import Console
+from typing import List
 
-from ...core.change_operations import archive_change, list_changes
+from ...core.archive_index import rebuild_archive_index
+from ...core.archive_journal import recover_archives
+from ...core.archive_layout import migrate_to_partitions
+from ...core.archive_pack import pack_archives
+from ...core.archive_scheduler import archive_changes
+from ...core.block_diff import diff_spec_write
+from ...core.change_operations import archive_change, list_changes, ArchiveValidationError
 from ...utils.file_system import find_openspec_root
+from ...utils.storage import LOCAL_STORAGE, MemoryStorage
+from ...utils.task_progress import load_task_progress
 
 console = Console()
 
+_DIFF_STYLES = {"+": "green", "-": "red", "@": "cyan"}
+
 
 class ArchiveCommand:
     """Command handler for archiving changes."""
@@ -16,13 +27,31 @@ class ArchiveCommand:
     def __init__(self):
         self.console = Console()
     
-    def execute(self, name: str = None, archive_all: bool = False, yes: bool = False, skip_specs: bool = False, no_validate: bool = False):
+    def execute(self, name: str = None, archive_all: bool = False, yes: bool = False, skip_specs: bool = False, no_validate: bool = False, recover: bool = False, pack: bool = False, older_than: int = 0, reindex: bool = False, partition: bool = False, dry_run: bool = False):
         """Execute the archive command."""
         project_path = find_openspec_root()
         if not project_path:
             self.console.print("[red]Error: Not in an OpenSpec project directory.[/red]")
             raise click.Abort()
         
+        if recover:
+            self._recover(project_path)
+            return
+        
+        if pack:
+            self._pack(project_path, older_than)
+            return
+        
+        if partition:
+            moved = migrate_to_partitions(project_path / "openspec" / "changes" / "archive")
+            self.console.print(f"[green]✓[/green] Moved {len(moved)} archived change(s) into YYYY/MM partitions")
+            return
+        
+        if reindex:
+            index = rebuild_archive_index(project_path / "openspec" / "changes" / "archive")
+            self.console.print(f"[green]✓[/green] Indexed {len(index.entries)} archived change(s)")
+            return
+        
         if archive_all and name:
             self.console.print("[red]Error: Cannot specify both --all and a change name.[/red]")
             raise click.Abort()
@@ -41,20 +70,33 @@ class ArchiveCommand:
                     self.console.print("[yellow]No active changes to archive.[/yellow]")
                     return
                 
+                if dry_run:
+                    self._dry_run(project_path, [c["name"] for c in active_changes], skip_specs, not no_validate)
+                    return
+                
                 # Prompt for confirmation if not using --yes flag
                 if not yes:
                     if not prompt_for_confirmation(f"Archive {len(active_changes)} active change(s)?"):
                         self.console.print("[yellow]Archive cancelled.[/yellow]")
                         return
                 
-                for change in active_changes:
-                    try:
-                        archived_path = archive_change(str(project_path), change["name"], skip_specs=skip_specs)
-                        self.console.print(f"[green]✓[/green] Archived: {change['name']}")
-                    except Exception as e:
-                        self.console.print(f"[red]✗[/red] Failed to archive {change['name']}: {e}")
+                # Changes sharing a spec are archived in order; the rest run in parallel
+                outcomes = archive_changes(
+                    str(project_path),
+                    [c["name"] for c in active_changes],
+                    skip_specs=skip_specs,
+                    validate=not no_validate
+                )
+                for outcome in outcomes:
+                    if outcome.ok:
+                        self.console.print(f"[green]✓[/green] Archived: {outcome.name}")
+                    else:
+                        self.console.print(f"[red]✗[/red] Failed to archive {outcome.name}: {outcome.error}")
+                        if isinstance(outcome.error, ArchiveValidationError):
+                            self._print_validation_errors(outcome.error)
                 
-                self.console.print(f"\n[green]Archived {len(active_changes)} change(s).[/green]")
+                archived_count = sum(1 for outcome in outcomes if outcome.ok)
+                self.console.print(f"\n[green]Archived {archived_count} change(s).[/green]")
                 
             else:
                 # Check if change exists
@@ -66,6 +108,10 @@ class ArchiveCommand:
                 # Check for incomplete tasks and warn
                 self._check_incomplete_tasks(change_path)
                 
+                if dry_run:
+                    self._dry_run(project_path, [name], skip_specs, not no_validate)
+                    return
+                
                 # Prompt for confirmation if not using --yes flag
                 if not yes:
                     if not prompt_for_confirmation(f"Archive change '{name}'?"):
@@ -73,7 +119,13 @@ class ArchiveCommand:
                         return
                 
                 # Archive specific change
-                archived_path = archive_change(str(project_path), name, skip_specs=skip_specs)
+                try:
+                    archived_path = archive_change(str(project_path), name, skip_specs=skip_specs, validate=not no_validate)
+                except ArchiveValidationError as e:
+                    self.console.print(f"[red]Error: {e}[/red]")
+                    self._print_validation_errors(e)
+                    self.console.print("[dim]Fix the deltas or re-run with --no-validate to skip these checks.[/dim]")
+                    raise click.Abort()
                 self.console.print(f"[green]✓[/green] Archived change: {name}")
                 self.console.print(f"[dim]Moved to: {archived_path}[/dim]")
             
@@ -84,26 +136,85 @@ class ArchiveCommand:
             self.console.print(f"[red]Error archiving change(s): {e}[/red]")
             raise click.Abort()
     
+    def _dry_run(self, project_path: Path, names: List[str], skip_specs: bool, validate: bool) -> None:
+        """Archive changes against an in-memory copy of the project and show the spec diffs."""
+        storage = MemoryStorage(LOCAL_STORAGE)
+        outcomes = archive_changes(
+            str(project_path), names, skip_specs=skip_specs, validate=validate, storage=storage
+        )
+        
+        failed = [outcome for outcome in outcomes if not outcome.ok]
+        for outcome in failed:
+            self.console.print(f"[red]✗[/red] Would fail to archive {outcome.name}: {outcome.error}")
+            if isinstance(outcome.error, ArchiveValidationError):
+                self._print_validation_errors(outcome.error)
+        
+        # Everything moved into the archive is a change directory, the rest are spec writes
+        moved = [Path(outcome.archived_path).as_posix() + "/" for outcome in outcomes if outcome.ok]
+        spec_paths = list(dict.fromkeys(
+            path for path in storage.written if not any(path.startswith(prefix) for prefix in moved)
+        ))
+        
+        added = modified = removed = 0
+        for path in spec_paths:
+            current = LOCAL_STORAGE.read_text(path) if LOCAL_STORAGE.is_file(path) else ""
+            relative = Path(path).relative_to(project_path).as_posix()
+            spec_diff = diff_spec_write(relative, current, storage.read_text(path))
+            if not spec_diff.unified:
+                continue
+            for line in spec_diff.unified:
+                self.console.print(line, style=_DIFF_STYLES.get(line[:1]), markup=False, highlight=False)
+            self.console.print(
+                f"[bold]{relative}[/bold]: +{len(spec_diff.added)} added, "
+                f"~{len(spec_diff.modified)} modified, -{len(spec_diff.removed)} removed requirement(s)\n"
+            )
+            added += len(spec_diff.added)
+            modified += len(spec_diff.modified)
+            removed += len(spec_diff.removed)
+        
+        for outcome in outcomes:
+            if outcome.ok:
+                self.console.print(f"[dim]Would move {outcome.name} to: {outcome.archived_path}[/dim]")
+        self.console.print(
+            f"\n[bold]Summary:[/bold] {len(outcomes) - len(failed)} change(s), {len(spec_paths)} spec(s); "
+            f"requirements +{added} added, ~{modified} modified, -{removed} removed"
+        )
+        self.console.print("[green]Dry run: no files were written or moved.[/green]")
+        if failed:
+            raise click.Abort()
+    
+    def _recover(self, project_path: Path) -> None:
+        """Finish or undo archives interrupted by a crash."""
+        recovered = recover_archives(project_path / "openspec" / "changes")
+        if not recovered:
+            self.console.print("[green]No interrupted archives found.[/green]")
+            return
+        for entry in recovered:
+            self.console.print(f"[green]✓[/green] {entry['change']}: {entry['action']}")
+    
+    def _pack(self, project_path: Path, older_than: int) -> None:
+        """Fold old archive directories into the pack store."""
+        result = pack_archives(project_path / "openspec" / "changes" / "archive", older_than)
+        if not result.packed:
+            self.console.print("[yellow]No archived changes to pack.[/yellow]")
+            return
+        for name in result.packed:
+            self.console.print(f"[green]✓[/green] Packed: {name}")
+        self.console.print(
+            f"\n[green]Packed {len(result.packed)} change(s): {result.files} file(s), "
+            f"{result.blobs_added} new blob(s), {result.deduplicated} deduplicated.[/green]"
+        )
+    
+    def _print_validation_errors(self, error: ArchiveValidationError) -> None:
+        """Print each pre-archive validation error."""
+        for message in error.errors:
+            self.console.print(f"  • {message}")
+    
     def _check_incomplete_tasks(self, change_path: Path) -> None:
         """Check for incomplete tasks and warn if found."""
-        tasks_file = change_path / "tasks.md"
-        if not tasks_file.exists():
-            return
-        
-        try:
-            content = tasks_file.read_text()
-            import re
-            
-            # Count incomplete tasks
-            incomplete_tasks = re.findall(r'^\s*-\s*\[\s*\]', content, re.MULTILINE)
-            incomplete_count = len(incomplete_tasks)
-            
-            if incomplete_count > 0:
-                self.console.print(f"[yellow]Warning: {incomplete_count} incomplete task(s) found[/yellow]")
-        except Exception:
-            # Ignore errors reading tasks file
-            pass
-
+        incomplete_count = load_task_progress(change_path).incomplete
+        if incomplete_count > 0:
+            self.console.print(f"[yellow]Warning: {incomplete_count} incomplete task(s) found[/yellow]")
 
 def prompt_for_confirmation(message: str) -> bool:
     """Prompt user for confirmation."""
@@ -117,7 +228,13 @@ def prompt_for_confirmation(message: str) -> bool:
 @click.option("--yes", is_flag=True, help="Skip confirmation prompts")
 @click.option("--skip-specs", is_flag=True, help="Skip updating specs")
 @click.option("--no-validate", is_flag=True, help="Skip validation before archiving")
-def archive(name: str, archive_all: bool, yes: bool, skip_specs: bool, no_validate: bool):
+@click.option("--recover", is_flag=True, help="Finish or undo archives interrupted by a crash")
+@click.option("--pack", is_flag=True, help="Fold archived changes into the compressed archive pack")
+@click.option("--older-than", type=click.IntRange(min=0), default=0, help="With --pack, only pack changes archived at least this many days ago")
+@click.option("--reindex", is_flag=True, help="Rebuild the archive index from the archived changes on disk")
+@click.option("--partition", is_flag=True, help="Move archived changes into archive/YYYY/MM/ partitions; later archives follow")
+@click.option("--dry-run", is_flag=True, help="Show the spec diffs archiving would make, without writing anything")
+def archive(name: str, archive_all: bool, yes: bool, skip_specs: bool, no_validate: bool, recover: bool, pack: bool, older_than: int, reindex: bool, partition: bool, dry_run: bool):
     """Archive completed changes."""
     command = ArchiveCommand()
-    command.execute(name, archive_all, yes, skip_specs, no_validate)
\ No newline at end of file
+    command.execute(name, archive_all, yes, skip_specs, no_validate, recover, pack, older_than, reindex, partition, dry_run)
\ No newline at end of file
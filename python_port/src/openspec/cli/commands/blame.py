@@ -0,0 +1,61 @@
+"""Blame command for OpenSpec CLI."""
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ...core.spec_blame import blame_spec
+from ...utils.file_system import find_openspec_root
+
+console = Console()
+
+_UNKNOWN = "[dim](before archive history)[/dim]"
+
+
+@click.command()
+@click.argument("spec_name")
+@click.option("--json", is_flag=True, help="Output as JSON")
+def blame(spec_name: str, json: bool):
+    """Show which archived change last touched each requirement of a spec.
+    
+    Archived change deltas are replayed in archive order; the result is
+    cached in openspec/.cache/ and extended as new changes are archived.
+    """
+    
+    project_path = find_openspec_root()
+    if not project_path:
+        console.print("[red]Error: Not in an OpenSpec project directory.[/red]")
+        raise click.Abort()
+    
+    blamed = blame_spec(project_path, spec_name)
+    if blamed is None:
+        console.print(f"[red]Error: Spec '{spec_name}' not found.[/red]")
+        raise click.Abort()
+    
+    if json:
+        import json as json_lib
+        console.print(json_lib.dumps({
+            "spec": spec_name,
+            "requirements": [requirement.to_dict() for requirement in blamed],
+        }, indent=2))
+        return
+    
+    if not blamed:
+        console.print(f"[yellow]Spec '{spec_name}' has no requirements.[/yellow]")
+        return
+    
+    table = Table(title=f"Blame: {spec_name}")
+    table.add_column("Requirement / Scenario", style="cyan")
+    table.add_column("Last changed by", style="green")
+    table.add_column("Introduced by", style="blue")
+    
+    for requirement in blamed:
+        table.add_row(
+            requirement.title,
+            requirement.changed_by or _UNKNOWN,
+            requirement.introduced_by or _UNKNOWN,
+        )
+        for scenario in requirement.scenarios:
+            table.add_row(f"  Scenario: {scenario.title}", scenario.changed_by or _UNKNOWN, "")
+    
+    console.print(table)
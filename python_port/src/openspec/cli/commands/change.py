@@ -3,8 +3,9 @@
 import click
 from pathlib import Path
 from rich.console import Console
+from rich.table import Table
 
-from ...core.change_operations import list_changes, show_change
+from ...core.change_operations import find_change_conflicts, list_changes, show_change, sync_change
 from ...utils.file_system import find_openspec_root
 
 console = Console()
@@ -74,4 +75,99 @@ def show(name: str):
         
     except Exception as e:
         console.print(f"[red]Error showing change: {e}[/red]")
-        raise click.Abort()
\ No newline at end of file
+        raise click.Abort()
+
+_SYNC_STYLES = {
+    "merged": "[green]merged[/green]",
+    "conflict": "[red]conflict[/red]",
+    "rebased": "[green]rebased[/green]",
+    "needs-review": "[yellow]edited since the change was written, review and sync with --confirm[/yellow]",
+    "confirmed": "[green]confirmed[/green]",
+    "missing": "[yellow]missing from spec[/yellow]",
+    "no-base": "[dim]no base recorded[/dim]",
+}
+
+
+@change.command()
+@click.argument("name")
+@click.option("--confirm", is_flag=True, help="Accept REMOVED and RENAMED requirements edited since the change was written")
+def sync(name: str, confirm: bool):
+    """Rebase a change's deltas onto the current specs."""
+    
+    project_path = find_openspec_root()
+    if not project_path:
+        console.print("[red]Error: Not in an OpenSpec project directory.[/red]")
+        raise click.Abort()
+    
+    try:
+        outcomes = sync_change(str(project_path), name, confirm=confirm)
+    except Exception as e:
+        console.print(f"[red]Error syncing change: {e}[/red]")
+        raise click.Abort()
+    
+    changed = [o for o in outcomes if o.status != "up-to-date"]
+    if not changed:
+        console.print(f"[green]Change '{name}' is up to date with the specs.[/green]")
+        return
+    
+    for outcome in changed:
+        label = _SYNC_STYLES.get(outcome.status, outcome.status)
+        console.print(f"  {outcome.spec_name}: {outcome.operation} '{outcome.requirement}' - {label}")
+    
+    conflicts = sum(o.conflicts for o in outcomes)
+    if conflicts:
+        console.print(
+            f"[red]{conflicts} conflict(s) written to the delta files. "
+            "Resolve the markers, then validate again.[/red]"
+        )
+        raise click.Abort()
+    if any(o.status == "needs-review" for o in outcomes):
+        console.print(
+            "[yellow]Requirements this change removes or renames were edited since it was written. "
+            "Review them, then run sync again with --confirm.[/yellow]"
+        )
+        raise click.Abort()
+    console.print(f"[green]Change '{name}' synced with the specs.[/green]")
+
+
+@change.command()
+@click.option("--json", is_flag=True, help="Output as JSON")
+def conflicts(json: bool):
+    """Show requirements touched by more than one active change."""
+    
+    project_path = find_openspec_root()
+    if not project_path:
+        console.print("[red]Error: Not in an OpenSpec project directory.[/red]")
+        raise click.Abort()
+    
+    try:
+        report = find_change_conflicts(str(project_path))
+    except Exception as e:
+        console.print(f"[red]Error finding conflicts: {e}[/red]")
+        raise click.Abort()
+    
+    if json:
+        import json as json_lib
+        console.print(json_lib.dumps(report.to_dict(), indent=2))
+        return
+    
+    if not report.conflicts:
+        console.print(f"[green]No overlapping requirements across {len(report.changes)} active change(s).[/green]")
+        return
+    
+    table = Table(title="Overlapping Requirements")
+    table.add_column("Spec", style="cyan")
+    table.add_column("Requirement", style="blue")
+    table.add_column("Changes", style="yellow")
+    
+    for conflict in report.conflicts:
+        table.add_row(
+            conflict.spec_name,
+            conflict.requirement,
+            ", ".join(f"{name} ({operation})" for name, operation in conflict.changes)
+        )
+    
+    console.print(table)
+    
+    if report.independent:
+        console.print(f"\n[green]Independent changes:[/green] {', '.join(report.independent)}")
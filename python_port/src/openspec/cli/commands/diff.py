@@ -0,0 +1,74 @@
+"""Diff command for OpenSpec CLI."""
+
+import click
+from pathlib import Path
+from rich.console import Console
+
+from ...core.spec_diff import diff_specs
+from ...core.spec_sources import SpecSourceError, load_specs
+from ...utils.file_system import find_openspec_root
+
+console = Console()
+
+_MARKERS = {
+    "added": "[green]+[/green]",
+    "removed": "[red]-[/red]",
+    "modified": "[yellow]~[/yellow]",
+    "renamed": "[cyan]→[/cyan]",
+}
+
+
+@click.command()
+@click.argument("old")
+@click.argument("new", required=False)
+@click.option("--spec", "spec_name", help="Only diff this spec")
+@click.option("--json", is_flag=True, help="Output as JSON")
+def diff(old: str, new: str, spec_name: str, json: bool):
+    """Show requirement-level changes between two spec states.
+    
+    OLD and NEW may each be a spec file, a spec or specs directory, or a git
+    revision (optionally REV:path). NEW defaults to the working tree specs.
+    """
+    
+    project_path = find_openspec_root()
+    if not project_path:
+        console.print("[red]Error: Not in an OpenSpec project directory.[/red]")
+        raise click.Abort()
+    
+    try:
+        before = load_specs(project_path, old, spec_name)
+        after = load_specs(project_path, new or str(project_path / "openspec" / "specs"), spec_name)
+    except SpecSourceError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise click.Abort()
+    
+    # Two spec files are compared with each other, whatever they are called
+    if new and Path(old).is_file() and Path(new).is_file() and set(before) != set(after):
+        after = {next(iter(before)): next(iter(after.values()))}
+    
+    diffs = diff_specs(before, after)
+    
+    if json:
+        import json as json_lib
+        console.print(json_lib.dumps({"specs": [spec_diff.to_dict() for spec_diff in diffs]}, indent=2))
+        return
+    
+    if not diffs:
+        console.print("[green]No requirement changes.[/green]")
+        return
+    
+    for spec_diff in diffs:
+        suffix = "" if spec_diff.status == "modified" else f" [dim]({spec_diff.status})[/dim]"
+        console.print(f"[bold]{spec_diff.spec_name}[/bold]{suffix}")
+        for change in spec_diff.changes:
+            if change.status == "renamed":
+                console.print(
+                    f"  {_MARKERS['renamed']} Requirement: {change.old_title} → {change.title} "
+                    f"[dim]({change.similarity:.0%} similar)[/dim]"
+                )
+            else:
+                console.print(f"  {_MARKERS[change.status]} Requirement: {change.title}")
+            if change.description_changed:
+                console.print(f"      {_MARKERS['modified']} description")
+            for scenario in change.scenarios:
+                console.print(f"      {_MARKERS[scenario.status]} Scenario: {scenario.title}")
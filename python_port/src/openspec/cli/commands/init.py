@@ -9,9 +9,10 @@ from typing import List
 
 from ...core.config import AI_TOOLS, OPENSPEC_DIR_NAME
 from ...core.templates import create_project_template
-from ...core.configurators.registry import ToolRegistry
-from ...core.configurators.slash.registry import SlashCommandRegistry
-from ...utils.file_system import ensure_directory, write_file
+from ...core.configurators.runner import configure_tools, run_configurators
+from ...core.manifest import record_manifest
+from ...utils.file_markers import DEFAULT_BLOCK, block_end_marker, block_start_marker, update_file_blocks
+from ...utils.file_system import ensure_directory, track_writes, write_file
 
 console = Console()
 
@@ -63,61 +64,41 @@ class InitCommand:
         
         # Create directory structure
         try:
-            ensure_directory(str(openspec_dir))
-            ensure_directory(str(openspec_dir / "changes"))
-            ensure_directory(str(openspec_dir / "changes" / "archive"))
-            ensure_directory(str(openspec_dir / "specs"))
-            
-            # Create template files (project.md and AGENTS.md)
-            from ...core.templates.manager import TemplateManager
-            templates = TemplateManager.get_templates()
-            
-            for template in templates:
-                file_path = openspec_dir / template.path
-                write_file(str(file_path), template.content)
-            
-            # Create root AGENTS.md stub from TypeScript template
-            root_agents_content = self._get_root_agents_template()
-            write_file(str(current_dir / "AGENTS.md"), root_agents_content)
-            
-            # Create tool-specific configuration files with OpenSpec markers
-            # Only create when tools are actually selected
-            if selected_tools:
-                for tool in selected_tools:
-                    tool_value = tool.value if hasattr(tool, 'value') else tool
-                    
-                    # Create config file for tools that have one
-                    if hasattr(tool, 'config_file_name') and tool.config_file_name:
-                        config_content = _create_ai_tool_config()
-                        config_path = current_dir / tool.config_file_name
-                        
-                        # If file exists, update only the managed block
-                        if config_path.exists():
-                            _update_managed_block(str(config_path), config_content)
-                        else:
-                            write_file(str(config_path), config_content)
-                    
-                    # Create slash command files for supported tools
-                    if tool_value == "claude":
-                        self._create_claude_slash_commands(current_dir)
-                    elif tool_value == "cursor":
-                        self._create_cursor_slash_commands(current_dir)
-                    elif tool_value == "cline":
-                        self._create_cline_slash_commands(current_dir)
-                    elif tool_value == "github-copilot":
-                        self._create_github_copilot_prompts(current_dir)
-            
-            # Create Windsurf workflow files if windsurf is selected
-            windsurf_selected = any(
-                (hasattr(t, 'value') and t.value == "windsurf") or t == "windsurf" 
-                for t in selected_tools
-            )
-            if windsurf_selected:
-                _create_windsurf_workflows(current_dir)
+            with track_writes() as report:
+                ensure_directory(str(openspec_dir))
+                ensure_directory(str(openspec_dir / "changes"))
+                ensure_directory(str(openspec_dir / "changes" / "archive"))
+                ensure_directory(str(openspec_dir / "specs"))
+                
+                # Create template files (project.md and AGENTS.md)
+                from ...core.templates.manager import TemplateManager
+                templates = TemplateManager.get_templates()
+                
+                for template in templates:
+                    file_path = openspec_dir / template.path
+                    write_file(str(file_path), template.content)
+                
+                # Create root AGENTS.md stub from TypeScript template, keeping
+                # the user's own instructions around the block if the file exists
+                root_agents_path = current_dir / "AGENTS.md"
+                if root_agents_path.exists():
+                    update_file_blocks(str(root_agents_path), {DEFAULT_BLOCK: self._get_root_agents_stub()})
+                else:
+                    write_file(str(root_agents_path), self._get_root_agents_template())
+                
+                # Configure the selected tools through the registries, all in one parallel pass
+                tool_ids = [tool.value if hasattr(tool, 'value') else tool for tool in selected_tools]
+                for result in configure_tools(str(current_dir), str(openspec_dir), tool_ids):
+                    if not result.ok:
+                        self.console.print(
+                            f"[yellow]Warning: Could not configure {result.tool_id} ({result.error}). Skipping.[/yellow]"
+                        )
+            record_manifest(current_dir, report.written + report.skipped)
             
             self.console.print(f"[green]✓[/green] Initialized OpenSpec project in {current_dir}")
             self.console.print(f"[green]✓[/green] Created {OPENSPEC_DIR_NAME}/ directory")
             self.console.print(f"[green]✓[/green] Created AGENTS.md with {len(selected_tools)} AI tool(s)")
+            self.console.print(f"[dim]{report.summary()}[/dim]")
             
             # Show next steps
             self.console.print("\n[bold blue]Use `openspec-py update` to refresh shared OpenSpec instructions in the future.[/bold blue]")
@@ -138,82 +119,25 @@ class InitCommand:
             raise click.Abort()
     
     
-    def _create_claude_slash_commands(self, current_dir: Path) -> None:
-        """Create Claude slash command files using TemplateManager."""
-        claude_dir = current_dir / ".claude" / "commands" / "openspec"
-        ensure_directory(str(claude_dir))
-        
-        try:
-            # Use TemplateManager to get slash command content
-            from ...core.templates.manager import TemplateManager
-            
-            # Get template content for each command
-            proposal_content = self._add_claude_frontmatter(
-                TemplateManager.get_slash_command_body("proposal"),
-                "proposal",
-                "Scaffold a new OpenSpec change and validate strictly."
-            )
-            apply_content = self._add_claude_frontmatter(
-                TemplateManager.get_slash_command_body("apply"),
-                "apply", 
-                "Implement an approved OpenSpec change and keep tasks in sync."
-            )
-            archive_content = self._add_claude_frontmatter(
-                TemplateManager.get_slash_command_body("archive"),
-                "archive",
-                "Archive a deployed OpenSpec change and update specs."
-            )
-            
-            # Write the files
-            write_file(str(claude_dir / "proposal.md"), proposal_content)
-            write_file(str(claude_dir / "apply.md"), apply_content)
-            write_file(str(claude_dir / "archive.md"), archive_content)
-            
-        except Exception as e:
-            # Fallback to basic templates if TemplateManager fails
-            self.console.print(f"[yellow]Warning: Could not read templates from TemplateManager ({e}). Using fallback templates.[/yellow]")
-            self._create_fallback_claude_commands(claude_dir)
-    
-    def _add_claude_frontmatter(self, content: str, command_id: str, description: str) -> str:
-        """Add Claude slash command frontmatter to template content with OpenSpec markers."""
-        # Map command IDs to their tags (matching TypeScript)
-        tag_map = {
-            "proposal": "change",
-            "apply": "apply",
-            "archive": "archive"
-        }
-        tag = tag_map.get(command_id, command_id)
-        
-        frontmatter = f"""---
-name: OpenSpec: {command_id.title()}
-description: {description}
-category: OpenSpec
-tags: [openspec, {tag}]
----
-<!-- OPENSPEC:START -->
-"""
-        footer = """<!-- OPENSPEC:END -->
-"""
-        return frontmatter + content + "\n" + footer
-    
     def _get_root_agents_template(self) -> str:
-        """Get the root AGENTS.md template using TemplateManager."""
+        """Get the root AGENTS.md stub wrapped in OpenSpec markers."""
+        # Match TypeScript: START\n + content (ends with \n) + \n + END (no trailing newline)
+        # Since content ends with \n, we only add one more \n
+        return f"{block_start_marker()}\n{self._get_root_agents_stub()}\n{block_end_marker()}"
+    
+    def _get_root_agents_stub(self) -> str:
+        """Get the root AGENTS.md stub content using TemplateManager."""
         try:
             from ...core.templates.manager import TemplateManager
             
-            # Get template content from TemplateManager
-            # Template already ends with \n, TypeScript adds one more \n before END marker
-            content = TemplateManager.get_agents_root_stub()
-            
-            # Match TypeScript: START\n + content (ends with \n) + \n + END (no trailing newline)
-            # Since content ends with \n, we only add one more \n
-            return f"<!-- OPENSPEC:START -->\n{content}\n<!-- OPENSPEC:END -->"
+            # Get template content from TemplateManager; it already ends with \n
+            return TemplateManager.get_agents_root_stub()
                 
         except Exception as e:
             self.console.print(f"[yellow]Warning: Could not read root agents template from TemplateManager ({e}). Using fallback.[/yellow]")
         
         # Fallback template - content should end with newline
-        content = """# OpenSpec Instructions
+        return """# OpenSpec Instructions
 
 These instructions are for AI assistants working in this project.
 
@@ -229,144 +153,6 @@ Use `@/openspec/AGENTS.md` to learn:
 
 Keep this managed block so 'openspec update' can refresh the instructions.
 """
-        # Match TypeScript: START\n + content (ends with \n) + \n + END
-        return f"<!-- OPENSPEC:START -->\n{content}\n<!-- OPENSPEC:END -->"
-
-    def _create_fallback_claude_commands(self, claude_dir: Path) -> None:
-        """Create basic fallback Claude commands if TypeScript templates unavailable."""
-        proposal_content = """---
-name: OpenSpec: Proposal
-description: Create a new OpenSpec change proposal.
-category: OpenSpec
-tags: [openspec, change]
----
-
-Create a new OpenSpec change proposal with proper structure and validation.
-
-Create OpenSpec change proposals using AI assistants.
-"""
-        
-        apply_content = """---
-name: OpenSpec: Apply
-description: Apply an OpenSpec change proposal.
-category: OpenSpec
-tags: [openspec, apply]
----
-
-Apply an approved OpenSpec change proposal to the specifications.
-
-Review the change proposal and implement the specified changes.
-"""
-        
-        archive_content = """---
-name: OpenSpec: Archive
-description: Archive a completed OpenSpec change.
-category: OpenSpec
-tags: [openspec, archive]
----
-
-Archive a completed OpenSpec change after implementation.
-
-Use `openspec-py archive <id>` to move the change to the archive.
-"""
-        
-        write_file(str(claude_dir / "proposal.md"), proposal_content)
-        write_file(str(claude_dir / "apply.md"), apply_content)
-        write_file(str(claude_dir / "archive.md"), archive_content)
-    
-    def _create_cursor_slash_commands(self, current_dir: Path) -> None:
-        """Create Cursor slash command files."""
-        cursor_dir = current_dir / ".cursor" / "commands"
-        ensure_directory(str(cursor_dir))
-        
-        try:
-            from ...core.templates.manager import TemplateManager
-            
-            # Create all three cursor commands
-            commands = {
-                "proposal": "Scaffold a new OpenSpec change and validate strictly.",
-                "apply": "Implement an approved OpenSpec change and keep tasks in sync.",
-                "archive": "Archive a deployed OpenSpec change and update specs."
-            }
-            
-            for cmd_id, description in commands.items():
-                body = TemplateManager.get_slash_command_body(cmd_id)
-                frontmatter = f"""---
-name: /openspec-{cmd_id}
-id: openspec-{cmd_id}
-category: OpenSpec
-description: {description}
----
-<!-- OPENSPEC:START -->
-"""
-                footer = """<!-- OPENSPEC:END -->
-"""
-                content = frontmatter + body + "\n" + footer
-                write_file(str(cursor_dir / f"openspec-{cmd_id}.md"), content)
-                
-        except Exception as e:
-            self.console.print(f"[yellow]Warning: Could not create cursor commands ({e}). Skipping.[/yellow]")
-    
-    def _create_cline_slash_commands(self, current_dir: Path) -> None:
-        """Create Cline slash command files."""
-        cline_dir = current_dir / ".clinerules"
-        ensure_directory(str(cline_dir))
-        
-        try:
-            from ...core.templates.manager import TemplateManager
-            
-            commands = {
-                "proposal": "Scaffold a new OpenSpec change and validate strictly.",
-                "apply": "Implement an approved OpenSpec change and keep tasks in sync.",
-                "archive": "Archive a deployed OpenSpec change and update specs."
-            }
-            
-            for cmd_id, description in commands.items():
-                body = TemplateManager.get_slash_command_body(cmd_id)
-                title = cmd_id.capitalize()
-                frontmatter = f"""# OpenSpec: {title}
-
-{description}
-<!-- OPENSPEC:START -->
-"""
-                footer = """<!-- OPENSPEC:END -->
-"""
-                content = frontmatter + body + "\n" + footer
-                write_file(str(cline_dir / f"openspec-{cmd_id}.md"), content)
-                
-        except Exception as e:
-            self.console.print(f"[yellow]Warning: Could not create cline commands ({e}). Skipping.[/yellow]")
-    
-    def _create_github_copilot_prompts(self, current_dir: Path) -> None:
-        """Create GitHub Copilot prompt files."""
-        prompts_dir = current_dir / ".github" / "prompts"
-        ensure_directory(str(prompts_dir))
-        
-        try:
-            from ...core.templates.manager import TemplateManager
-            
-            commands = {
-                "proposal": "Scaffold a new OpenSpec change and validate strictly.",
-                "apply": "Implement an approved OpenSpec change and keep tasks in sync.",
-                "archive": "Archive a deployed OpenSpec change and update specs."
-            }
-            
-            for cmd_id, description in commands.items():
-                body = TemplateManager.get_slash_command_body(cmd_id)
-                frontmatter = f"""---
-description: {description}
----
-
-$ARGUMENTS
-<!-- OPENSPEC:START -->
-"""
-                footer = """<!-- OPENSPEC:END -->
-"""
-                content = frontmatter + body + "\n" + footer
-                write_file(str(prompts_dir / f"openspec-{cmd_id}.prompt.md"), content)
-                
-        except Exception as e:
-            self.console.print(f"[yellow]Warning: Could not create GitHub Copilot prompts ({e}). Skipping.[/yellow]")
 
 
 def prompt_for_ai_tools(available_tools: List) -> List:
@@ -416,101 +202,4 @@ def init(path: str, force: bool, non_interactive: bool, tools: str):
 
 async def configure_ai_tools(project_path: str, openspec_dir: str, tool_ids: List[str]) -> None:
     """Configure AI tools for the project."""
-    for tool_id in tool_ids:
-        # Configure main tool
-        configurator = ToolRegistry.get(tool_id)
-        if configurator and configurator.is_available:
-            await configurator.configure(project_path, openspec_dir)
-        
-        # Configure slash commands
-        slash_configurator = SlashCommandRegistry.get(tool_id)
-        if slash_configurator and slash_configurator.is_available:
-            await slash_configurator.generate_all(project_path, openspec_dir)
-
-
-def _create_ai_tool_config() -> str:
-    """Create AI tool configuration file content with OpenSpec markers."""
-    from ...core.templates.manager import TemplateManager
-    
-    # Use the same template as TypeScript (agentsRootStubTemplate)
-    # Template already ends with \n
-    content = TemplateManager.get_agents_root_stub()
-    
-    # Match TypeScript: START\n + content (ends with \n) + \n + END (no trailing newline)
-    # Since content ends with \n, we only add one more \n
-    return f"<!-- OPENSPEC:START -->\n{content}\n<!-- OPENSPEC:END -->"
-
-
-def _create_windsurf_workflows(current_dir: Path) -> None:
-    """Create Windsurf workflow files."""
-    
-    workflows_dir = current_dir / ".windsurf" / "workflows"
-    ensure_directory(str(workflows_dir))
-    
-    try:
-        from ...core.templates.manager import TemplateManager
-        
-        commands = {
-            "proposal": "Scaffold a new OpenSpec change and validate strictly.",
-            "apply": "Implement an approved OpenSpec change and keep tasks in sync.",
-            "archive": "Archive a deployed OpenSpec change and update specs."
-        }
-        
-        for cmd_id, description in commands.items():
-            body = TemplateManager.get_slash_command_body(cmd_id)
-            frontmatter = f"""---
-description: {description}
-auto_execution_mode: 3
----
-<!-- OPENSPEC:START -->
-"""
-            footer = """<!-- OPENSPEC:END -->
-"""
-            content = frontmatter + body + "\n" + footer
-            write_file(str(workflows_dir / f"openspec-{cmd_id}.md"), content)
-            
-    except Exception as e:
-        from rich.console import Console
-        console = Console()
-        console.print(f"[yellow]Warning: Could not create windsurf workflows ({e}). Skipping.[/yellow]")
-
-
-def _update_managed_block(file_path: str, new_content: str) -> None:
-    """Update only the OpenSpec managed block in an existing file."""
-    from ...utils.file_system import read_file
-    
-    try:
-        existing_content = read_file(file_path)
-        
-        # Extract the managed block from new content
-        start_marker = "<!-- OPENSPEC:START -->"
-        end_marker = "<!-- OPENSPEC:END -->"
-        
-        new_start = new_content.find(start_marker)
-        new_end = new_content.find(end_marker)
-        
-        if new_start == -1 or new_end == -1:
-            # No managed block in new content, just write it
-            write_file(file_path, new_content)
-            return
-        
-        new_managed_block = new_content[new_start:new_end + len(end_marker)]
-        
-        # Find existing managed block
-        existing_start = existing_content.find(start_marker)
-        existing_end = existing_content.find(end_marker)
-        
-        if existing_start == -1 or existing_end == -1:
-            # No existing managed block, append to file
-            updated_content = existing_content + "\n\n" + new_managed_block + "\n"
-        else:
-            # Replace existing managed block
-            before_block = existing_content[:existing_start]
-            after_block = existing_content[existing_end + len(end_marker):]
-            updated_content = before_block + new_managed_block + after_block
-        
-        write_file(file_path, updated_content)
-        
-    except Exception:
-        # If update fails, just write the new content
-        write_file(file_path, new_content)
\ No newline at end of file
+    await run_configurators(project_path, openspec_dir, tool_ids)
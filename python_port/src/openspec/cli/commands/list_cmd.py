@@ -5,6 +5,7 @@ from rich.console import Console
 
 from ...core.change_operations import list_changes
 from ...utils.file_system import find_openspec_root, list_directories
+from ...utils.task_progress import load_task_progress
 from pathlib import Path
 
 console = Console()
@@ -16,7 +17,7 @@ class ListCommand:
     def __init__(self):
         self.console = Console()
     
-    def execute(self, project_path: str = None, item_type: str = "changes", archived: bool = False):
+    def execute(self, project_path: str = None, item_type: str = "changes", archived: bool = False, since: str = None, limit: int = None):
         """Execute the list command."""
         if project_path is None:
             project_path = find_openspec_root()
@@ -32,7 +33,7 @@ class ListCommand:
         
         try:
             if item_type in ["changes", "all"]:
-                self._list_changes(project_path, archived)
+                self._list_changes(project_path, archived or since is not None or limit is not None, since, limit)
             
             if item_type in ["specs", "all"]:
                 self._list_specs(project_path)
@@ -43,14 +44,21 @@ class ListCommand:
             self.console.print(f"[red]Error listing items: {e}[/red]")
             raise click.Abort()
     
-    def _list_changes(self, project_path: str, include_archived: bool):
+    def _list_changes(self, project_path: str, include_archived: bool, since: str = None, limit: int = None):
         """List changes."""
         from ...core.change_operations import list_changes as list_changes_op
         
-        changes = list_changes_op(project_path)
+        # Without archives, or with a limit, only the newest partitions are listed
+        changes = list_changes_op(project_path, archived_limit=limit if include_archived else 0)
         
         if not include_archived:
             changes = [c for c in changes if not c["is_archived"]]
+        elif since is not None:
+            # Only archives from the index's date range, looked up by bisection
+            from ...core.archive_index import ArchiveIndex
+            archive_dir = Path(project_path) / "openspec" / "changes" / "archive"
+            recent = {entry.directory for entry in ArchiveIndex.load(archive_dir).since(since)}
+            changes = [c for c in changes if not c["is_archived"] or c["name"] in recent]
         
         if not changes:
             status = "active changes" if not include_archived else "changes (including archived)"
@@ -99,32 +107,17 @@ class ListCommand:
     
     def _get_task_info(self, change_path: str) -> dict:
         """Get task completion information for a change."""
-        tasks_file = Path(change_path) / "tasks.md"
-        if not tasks_file.exists():
-            return {'completed': 0, 'total': 0}
-        
-        try:
-            content = tasks_file.read_text()
-            import re
-            
-            # Find task lines
-            completed_tasks = re.findall(r'^\s*-\s*\[x\]', content, re.MULTILINE)
-            incomplete_tasks = re.findall(r'^\s*-\s*\[\s*\]', content, re.MULTILINE)
-            
-            completed = len(completed_tasks)
-            total = completed + len(incomplete_tasks)
-            
-            return {'completed': completed, 'total': total}
-        except Exception:
-            return {'completed': 0, 'total': 0}
-
+        progress = load_task_progress(Path(change_path))
+        return {'completed': progress.completed, 'total': progress.total}
 
 @click.command("list")
 @click.option("--type", "item_type", type=click.Choice(["changes", "specs", "all"]), default="changes", help="Type of items to list")
 @click.option("--archived", is_flag=True, help="Include archived items")
-def list_changes(item_type: str, archived: bool):
+@click.option("--since", type=click.DateTime(formats=["%Y-%m-%d"]), help="Only include changes archived on or after this date (YYYY-MM-DD); implies --archived")
+@click.option("--limit", type=click.IntRange(min=0), help="Only include the N most recently archived changes; implies --archived")
+def list_changes(item_type: str, archived: bool, since, limit):
     """List changes, specs, or all items in the project."""
     command = ListCommand()
-    command.execute(None, item_type, archived)
+    command.execute(None, item_type, archived, since.date().isoformat() if since else None, limit)
 
 
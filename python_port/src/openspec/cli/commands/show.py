@@ -2,6 +2,7 @@
 
 import click
 from rich.console import Console
+from typing import Optional
 
 from ...core.change_operations import show_change
 from ...utils.file_system import find_openspec_root
@@ -14,7 +15,10 @@ console = Console()
 @click.option("--type", "item_type", type=click.Choice(["change", "spec"]), help="Type of item to show")
 @click.option("--json", is_flag=True, help="Output as JSON")
 @click.option("--requirements", is_flag=True, help="Show only requirements (for specs)")
-def show(name: str, item_type: str, json: bool, requirements: bool):
+@click.option("--as-of", type=click.DateTime(formats=["%Y-%m-%d"]), help="Show a spec as it was at the end of this date (YYYY-MM-DD)")
+@click.option("--with-changes", help="Show a spec with these comma-separated changes applied, in order")
+@click.option("--with-all-active", is_flag=True, help="Show a spec with all active changes applied")
+def show(name: str, item_type: str, json: bool, requirements: bool, as_of, with_changes: str, with_all_active: bool):
     """Show details of a change or spec."""
     
     project_path = find_openspec_root()
@@ -31,6 +35,19 @@ def show(name: str, item_type: str, json: bool, requirements: bool):
         console.print("  openspec spec show")
         raise click.Abort()
     
+    if as_of is not None or with_changes or with_all_active:
+        if item_type == "change":
+            console.print("[red]Error: --as-of, --with-changes and --with-all-active only apply to specs.[/red]")
+            raise click.Abort()
+        if sum([as_of is not None, bool(with_changes), with_all_active]) > 1:
+            console.print("[red]Error: Use only one of --as-of, --with-changes and --with-all-active.[/red]")
+            raise click.Abort()
+        if as_of is not None:
+            _show_spec_as_of(project_path, name, as_of.date().isoformat(), json)
+        else:
+            _show_spec_with_changes(project_path, name, with_changes, json)
+        return
+    
     try:
         # Auto-detect type if not specified
         if not item_type:
@@ -72,6 +89,95 @@ def show(name: str, item_type: str, json: bool, requirements: bool):
         raise click.Abort()
 
 
+def _show_spec_as_of(project_path, name: str, day: str, json: bool):
+    """Show a spec as it was on a date, from text recorded in the archive where possible."""
+    from ...core.spec_history import SOURCE_CURRENT, SOURCE_RECORDED, spec_as_of
+    
+    snapshot = spec_as_of(project_path, name, day)
+    if snapshot.content is None:
+        console.print(f"[red]Error: Spec '{name}' did not exist on {day}.[/red]")
+        raise click.Abort()
+    
+    if json:
+        import json as json_lib
+        output = {
+            "id": name,
+            "asOf": day,
+            "source": snapshot.source,
+            "verified": snapshot.verified,
+            "requirements": _requirements_json(snapshot.content),
+        }
+        console.print(json_lib.dumps(output, indent=2))
+        return
+    
+    if snapshot.source == SOURCE_RECORDED:
+        console.print(f"[dim]As of {day}: text recorded when {snapshot.change} was archived[/dim]\n")
+    elif snapshot.source == SOURCE_CURRENT:
+        console.print(f"[dim]As of {day}: no archived change touched this spec since, showing the current spec[/dim]\n")
+    else:
+        console.print(f"[dim]As of {day}: replayed from archived changes that did not record earlier text[/dim]")
+        if not snapshot.verified:
+            console.print(
+                "[yellow]Warning: replaying the whole archive does not reproduce the current spec, "
+                "so this view may miss requirements or wording from before the archive history.[/yellow]"
+            )
+        console.print()
+    console.print(snapshot.content, markup=False)
+
+
+def _show_spec_with_changes(project_path, name: str, with_changes: Optional[str], json: bool):
+    """Show a spec with active changes applied in memory."""
+    from ...core.spec_overlay import SpecOverlay, active_changes
+    
+    available = active_changes(project_path)
+    if with_changes:
+        changes = [change.strip() for change in with_changes.split(",") if change.strip()]
+        unknown = [change for change in changes if change not in available]
+        if unknown:
+            console.print(f"[red]Error: Unknown active change(s): {', '.join(unknown)}[/red]")
+            raise click.Abort()
+    else:
+        changes = available
+    
+    overlay = SpecOverlay(project_path, changes)
+    content = overlay.read(name)
+    if content is None:
+        console.print(f"[red]Error: Spec '{name}' does not exist with these changes applied.[/red]")
+        raise click.Abort()
+    
+    if json:
+        import json as json_lib
+        output = {
+            "id": name,
+            "changes": changes,
+            "requirements": _requirements_json(content),
+            "conflicts": [conflict.to_dict() for conflict in overlay.conflicts],
+        }
+        console.print(json_lib.dumps(output, indent=2))
+        return
+    
+    console.print(f"[dim]Preview with {len(changes)} change(s) applied: {', '.join(changes) or 'none'}[/dim]\n")
+    console.print(content, markup=False)
+    if overlay.conflicts:
+        console.print(f"\n[yellow]Skipped {len(overlay.conflicts)} conflicting delta operation(s):[/yellow]")
+        for conflict in overlay.conflicts:
+            console.print(f"  • [{conflict.change}] {conflict.message}", markup=False)
+
+
+def _requirements_json(content: str):
+    """Requirement titles, descriptions and scenario titles of a spec."""
+    from ...core.parsers.markdown_parser import MarkdownParser
+    
+    return [
+        {
+            "title": req["title"],
+            "description": req["description"],
+            "scenarios": [scenario["title"] for scenario in req["scenarios"]],
+        }
+        for req in MarkdownParser().parse_spec(content)["requirements"]
+    ]
+
+
 def _display_change_info(change_info):
     """Display change information."""
     
@@ -112,11 +218,19 @@ def _display_change_info(change_info):
 def _detect_item_type(project_path: str, name: str) -> str:
     """Auto-detect whether an item is a change or spec."""
     from pathlib import Path
+    from ...core.archive_index import ArchiveIndex
+    from ...core.archive_layout import locate_archived
+    from ...core.archive_pack import PackStore
     
     changes_dir = Path(project_path) / "openspec" / "changes"
     specs_dir = Path(project_path) / "openspec" / "specs"
     
-    has_change = (changes_dir / name).exists()
+    has_change = (
+        (changes_dir / name).exists()
+        or locate_archived(changes_dir / "archive", name) is not None
+        or PackStore(changes_dir / "archive").has_change(name)
+        or ArchiveIndex.load(changes_dir / "archive").lookup(name) is not None
+    )
     has_spec = (specs_dir / name).exists()
     
     if has_change and has_spec:
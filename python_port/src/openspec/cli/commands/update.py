@@ -1,33 +1,144 @@
 """Update command for OpenSpec CLI."""
 
 import click
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from rich.console import Console
+from rich.table import Table
+from typing import List, Optional
 
+from ...core.config import AI_TOOLS
+from ...core.configurators.runner import configure_tools
+from ...core.manifest import check_manifest, record_manifest
 from ...core.templates.agents_template import create_agents_openspec_template
-from ...utils.file_system import find_openspec_root, write_file, ensure_directory
+from ...utils.file_system import find_openspec_root, write_file, ensure_directory, track_writes, WriteReport
+from ...utils.project_discovery import find_openspec_roots
 from pathlib import Path
 
 console = Console()
 
+# Projects refreshed at once by --recursive; each one fans out further
+RECURSIVE_WORKERS = 4
+
+
+@dataclass
+class ProjectUpdate:
+    """Result of refreshing one project's files."""
+    project_path: Path
+    report: WriteReport = field(default_factory=WriteReport)
+    warnings: List[str] = field(default_factory=list)
+    error: Optional[Exception] = None
+
 
 @click.command()
-@click.option("--agents", is_flag=True, help="Update AGENTS.md files")
-def update(agents: bool):
+@click.argument("root", required=False)
+@click.option("--agents", is_flag=True, help="Only update AGENTS.md files")
+@click.option("--recursive", "-r", is_flag=True, help="Update every OpenSpec project below ROOT (default: current directory)")
+@click.option("--check", is_flag=True, help="Only verify generated files against the manifest; exit non-zero on drift")
+def update(root: Optional[str], agents: bool, recursive: bool, check: bool):
     """Update OpenSpec project files."""
     
-    project_path = find_openspec_root()
+    if recursive:
+        if check:
+            _check_projects(find_openspec_roots(root or "."))
+        else:
+            _update_recursive(root or ".", agents)
+        return
+    
+    project_path = find_openspec_root(root)
     if not project_path:
         console.print("[red]Error: Not in an OpenSpec project directory.[/red]")
         raise click.Abort()
     
+    if check:
+        _check_projects([project_path])
+        return
+    
+    result = update_project(project_path, agents)
+    if result.error:
+        console.print(f"[red]Error updating project: {result.error}[/red]")
+        raise click.Abort()
+    
+    for path in result.report.written:
+        console.print(f"[green]✓[/green] Updated: {path}")
+    for warning in result.warnings:
+        console.print(f"[yellow]Warning: {warning}[/yellow]")
+    console.print(f"[dim]{result.report.summary()}[/dim]")
+
+
+def update_project(project_path: Path, agents_only: bool = False) -> ProjectUpdate:
+    """Refresh AGENTS.md and, unless ``agents_only``, existing tool files of one project."""
+    
+    result = ProjectUpdate(project_path)
     try:
-        if agents:
+        with track_writes() as report:
             _update_agents_files(project_path)
-        else:
-            console.print("[yellow]No update options specified. Use --agents to update AGENTS.md files.[/yellow]")
-        
+            if not agents_only:
+                result.warnings.extend(_update_tool_files(project_path))
+        result.report = report
+        record_manifest(project_path, report.written + report.skipped)
     except Exception as e:
-        console.print(f"[red]Error updating project: {e}[/red]")
+        result.error = e
+    return result
+
+
+def _update_recursive(root: str, agents_only: bool):
+    """Update every OpenSpec project below ``root`` with a worker pool."""
+    
+    projects = find_openspec_roots(root)
+    if not projects:
+        console.print(f"[yellow]No OpenSpec projects found below {root}.[/yellow]")
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(RECURSIVE_WORKERS, len(projects))) as executor:
+        results = list(executor.map(lambda path: update_project(path, agents_only), projects))
+    
+    base = Path(root).resolve()
+    table = Table(title=f"Updated {len(projects)} project(s)")
+    table.add_column("Project", style="cyan")
+    table.add_column("Written", style="green")
+    table.add_column("Unchanged", style="dim")
+    table.add_column("Status")
+    
+    for result in results:
+        try:
+            name = str(result.project_path.relative_to(base)) or "."
+        except ValueError:
+            name = str(result.project_path)
+        if result.error:
+            status = f"[red]✗ {result.error}[/red]"
+        elif result.warnings:
+            status = f"[yellow]{len(result.warnings)} warning(s)[/yellow]"
+        else:
+            status = "[green]✓[/green]"
+        table.add_row(name, str(len(result.report.written)), str(len(result.report.skipped)), status)
+    
+    console.print(table)
+    
+    for result in results:
+        for warning in result.warnings:
+            console.print(f"[yellow]Warning ({result.project_path}): {warning}[/yellow]")
+    
+    if any(result.error for result in results):
+        raise click.Abort()
+
+
+def _check_projects(projects: List[Path]):
+    """Report manifest drift of each project and abort if there is any."""
+    
+    drifted = False
+    for project_path in projects:
+        result = check_manifest(project_path)
+        if result.ok:
+            console.print(f"[green]✓[/green] {project_path}: {result.checked} generated file(s) up to date")
+            continue
+        drifted = True
+        console.print(f"[red]✗[/red] {project_path}: {len(result.drift)} file(s) drifted")
+        for item in result.drift:
+            console.print(f"  [yellow]{item.path}[/yellow]: {item.reason}")
+    
+    if drifted:
+        console.print("[dim]Run 'openspec update' to regenerate them.[/dim]")
         raise click.Abort()
 
 
@@ -42,9 +153,17 @@ def _update_agents_files(project_path: Path):
     agents_path = openspec_dir / "AGENTS.md"
     
     write_file(str(agents_path), agents_content)
-    console.print(f"[green]✓[/green] Updated: {agents_path}")
     
-    # TODO: Update root AGENTS.md with OpenSpec markers
-    # This would require parsing existing content and updating the OpenSpec section
+    # The root AGENTS.md block is refreshed by the "agents" tool configurator
+
+
+def _update_tool_files(project_path: Path) -> List[str]:
+    """Refresh the OpenSpec blocks of tool files that already exist. Returns warnings."""
+    
+    tool_ids = [tool.value for tool in AI_TOOLS if tool.available]
+    results = configure_tools(str(project_path), str(project_path / "openspec"), tool_ids, update_only=True)
     
-    console.print("[green]✓[/green] Updated AGENTS.md files")
\ No newline at end of file
+    return [
+        f"Could not update {result.tool_id} ({result.error})"
+        for result in results if not result.ok
+    ]
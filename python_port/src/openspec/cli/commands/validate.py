@@ -6,6 +6,7 @@ from rich.console import Console
 from rich.table import Table
 from typing import List, Optional
 
+from ...core.spec_sources import SpecSourceError, changed_since
 from ...core.validation import validate_project, ValidationResult
 from ...utils.file_system import find_openspec_root
 
@@ -20,8 +21,9 @@ console = Console()
 @click.option("--enriched", is_flag=True, help="Show enriched validation output")
 @click.option("--json", is_flag=True, help="Output as JSON")
 @click.option("--concurrency", type=int, default=4, help="Number of concurrent validations")
+@click.option("--since", metavar="REV", help="Only validate changes and specs that differ from a git revision")
 @click.argument("items", nargs=-1)
-def validate(all: bool, changes: bool, specs: bool, scope: Optional[str], enriched: bool, json: bool, concurrency: int, items: tuple):
+def validate(all: bool, changes: bool, specs: bool, scope: Optional[str], enriched: bool, json: bool, concurrency: int, since: Optional[str], items: tuple):
     """Validate OpenSpec project files."""
     
     # Find project root
@@ -31,14 +33,23 @@ def validate(all: bool, changes: bool, specs: bool, scope: Optional[str], enrich
         raise click.Abort()
     
     # Check if no validation scope specified
-    if not any([all, changes, specs, scope, items]):
+    if not any([all, changes, specs, scope, items, since]):
         console.print("Nothing to validate. Try one of:")
         console.print("  openspec validate --all")
         console.print("  openspec validate --changes") 
         console.print("  openspec validate --specs")
         console.print("  openspec validate <item>")
+        console.print("  openspec validate --since main")
         raise click.Abort()
     
+    changed = None
+    if since:
+        try:
+            changed = changed_since(project_path, since)
+        except SpecSourceError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise click.Abort()
+    
     try:
         # Determine what to validate based on flags
         if all:
@@ -64,10 +75,18 @@ def validate(all: bool, changes: bool, specs: bool, scope: Optional[str], enrich
                     raise click.Abort()
         
         # Run validation
-        results = validate_project(str(project_path), scope=scope)
+        results = validate_project(
+            str(project_path),
+            scope=scope,
+            change_names=changed.changes if changed else None,
+            spec_names=changed.specs if changed else None,
+        )
         
         if not results:
-            console.print("[green]✓ No files found to validate.[/green]")
+            if changed is not None:
+                console.print(f"[green]✓ Nothing changed since {since}.[/green]")
+            else:
+                console.print("[green]✓ No files found to validate.[/green]")
             return
         
         # Display results
@@ -89,7 +108,8 @@ def validate(all: bool, changes: bool, specs: bool, scope: Optional[str], enrich
                         "path": r.file_path,
                         "type": r.file_type,
                         "valid": r.is_valid,
-                        "errors": r.errors or []
+                        "errors": r.errors or [],
+                        "issues": [issue.to_dict() for issue in r.issues]
                     }
                     for r in results
                 ]
@@ -4,12 +4,17 @@ import click
 from rich.console import Console
 from rich.table import Table
 
+from ...core.archive_index import ArchiveIndex
 from ...core.change_operations import list_changes
 from ...utils.file_system import find_openspec_root, list_directories
+from ...utils.task_progress import load_task_progress
 from pathlib import Path
 
 console = Console()
 
+# Archived changes listed by the dashboard, newest first
+ARCHIVED_SHOWN = 5
+
 
 @click.command()
 @click.option("--format", "output_format", type=click.Choice(["table", "list"]), default="table", help="Output format")
@@ -24,22 +29,26 @@ def view(output_format: str):
     try:
         console.print("[bold]OpenSpec Project Dashboard[/bold]\n")
         
-        # Show changes
-        changes = list_changes(str(project_path))
+        # Show changes; only the newest archives are listed, the total comes from the archive index
+        changes = list_changes(str(project_path), archived_limit=ARCHIVED_SHOWN)
         active_changes = [c for c in changes if not c["is_archived"]]
-        archived_changes = [c for c in changes if c["is_archived"]]
+        archived_changes = sorted(
+            (c for c in changes if c["is_archived"]), key=lambda c: c["name"], reverse=True
+        )
+        archived_total = len(ArchiveIndex.load(Path(project_path) / "openspec" / "changes" / "archive").entries)
+        archived_total = max(archived_total, len(archived_changes))
         
         if output_format == "table":
-            _display_table_format(active_changes, archived_changes, project_path)
+            _display_table_format(active_changes, archived_total, project_path)
         else:
-            _display_list_format(active_changes, archived_changes, project_path)
+            _display_list_format(active_changes, archived_changes, archived_total, project_path)
         
     except Exception as e:
         console.print(f"[red]Error viewing project: {e}[/red]")
         raise click.Abort()
 
 
-def _display_table_format(active_changes, archived_changes, project_path):
+def _display_table_format(active_changes, archived_total, project_path):
     """Display dashboard in table format."""
     
     # Active changes table
@@ -47,9 +56,10 @@ def _display_table_format(active_changes, archived_changes, project_path):
         table = Table(title="Active Changes")
         table.add_column("Name", style="cyan")
         table.add_column("Status", style="green")
+        table.add_column("Tasks", justify="right")
         
         for change in active_changes:
-            table.add_row(change["name"], "🔄 Active")
+            table.add_row(change["name"], "🔄 Active", _task_summary(load_task_progress(Path(change["path"]))))
         
         console.print(table)
     else:
@@ -76,28 +86,32 @@ def _display_table_format(active_changes, archived_changes, project_path):
     # Summary
     console.print(f"\n[bold]Summary:[/bold]")
     console.print(f"  Active changes: {len(active_changes)}")
-    console.print(f"  Archived changes: {len(archived_changes)}")
+    console.print(f"  Archived changes: {archived_total}")
     
     specs_count = len(list_directories(str(specs_dir))) if specs_dir.exists() else 0
     console.print(f"  Specifications: {specs_count}")
 
 
-def _display_list_format(active_changes, archived_changes, project_path):
+def _display_list_format(active_changes, archived_changes, archived_total, project_path):
     """Display dashboard in list format."""
     
     console.print("[bold]Active Changes:[/bold]")
     if active_changes:
         for change in active_changes:
-            console.print(f"  🔄 {change['name']}")
+            progress = load_task_progress(Path(change["path"]))
+            console.print(f"  🔄 {change['name']} [dim]{_task_summary(progress)}[/dim]")
+            for section in progress.sections:
+                if section.title:
+                    console.print(f"      {section.title}: {section.completed}/{section.total} ({section.percent}%)")
     else:
         console.print("  [dim]None[/dim]")
     
     console.print(f"\n[bold]Archived Changes:[/bold]")
     if archived_changes:
-        for change in archived_changes[:5]:  # Show first 5
+        for change in archived_changes:  # Newest ARCHIVED_SHOWN
             console.print(f"  📁 {change['name']}")
-        if len(archived_changes) > 5:
-            console.print(f"  [dim]... and {len(archived_changes) - 5} more[/dim]")
+        if archived_total > len(archived_changes):
+            console.print(f"  [dim]... and {archived_total - len(archived_changes)} more[/dim]")
     else:
         console.print("  [dim]None[/dim]")
     
@@ -111,4 +125,11 @@ def _display_list_format(active_changes, archived_changes, project_path):
         else:
             console.print("  [dim]None[/dim]")
     else:
-        console.print("  [dim]None[/dim]")
\ No newline at end of file
+        console.print("  [dim]None[/dim]")
+
+
+def _task_summary(progress) -> str:
+    """Completed/total tasks with a percentage, e.g. "3/5 (60%)"."""
+    if not progress.total:
+        return "No tasks"
+    return f"{progress.completed}/{progress.total} ({progress.percent}%)"
@@ -3,7 +3,7 @@
 import click
 from rich.console import Console
 
-from .commands import change, init, show, spec, validate, view, archive, update, list_cmd
+from .commands import change, init, show, spec, validate, view, archive, update, list_cmd, diff, blame
 
 console = Console()
 
@@ -26,6 +26,8 @@ main.add_command(view.view)
 main.add_command(archive.archive)
 main.add_command(update.update)
 main.add_command(list_cmd.list_changes)
+main.add_command(diff.diff)
+main.add_command(blame.blame)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,14 @@
 """Core OpenSpec functionality."""
 
 from .config import *  # noqa: F403, F401
-from .schemas import *  # noqa: F403, F401
+from . import schemas
 
-__all__ = ["config", "schemas"]
\ No newline at end of file
+__all__ = ["config", "schemas"]
+
+
+def __getattr__(name):
+    # Schema classes stay reachable as ``openspec.core.<Name>`` without
+    # importing pydantic up front.
+    if name in schemas.__all__:
+        return getattr(schemas, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,231 @@
+"""Index of archived changes by original change ID.
+
+Archived changes live in ``archive/YYYY-MM-DD-<id>`` directories (or in the
+archive pack). ``changes/.archive-index.json``, next to ``archive/``, maps
+each original ID to its dated directory, archive timestamp and touched
+specs, so lookups by ID or by date do not have to scan the archive.
+``archive_change`` records every archive and ``archive --reindex`` rebuilds
+the file from disk. Read-only commands never write it; without the file
+they scan the archive in memory.
+"""
+
+import bisect
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .archive_layout import iter_archived, locate_archived
+from .archive_pack import PackStore
+from ..utils.file_system import list_directories, read_file, write_file
+
+# Kept next to archive/ rather than in it, so the archive holds only changes
+INDEX_FILE_NAME = ".archive-index.json"
+INDEX_VERSION = 1
+
+# archive --all archives changes from several threads at once; reentrant
+# because a load inside the lock may rebuild and save the index
+_index_lock = threading.RLock()
+
+
+@dataclass
+class ArchiveEntry:
+    """One archived change."""
+    change_id: str
+    directory: str
+    archived_at: str  # ISO date or timestamp
+    specs: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.change_id,
+            "directory": self.directory,
+            "archivedAt": self.archived_at,
+            "specs": self.specs,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ArchiveEntry":
+        return cls(data["id"], data["directory"], data["archivedAt"], list(data.get("specs", [])))
+
+
+class ArchiveIndex:
+    """Archived changes sorted by archive time, with lookups by ID and date."""
+
+    def __init__(self, archive_dir: Path, entries: List[ArchiveEntry]):
+        self.archive_dir = Path(archive_dir)
+        self.entries = sorted(entries, key=_sort_key)
+        self._days = [_sort_key(entry)[0] for entry in self.entries]
+        self._by_id: Dict[str, List[ArchiveEntry]] = {}
+        self._by_directory = {entry.directory: entry for entry in self.entries}
+        for entry in self.entries:
+            self._by_id.setdefault(entry.change_id, []).append(entry)
+
+    @classmethod
+    def load(cls, archive_dir: Path) -> "ArchiveIndex":
+        """Read the index, scanning the archive if it is missing or unreadable.
+        
+        The scan is not saved; only archiving and ``rebuild_archive_index``
+        write the index file.
+        """
+        entries = _read_entries(archive_dir)
+        if entries is None:
+            return rebuild_archive_index(archive_dir, save=False)
+        return cls(archive_dir, entries)
+
+    def lookup(self, change_id: str) -> Optional[ArchiveEntry]:
+        """The most recent archive of a change, by original ID or dated directory name."""
+        entries = self._by_id.get(change_id)
+        if entries:
+            return entries[-1]
+        return self._by_directory.get(change_id)
+
+    def since(self, day: str) -> List[ArchiveEntry]:
+        """Entries archived on or after an ISO date (``YYYY-MM-DD``)."""
+        return self.entries[bisect.bisect_left(self._days, day[:10]):]
+
+    def until(self, day: str) -> List[ArchiveEntry]:
+        """Entries archived on or before an ISO date (``YYYY-MM-DD``), oldest first."""
+        return self.entries[:bisect.bisect_right(self._days, day[:10])]
+
+    def touching(self, spec_name: str) -> List[ArchiveEntry]:
+        """Entries whose change had a delta for ``spec_name``, oldest first."""
+        return [entry for entry in self.entries if spec_name in entry.specs]
+
+    def save(self) -> None:
+        write_file(str(index_path(self.archive_dir)), json.dumps({
+            "version": INDEX_VERSION,
+            "entries": [entry.to_dict() for entry in self.entries],
+        }, indent=2) + "\n")
+
+
+def index_path(archive_dir: Path) -> Path:
+    """Location of the index for an archive directory."""
+    return Path(archive_dir).parent / INDEX_FILE_NAME
+
+
+def record_archive(archive_dir: Path, change_id: str, archived_path: Path) -> ArchiveEntry:
+    """Add a freshly archived change to the index."""
+    entry = ArchiveEntry(
+        change_id,
+        archived_path.name,
+        datetime.now().isoformat(timespec="microseconds"),
+        _specs_in_directory(archived_path),
+    )
+    with _index_lock:
+        entries = _read_entries(archive_dir)
+        if entries is None:
+            # Seed a missing index from the archive; the scan already holds
+            # the new directory, but without the time it was archived at
+            entries = [
+                scanned for scanned in rebuild_archive_index(archive_dir, save=False).entries
+                if scanned.directory != entry.directory
+            ]
+        recorded = next((known for known in entries if known.directory == entry.directory), None)
+        if recorded is None:
+            entries.append(entry)
+        else:
+            entry = recorded
+        ArchiveIndex(archive_dir, entries).save()
+    return entry
+
+
+def read_archived_deltas(archive_dir: Path, entry: ArchiveEntry, store: Optional[PackStore] = None) -> Dict[str, str]:
+    """The delta spec of every spec an archived change touched, from disk or the pack."""
+    store = store or PackStore(archive_dir)
+    deltas = {}
+    for spec_name in entry.specs:
+        content = read_archived_file(archive_dir, entry, f"specs/{spec_name}/spec.md", store)
+        if content is not None:
+            deltas[spec_name] = content
+    return deltas
+
+
+def read_archived_file(
+    archive_dir: Path, entry: ArchiveEntry, relative: str, store: Optional[PackStore] = None
+) -> Optional[str]:
+    """A file of an archived change, from disk or the pack, or None if it has none."""
+    change_path = locate_archived(archive_dir, entry.directory)
+    if change_path is not None:
+        path = change_path / relative
+        return read_file(str(path)) if path.is_file() else None
+    store = store or PackStore(archive_dir)
+    if relative in store.files(entry.directory):
+        return store.read_text(entry.directory, relative)
+    return None
+
+
+def rebuild_archive_index(archive_dir: Path, save: bool = True) -> ArchiveIndex:
+    """Rebuild the index from the archive, in either layout, and the archive pack.
+    
+    Archive timestamps still readable from the old index are kept, so
+    changes archived on the same day stay in the order they were applied.
+    """
+    archive_dir = Path(archive_dir)
+    entries = []
+    timestamps = {entry.directory: entry.archived_at for entry in _read_entries(archive_dir) or []}
+
+    if archive_dir.exists():
+        store = PackStore(archive_dir)
+        for archived in iter_archived(archive_dir):
+            if archived.packed:
+                specs = sorted({
+                    path.split("/")[1] for path in store.files(archived.name)
+                    if path.startswith("specs/") and path.endswith("/spec.md") and path.count("/") == 2
+                })
+            else:
+                specs = _specs_in_directory(archived.path)
+            entry = _entry_from_name(archived.name, specs)
+            entry.archived_at = timestamps.get(entry.directory, entry.archived_at)
+            entries.append(entry)
+
+    index = ArchiveIndex(archive_dir, entries)
+    if save and archive_dir.exists():
+        with _index_lock:
+            index.save()
+    return index
+
+
+def _read_entries(archive_dir: Path) -> Optional[List[ArchiveEntry]]:
+    """Entries of the index file, or None if it is missing or unreadable."""
+    try:
+        data = json.loads(index_path(archive_dir).read_text(encoding="utf-8"))
+        return [ArchiveEntry.from_dict(item) for item in data["entries"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _entry_from_name(directory: str, specs: List[str]) -> ArchiveEntry:
+    """Reconstruct an entry from a ``YYYY-MM-DD-<id>`` directory name."""
+    archived_at = _date_prefix(directory)
+    change_id = directory[11:] if archived_at else directory
+    return ArchiveEntry(change_id, directory, archived_at, specs)
+
+
+def _date_prefix(name: str) -> str:
+    """The ``YYYY-MM-DD`` prefix of an archive name, or "" if it has none."""
+    try:
+        datetime.strptime(name[:10], "%Y-%m-%d")
+    except ValueError:
+        return ""
+    return name[:10] if name[10:11] == "-" else ""
+
+
+def _specs_in_directory(change_path: Path) -> List[str]:
+    specs_dir = change_path / "specs"
+    return sorted(
+        spec_name for spec_name in list_directories(str(specs_dir))
+        if (specs_dir / spec_name / "spec.md").exists()
+    )
+
+
+def _sort_key(entry: ArchiveEntry):
+    # By archive day, then by the recorded time of day so same-day archives
+    # keep the order they were applied in, then directory. The dated
+    # directory name is authoritative for the day; entries rebuilt from
+    # names alone have no time and sort first within their day.
+    day = _date_prefix(entry.directory) or entry.archived_at[:10]
+    time = entry.archived_at[10:] if entry.archived_at.startswith(day) else ""
+    return (day, time, entry.directory)
@@ -0,0 +1,209 @@
+"""Write-ahead journal that makes archiving a change crash-safe.
+
+Archiving rewrites several main specs and then moves the change directory.
+To make that all-or-nothing, the new spec contents are first staged as temp
+files next to their targets and a journal is written to
+``changes/.journal/<change>.json``:
+
+1. The journal is written in the ``prepared`` state, listing the temp files.
+2. All temp files are written, then flushed to disk in one batch.
+3. The journal is switched to ``committed`` and synced. This is the commit
+   point.
+4. Temp files are renamed over their targets, the change directory is moved
+   to the archive, and each touched directory is synced once.
+5. The journal is deleted, and ``changes/.journal/`` with it once empty.
+
+After a crash, ``recover_archives`` rolls committed journals forward and
+rolls prepared ones back by deleting their temp files.
+"""
+
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+from ..utils.file_system import ensure_directory
+
+JOURNAL_DIR_NAME = ".journal"
+JOURNAL_VERSION = 1
+STATE_PREPARED = "prepared"
+STATE_COMMITTED = "committed"
+
+# archive --all runs transactions on several threads; creating the journal
+# directory and removing it when empty must not interleave
+_journal_dir_lock = threading.Lock()
+
+
+class ArchiveTransaction:
+    """Atomically apply staged spec writes and move a change to the archive."""
+
+    def __init__(self, changes_dir: Path, change_name: str, source: Path, destination: Path):
+        self.changes_dir = Path(changes_dir)
+        self.change_name = change_name
+        self.source = Path(source)
+        self.destination = Path(destination)
+        self.journal_path = journal_path(self.changes_dir, change_name)
+        self._token = uuid.uuid4().hex[:8]
+
+    def run(self, writes: Sequence[Tuple[Path, str]]) -> None:
+        """Stage ``(target, content)`` writes, commit, then apply them."""
+        entries = [
+            {"target": str(target), "temp": str(self._temp_path(Path(target)))}
+            for target, _ in writes
+        ]
+        journal = {
+            "version": JOURNAL_VERSION,
+            "change": self.change_name,
+            "state": STATE_PREPARED,
+            "source": str(self.source),
+            "destination": str(self.destination),
+            "writes": entries,
+        }
+
+        with _journal_dir_lock:
+            ensure_directory(str(self.journal_path.parent))
+            _write_durable(self.journal_path, json.dumps(journal, indent=2))
+
+        try:
+            _stage_files([(Path(e["temp"]), content) for e, (_, content) in zip(entries, writes)])
+        except BaseException:
+            roll_back(journal)
+            _remove_journal(self.journal_path)
+            raise
+
+        journal["state"] = STATE_COMMITTED
+        _write_durable(self.journal_path, json.dumps(journal, indent=2))
+        roll_forward(journal)
+        _remove_journal(self.journal_path)
+        journal_dir = self.journal_path.parent
+        _fsync_directory(journal_dir if journal_dir.exists() else journal_dir.parent)
+
+    def _temp_path(self, target: Path) -> Path:
+        return target.parent / f".{target.name}.{self._token}.archive-tmp"
+
+
+def journal_path(changes_dir: Path, change_name: str) -> Path:
+    """Return the journal file for a change."""
+    return Path(changes_dir) / JOURNAL_DIR_NAME / f"{change_name}.json"
+
+
+def pending_journals(changes_dir: Path) -> List[Path]:
+    """List journals left behind by interrupted archives."""
+    journal_dir = Path(changes_dir) / JOURNAL_DIR_NAME
+    if not journal_dir.is_dir():
+        return []
+    return sorted(journal_dir.glob("*.json"))
+
+
+def roll_forward(journal: Dict[str, Any]) -> None:
+    """Finish a committed archive. Safe to repeat after a crash."""
+    touched_dirs = []
+    for entry in journal["writes"]:
+        temp = Path(entry["temp"])
+        if temp.exists():
+            os.replace(temp, entry["target"])
+            touched_dirs.append(temp.parent)
+
+    source = Path(journal["source"])
+    destination = Path(journal["destination"])
+    if source.exists() and not destination.exists():
+        ensure_directory(str(destination.parent))
+        os.replace(source, destination)
+        touched_dirs.extend([source.parent, destination.parent])
+
+    for directory in dict.fromkeys(touched_dirs):
+        _fsync_directory(directory)
+
+
+def roll_back(journal: Dict[str, Any]) -> None:
+    """Discard the staged files of an archive that never committed."""
+    for entry in journal["writes"]:
+        temp = Path(entry["temp"])
+        if temp.exists():
+            temp.unlink()
+
+
+def recover_archives(changes_dir: Path) -> List[Dict[str, str]]:
+    """Complete or undo every interrupted archive.
+
+    Returns one ``{"change", "action"}`` dict per journal, where action is
+    ``completed`` or ``rolled back``.
+    """
+    recovered = []
+    for path in pending_journals(changes_dir):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                journal = json.load(f)
+        except ValueError:
+            # A torn journal was never committed, and its temp files are unknown
+            _remove_journal(path)
+            recovered.append({"change": path.stem, "action": "rolled back"})
+            continue
+
+        if journal.get("state") == STATE_COMMITTED:
+            roll_forward(journal)
+            action = "completed"
+        else:
+            roll_back(journal)
+            action = "rolled back"
+        _remove_journal(path)
+        recovered.append({"change": journal.get("change", path.stem), "action": action})
+
+    return recovered
+
+
+def _remove_journal(path: Path) -> None:
+    """Delete a journal, and the journal directory if no other archive is pending."""
+    with _journal_dir_lock:
+        path.unlink()
+        try:
+            path.parent.rmdir()
+        except OSError:
+            pass  # Another archive's journal is still there
+
+
+def _stage_files(files: Sequence[Tuple[Path, str]]) -> None:
+    """Write temp files, then flush them all to disk in one batch."""
+    handles = []
+    try:
+        for temp, content in files:
+            ensure_directory(str(temp.parent))
+            f = open(temp, "w", encoding="utf-8")
+            handles.append(f)
+            f.write(content)
+        for f in handles:
+            f.flush()
+        for f in handles:
+            os.fsync(f.fileno())
+    finally:
+        for f in handles:
+            f.close()
+
+
+def _write_durable(path: Path, content: str) -> None:
+    """Atomically replace a small file and sync it."""
+    temp = path.with_name(f".{path.name}.tmp")
+    with open(temp, "w", encoding="utf-8") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, path)
+    _fsync_directory(path.parent)
+
+
+def _fsync_directory(path: Path) -> None:
+    """Sync a directory entry so renames inside it survive a crash."""
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,124 @@
+"""Flat and date-partitioned layouts of the change archive.
+
+Archived changes are named ``YYYY-MM-DD-<id>``. In the flat layout they sit
+directly in ``changes/archive/``; in the partitioned layout they live in
+``changes/archive/YYYY/MM/``, so no directory grows without bound. A
+project uses the partitioned layout once its archive has a year partition
+(e.g. after ``archive --partition``). The lister below understands both,
+plus the archive pack, and yields the newest changes first without
+enumerating older partitions.
+"""
+
+import heapq
+import re
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from .archive_pack import PackStore
+from ..utils.file_system import list_directories
+
+_YEAR_PATTERN = re.compile(r"^\d{4}$")
+_MONTH_PATTERN = re.compile(r"^(0[1-9]|1[0-2])$")
+_DATED_NAME_PATTERN = re.compile(r"^(\d{4})-(\d{2})-\d{2}-")
+
+
+@dataclass
+class ArchivedChange:
+    """An archived change and where it is stored."""
+    name: str
+    path: Path
+    packed: bool = False
+
+
+def is_partitioned(archive_dir: Path) -> bool:
+    """Whether the archive uses ``YYYY/MM`` partitions."""
+    return any(_YEAR_PATTERN.match(name) for name in list_directories(str(archive_dir)))
+
+
+def partition_path(archive_dir: Path, name: str) -> Optional[Path]:
+    """Where ``name`` lives in the partitioned layout, or None if it has no date."""
+    match = _DATED_NAME_PATTERN.match(name)
+    if not match:
+        return None
+    return Path(archive_dir) / match.group(1) / match.group(2) / name
+
+
+def archive_destination(archive_dir: Path, name: str) -> Path:
+    """Where a change being archived as ``name`` should go."""
+    partitioned = partition_path(archive_dir, name)
+    if partitioned is not None and is_partitioned(archive_dir):
+        return partitioned
+    return Path(archive_dir) / name
+
+
+def locate_archived(archive_dir: Path, name: str) -> Optional[Path]:
+    """The directory of an archived change in either layout, or None."""
+    for candidate in (Path(archive_dir) / name, partition_path(archive_dir, name)):
+        if candidate is not None and candidate.is_dir() and not _YEAR_PATTERN.match(name):
+            return candidate
+    return None
+
+
+def iter_archived(archive_dir: Path, include_packed: bool = True) -> Iterator[ArchivedChange]:
+    """Yield archived changes newest first.
+
+    Partitions are opened one month at a time as the iterator advances, so
+    taking the first N only lists the newest partitions. Changes still in
+    the flat layout and packed changes are merged in by name.
+    """
+    archive_dir = Path(archive_dir)
+    if not archive_dir.exists():
+        return iter(())
+
+    flat = []
+    years = []
+    for name in list_directories(str(archive_dir)):
+        if _YEAR_PATTERN.match(name):
+            years.append(name)
+        else:
+            flat.append(ArchivedChange(name, archive_dir / name))
+
+    sources = [
+        _iter_partitions(archive_dir, sorted(years, reverse=True)),
+        iter(sorted(flat, key=lambda change: change.name, reverse=True)),
+    ]
+    if include_packed:
+        packed = PackStore(archive_dir).changes()
+        sources.append(ArchivedChange(name, archive_dir / name, packed=True) for name in reversed(packed))
+
+    return heapq.merge(*sources, key=lambda change: change.name, reverse=True)
+
+
+def list_archived(archive_dir: Path, limit: Optional[int] = None, include_packed: bool = True) -> List[ArchivedChange]:
+    """The newest ``limit`` archived changes (all of them if None), newest first."""
+    return list(islice(iter_archived(archive_dir, include_packed), limit))
+
+
+def migrate_to_partitions(archive_dir: Path) -> List[str]:
+    """Move flat archive directories into ``YYYY/MM`` partitions.
+
+    Names without a date prefix stay where they are. Returns the names moved.
+    """
+    moved = []
+    for name in sorted(list_directories(str(archive_dir))):
+        destination = partition_path(archive_dir, name)
+        if destination is None or _YEAR_PATTERN.match(name):
+            continue
+        if destination.exists():
+            raise FileExistsError(f"Archive '{name}' already exists in partition {destination.parent}")
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        (Path(archive_dir) / name).rename(destination)
+        moved.append(name)
+    return moved
+
+
+def _iter_partitions(archive_dir: Path, years: List[str]) -> Iterator[ArchivedChange]:
+    """Walk year and month partitions newest first, listing each only when reached."""
+    for year in years:
+        months = [m for m in list_directories(str(archive_dir / year)) if _MONTH_PATTERN.match(m)]
+        for month in sorted(months, reverse=True):
+            partition = archive_dir / year / month
+            for name in sorted(list_directories(str(partition)), reverse=True):
+                yield ArchivedChange(name, partition / name)
@@ -0,0 +1,181 @@
+"""Content-addressed pack store for archived changes.
+
+Old archive directories can be folded into ``changes/archive/.pack/``:
+
+* ``archive.pack`` is append-only; every distinct file content is stored
+  once as a zlib-compressed blob.
+* ``archive.idx`` is a JSON index with the blobs sorted by SHA-256
+  (offset and length in the pack) and each packed change's files.
+
+Blobs are appended and flushed to disk before the index is replaced, and
+directories are only removed once the new index is in place, so a crash
+leaves at most unreferenced bytes at the end of the pack.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import zlib
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ..utils.file_system import write_file
+
+PACK_DIR_NAME = ".pack"
+PACK_FILE_NAME = "archive.pack"
+INDEX_FILE_NAME = "archive.idx"
+PACK_MAGIC = b"OSPACK1\n"
+INDEX_VERSION = 1
+
+
+@dataclass
+class PackResult:
+    """What a pack run folded into the store."""
+    packed: List[str] = field(default_factory=list)
+    files: int = 0
+    blobs_added: int = 0
+    deduplicated: int = 0
+    bytes_added: int = 0
+
+
+class PackStore:
+    """Read and append to the archive pack of one project."""
+
+    def __init__(self, archive_dir: Path):
+        self.archive_dir = Path(archive_dir)
+        self.pack_dir = self.archive_dir / PACK_DIR_NAME
+        self.pack_path = self.pack_dir / PACK_FILE_NAME
+        self.index_path = self.pack_dir / INDEX_FILE_NAME
+        self._blobs: Dict[str, List[int]] = {}
+        self._changes: Dict[str, Dict[str, str]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Read the index; a store without one is empty."""
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        self._blobs = data.get("blobs", {})
+        self._changes = {name: entry["files"] for name, entry in data.get("changes", {}).items()}
+
+    def changes(self) -> List[str]:
+        """Names of the packed changes, sorted."""
+        return sorted(self._changes)
+
+    def has_change(self, name: str) -> bool:
+        return name in self._changes
+
+    def files(self, name: str) -> Dict[str, str]:
+        """Relative path to blob hash for every file of a packed change."""
+        if name not in self._changes:
+            raise KeyError(f"Change '{name}' is not in the archive pack")
+        return dict(self._changes[name])
+
+    def read_bytes(self, name: str, relative_path: str) -> bytes:
+        """Contents of one file of a packed change."""
+        files = self.files(name)
+        if relative_path not in files:
+            raise FileNotFoundError(f"{relative_path} is not in packed change '{name}'")
+        offset, length = self._blobs[files[relative_path]]
+        with open(self.pack_path, "rb") as pack:
+            pack.seek(offset)
+            return zlib.decompress(pack.read(length))
+
+    def read_text(self, name: str, relative_path: str) -> str:
+        return self.read_bytes(name, relative_path).decode("utf-8")
+
+    def add_changes(self, directories: Iterable[Path]) -> PackResult:
+        """Fold archive directories into the pack and remove them.
+
+        Every file is hashed; content already in the pack, or seen earlier
+        in this run, is not stored again.
+        """
+        result = PackResult()
+        pending: Dict[str, Dict[str, str]] = {}
+
+        self.pack_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.pack_path, "ab") as pack:
+            if pack.tell() == 0:
+                pack.write(PACK_MAGIC)
+            for directory in directories:
+                files = {}
+                for path in sorted(p for p in directory.rglob("*") if p.is_file()):
+                    data = path.read_bytes()
+                    digest = hashlib.sha256(data).hexdigest()
+                    files[path.relative_to(directory).as_posix()] = digest
+                    result.files += 1
+                    if digest in self._blobs:
+                        result.deduplicated += 1
+                        continue
+                    compressed = zlib.compress(data, 9)
+                    self._blobs[digest] = [pack.tell(), len(compressed)]
+                    pack.write(compressed)
+                    result.blobs_added += 1
+                    result.bytes_added += len(compressed)
+                pending[directory.name] = files
+            pack.flush()
+            os.fsync(pack.fileno())
+
+        self._changes.update(pending)
+        self._write_index()
+
+        for directory in directories:
+            shutil.rmtree(directory)
+            result.packed.append(directory.name)
+            # Drop month and year partitions that are now empty
+            for parent in (directory.parent, directory.parent.parent):
+                if parent != self.archive_dir and parent.is_relative_to(self.archive_dir):
+                    try:
+                        parent.rmdir()
+                    except OSError:
+                        break
+        return result
+
+    def _write_index(self) -> None:
+        """Replace the index with the current blobs and changes."""
+        write_file(str(self.index_path), json.dumps({
+            "version": INDEX_VERSION,
+            "blobs": self._blobs,
+            "changes": {name: {"files": files} for name, files in self._changes.items()},
+        }, indent=1, sort_keys=True) + "\n")
+
+
+def archived_on(name: str, path: Optional[Path] = None) -> Optional[date]:
+    """The date an archived change was archived, from its ``YYYY-MM-DD-`` prefix.
+
+    Falls back to the directory's modification time if the name has no date.
+    """
+    try:
+        return datetime.strptime(name[:10], "%Y-%m-%d").date()
+    except ValueError:
+        pass
+    if path is not None and path.exists():
+        return date.fromtimestamp(path.stat().st_mtime)
+    return None
+
+
+def pack_archives(archive_dir: Path, older_than_days: int = 0, today: Optional[date] = None) -> PackResult:
+    """Pack every archive directory, in either layout, archived at least ``older_than_days`` ago."""
+    archive_dir = Path(archive_dir)
+    cutoff = (today or date.today()) - timedelta(days=older_than_days)
+    store = PackStore(archive_dir)
+
+    # Imported here: the layout module reads the pack store too
+    from .archive_layout import iter_archived
+
+    directories = []
+    for archived in iter_archived(archive_dir, include_packed=False):
+        if store.has_change(archived.name):
+            raise FileExistsError(f"Archive '{archived.name}' is already in the archive pack")
+        archived_date = archived_on(archived.name, archived.path)
+        if archived_date is not None and archived_date <= cutoff:
+            directories.append(archived.path)
+    directories.reverse()
+
+    if not directories:
+        return PackResult()
+    return store.add_changes(directories)
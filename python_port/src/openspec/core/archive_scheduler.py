@@ -0,0 +1,133 @@
+"""Dependency-aware scheduling for archiving many changes at once.
+
+Archiving a change rewrites the main specs it has deltas for. Changes whose
+sets of target specs are disjoint cannot affect each other, so they are
+archived in parallel; changes that share a spec, directly or through other
+changes, form one chain that is archived in order of creation.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .change_operations import archive_change
+from .fingerprints import read_change_meta
+from ..utils.file_system import list_directories
+from ..utils.storage import Storage
+
+
+@dataclass
+class ArchiveOutcome:
+    """Result of archiving one change in a batch."""
+    name: str
+    archived_path: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def touched_specs(change_path: Path) -> List[str]:
+    """List the specs a change has deltas for, without parsing them."""
+    specs_dir = Path(change_path) / "specs"
+    if not specs_dir.exists():
+        return []
+    return [
+        spec_name for spec_name in list_directories(str(specs_dir))
+        if (specs_dir / spec_name / "spec.md").exists()
+    ]
+
+
+def change_created_at(change_path: Path) -> str:
+    """Return a change's creation time as an ISO timestamp.
+
+    The ``createdAt`` recorded in meta.json is used when present, otherwise
+    the change directory's modification time.
+    """
+    created_at = read_change_meta(change_path).get("createdAt")
+    if created_at:
+        return created_at
+    mtime = os.stat(change_path).st_mtime
+    return datetime.fromtimestamp(mtime, timezone.utc).isoformat(timespec="seconds")
+
+
+def plan_archive_chains(
+    project_path: str, names: Sequence[str], skip_specs: bool = False
+) -> List[List[str]]:
+    """Group changes into chains that must be archived one after another.
+
+    Changes are linked when they touch a common spec; each connected group
+    becomes a chain ordered by creation time, then name. Chains are ordered
+    by their first change. With ``skip_specs`` no spec is written, so every
+    change is a chain of its own.
+    """
+    changes_dir = Path(project_path) / "openspec" / "changes"
+    parent = {name: name for name in names}
+
+    def find(name: str) -> str:
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    if not skip_specs:
+        spec_owner: Dict[str, str] = {}
+        for name in names:
+            for spec_name in touched_specs(changes_dir / name):
+                owner = spec_owner.setdefault(spec_name, name)
+                parent[find(name)] = find(owner)
+
+    order_key = {name: (change_created_at(changes_dir / name), name) for name in names}
+    chains: Dict[str, List[str]] = {}
+    for name in names:
+        chains.setdefault(find(name), []).append(name)
+
+    ordered = [sorted(chain, key=order_key.__getitem__) for chain in chains.values()]
+    return sorted(ordered, key=lambda chain: order_key[chain[0]])
+
+
+def archive_changes(
+    project_path: str,
+    names: Sequence[str],
+    skip_specs: bool = False,
+    validate: bool = True,
+    workers: Optional[int] = None,
+    storage: Optional[Storage] = None,
+) -> List[ArchiveOutcome]:
+    """Archive many changes, running independent chains in parallel threads.
+
+    A failure stops nothing: the rest of its chain is still attempted and
+    will fail validation if it depended on the failed change. Outcomes are
+    returned in schedule order, chain by chain. ``storage`` is passed on to
+    ``archive_change``.
+    """
+    chains = plan_archive_chains(project_path, names, skip_specs)
+    if not chains:
+        return []
+
+    def run_chain(chain: List[str]) -> List[ArchiveOutcome]:
+        outcomes = []
+        for name in chain:
+            try:
+                path = archive_change(
+                    project_path, name, skip_specs=skip_specs, validate=validate, storage=storage
+                )
+                outcomes.append(ArchiveOutcome(name, archived_path=path))
+            except Exception as e:
+                outcomes.append(ArchiveOutcome(name, error=e))
+        return outcomes
+
+    if workers is None:
+        workers = min(len(chains), (os.cpu_count() or 1) + 4)
+
+    if workers <= 1 or len(chains) == 1:
+        results = [run_chain(chain) for chain in chains]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_chain, chains))
+
+    return [outcome for chain_outcomes in results for outcome in chain_outcomes]
@@ -0,0 +1,134 @@
+"""Unified diffs of spec rewrites, aligned on requirement blocks.
+
+A spec is split into segments: the preamble, then one segment per
+requirement block running up to the next block. Segments are keyed by
+requirement name and content hash and aligned with a sequence matcher, so
+unchanged requirements are skipped by comparing hashes and the line-level
+diff only runs over the segments that actually changed. On large specs
+where an archive touches a few requirements this stays proportional to
+the edit, unlike a whole-file ``difflib`` pass.
+"""
+
+import difflib
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from .parsers.requirement_blocks import extract_requirement_blocks, normalize_line_endings
+
+CONTEXT_LINES = 3
+
+
+@dataclass
+class SpecWriteDiff:
+    """How a spec's text changes, with a requirement-level summary."""
+    path: str
+    unified: List[str] = field(default_factory=list)
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "added": self.added,
+            "modified": self.modified,
+            "removed": self.removed,
+            "diff": "\n".join(self.unified),
+        }
+
+
+@dataclass
+class _Segment:
+    name: str
+    start: int
+    lines: List[str]
+    key: str
+
+
+def diff_spec_write(path: str, old: str, new: str) -> SpecWriteDiff:
+    """Diff the current and rewritten text of a spec ("" if it does not exist)."""
+    old_segments = _segments(old)
+    new_segments = _segments(new)
+    result = SpecWriteDiff(path)
+
+    old_blocks = {segment.name: segment for segment in old_segments[1:]}
+    new_blocks = {segment.name: segment for segment in new_segments[1:]}
+    result.added = [name for name in new_blocks if name not in old_blocks]
+    result.removed = [name for name in old_blocks if name not in new_blocks]
+    result.modified = [
+        name for name, segment in new_blocks.items()
+        if name in old_blocks and _block_text(old_blocks[name]) != _block_text(segment)
+    ]
+
+    matcher = difflib.SequenceMatcher(
+        None, [segment.key for segment in old_segments], [segment.key for segment in new_segments], autojunk=False
+    )
+    hunks = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        old_lines = [line for segment in old_segments[i1:i2] for line in segment.lines]
+        new_lines = [line for segment in new_segments[j1:j2] for line in segment.lines]
+        old_start = old_segments[i1].start if i1 < len(old_segments) else _line_count(old_segments)
+        new_start = new_segments[j1].start if j1 < len(new_segments) else _line_count(new_segments)
+        hunks.extend(_hunks(old_lines, new_lines, old_start, new_start))
+
+    if hunks:
+        result.unified = [f"--- a/{path}", f"+++ b/{path}"] + hunks
+    return result
+
+
+def _segments(content: str) -> List[_Segment]:
+    """Split a spec into its preamble and one segment per requirement block."""
+    if not content:
+        return []
+    lines = normalize_line_endings(content).split("\n")
+    blocks = extract_requirement_blocks(content)
+    names = [block.name for block in blocks]
+
+    bounds = [0] + [block.start_line for block in blocks] + [len(lines)]
+    segments = []
+    for index in range(len(bounds) - 1):
+        start, end = bounds[index], bounds[index + 1]
+        segment_lines = lines[start:end]
+        name = names[index - 1] if index else ""
+        digest = hashlib.sha256("\n".join(segment_lines).encode("utf-8")).hexdigest()
+        segments.append(_Segment(name, start, segment_lines, f"{name}\0{digest}"))
+    return segments
+
+
+def _block_text(segment: _Segment) -> str:
+    # Blank lines between blocks are layout, not requirement content
+    return "\n".join(segment.lines).strip()
+
+
+def _line_count(segments: List[_Segment]) -> int:
+    return segments[-1].start + len(segments[-1].lines) if segments else 0
+
+
+def _hunks(old_lines: List[str], new_lines: List[str], old_start: int, new_start: int) -> List[str]:
+    """Unified-diff hunks for a changed span, with line numbers offset into the whole file."""
+    output = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for group in matcher.get_grouped_opcodes(CONTEXT_LINES):
+        first, last = group[0], group[-1]
+        old_range = _format_range(old_start + first[1], last[2] - first[1])
+        new_range = _format_range(new_start + first[3], last[4] - first[3])
+        output.append(f"@@ -{old_range} +{new_range} @@")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                output.extend(" " + line for line in old_lines[i1:i2])
+                continue
+            output.extend("-" + line for line in old_lines[i1:i2])
+            output.extend("+" + line for line in new_lines[j1:j2])
+    return output
+
+
+def _format_range(start: int, length: int) -> str:
+    """A hunk range as ``difflib.unified_diff`` writes it (``start`` is 0-based)."""
+    if length == 1:
+        return str(start + 1)
+    if not length:
+        return f"{start},0"
+    return f"{start + 1},{length}"
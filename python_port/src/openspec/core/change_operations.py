@@ -2,19 +2,39 @@
 
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 
-from .parsers import parse_markdown_file
+from .parsers import parse_markdown_file, parse_many
+from .parsers.markdown_parser import MarkdownParser
+from .fingerprints import (
+    META_FILE_NAME, delta_targets, find_stale_requirements, fingerprint_requirement,
+    live_requirement_blocks, read_change_meta, render_change_meta, write_change_meta
+)
+from .parsers.requirement_blocks import (
+    apply_scenario_ops, extract_requirement_blocks, index_requirement_blocks,
+    replace_requirement_block, scenario_id
+)
+from .archive_journal import ArchiveTransaction, journal_path
+from .archive_index import ArchiveIndex, record_archive
+from .archive_layout import archive_destination, list_archived, locate_archived
+from .archive_pack import PackStore
+from .requirement_merge import has_conflict_markers, merge_requirement
 from ..utils.file_system import (
     find_openspec_root, ensure_directory, write_file, 
     list_directories, file_exists, read_file
 )
+from ..utils.storage import LOCAL_STORAGE, LocalStorage, Storage
 
 
 
-def list_changes(project_path: str) -> List[Dict[str, Any]]:
-    """List all changes in the project."""
+def list_changes(project_path: str, archived_limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """List all changes in the project.
+    
+    With ``archived_limit`` only the newest archived changes are included,
+    and only the archive partitions holding them are listed.
+    """
     
     changes = []
     
@@ -29,15 +49,17 @@ def list_changes(project_path: str) -> List[Dict[str, Any]]:
                     "is_archived": False
                 })
     
-    # Archived changes
-    archive_dir = changes_dir / "archive"
-    if archive_dir.exists():
-        for change_name in list_directories(str(archive_dir)):
-            changes.append({
-                "name": change_name,
-                "path": str(archive_dir / change_name),
+    # Archived changes, in either archive layout or folded into the pack store
+    if archived_limit != 0:
+        for archived in list_archived(changes_dir / "archive", limit=archived_limit):
+            change = {
+                "name": archived.name,
+                "path": str(archived.path),
                 "is_archived": True
-            })
+            }
+            if archived.packed:
+                change["is_packed"] = True
+            changes.append(change)
     
     return sorted(changes, key=lambda x: x["name"])
 
@@ -49,23 +71,40 @@ def show_change(project_path: str, name: str) -> Optional[Dict[str, Any]]:
     
     # Check active changes
     change_path = changes_dir / name
+    packed = None
     if not change_path.exists():
-        # Check archived changes
-        change_path = changes_dir / "archive" / name
-        if not change_path.exists():
-            return None
+        # Check archived changes, by dated directory name or original ID
+        archive_dir = changes_dir / "archive"
+        store = PackStore(archive_dir)
+        if not locate_archived(archive_dir, name) and not store.has_change(name):
+            entry = ArchiveIndex.load(archive_dir).lookup(name)
+            if entry is None:
+                return None
+            name = entry.directory
+        change_path = locate_archived(archive_dir, name)
+        if change_path is None:
+            if not store.has_change(name):
+                return None
+            change_path = archive_dir / name
+            packed = store
     
     change_info = {
         "name": name,
         "path": str(change_path),
         "is_archived": "archive" in str(change_path)
     }
+    if packed:
+        change_info["is_packed"] = True
     
     # Read proposal if it exists
-    proposal_path = change_path / "proposal.md"
-    if file_exists(str(proposal_path)):
+    content = None
+    if packed:
+        if "proposal.md" in packed.files(name):
+            content = packed.read_text(name, "proposal.md")
+    elif file_exists(str(change_path / "proposal.md")):
+        content = read_file(str(change_path / "proposal.md"))
+    if content is not None:
         try:
-            content = read_file(str(proposal_path))
             parsed = parse_markdown_file(content)
             if parsed["json"]:
                 change_info["proposal"] = parsed["json"]
@@ -75,81 +114,483 @@ def show_change(project_path: str, name: str) -> Optional[Dict[str, Any]]:
     return change_info
 
 
-def archive_change(project_path: str, name: str, skip_specs: bool = False) -> str:
-    """Archive a change by moving it to the archive directory and updating specs."""
+@dataclass
+class RequirementConflict:
+    """A requirement touched by more than one active change."""
+    spec_name: str
+    requirement: str
+    changes: List[Tuple[str, str]]  # (change name, operation)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "spec": self.spec_name,
+            "requirement": self.requirement,
+            "changes": [{"change": name, "operation": op} for name, op in self.changes],
+        }
+
+
+@dataclass
+class ChangeConflictReport:
+    """Overlapping requirements across all active changes."""
+    changes: List[str]
+    conflicts: List[RequirementConflict]
+    
+    @property
+    def independent(self) -> List[str]:
+        """Changes that share no requirement with any other active change."""
+        involved = {name for conflict in self.conflicts for name, _ in conflict.changes}
+        return [name for name in self.changes if name not in involved]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "changes": self.changes,
+            "conflicts": [conflict.to_dict() for conflict in self.conflicts],
+            "independent": self.independent,
+        }
+
+
+def find_change_conflicts(project_path: str) -> ChangeConflictReport:
+    """Find requirements that more than one active change touches.
+    
+    Every active delta is parsed once and folded into an index from
+    ``(spec, requirement)`` to the changes touching it, so the cost grows with
+    the number of deltas rather than the number of change pairs.
+    """
+    
+    changes_dir = Path(project_path) / "openspec" / "changes"
+    change_names = []
+    delta_paths = []
+    owners = []
+    
+    if changes_dir.exists():
+        for change_name in sorted(list_directories(str(changes_dir))):
+            if change_name == "archive":
+                continue
+            change_names.append(change_name)
+            specs_dir = changes_dir / change_name / "specs"
+            if not specs_dir.exists():
+                continue
+            for spec_name in sorted(list_directories(str(specs_dir))):
+                delta_path = specs_dir / spec_name / "spec.md"
+                if delta_path.exists():
+                    delta_paths.append(str(delta_path))
+                    owners.append((change_name, spec_name))
+    
+    index: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+    for (change_name, spec_name), delta in zip(owners, parse_many(delta_paths, kind="change")):
+        for requirement, operation in _touched_requirements(delta):
+            touched = index.setdefault((spec_name, requirement), {})
+            operations = touched.setdefault(change_name, [])
+            if operation not in operations:
+                operations.append(operation)
+    
+    conflicts = [
+        RequirementConflict(
+            spec_name=spec_name,
+            requirement=requirement,
+            changes=[(name, "+".join(ops)) for name, ops in touched.items()],
+        )
+        for (spec_name, requirement), touched in sorted(index.items())
+        if len(touched) > 1
+    ]
+    
+    return ChangeConflictReport(changes=change_names, conflicts=conflicts)
+
+
+def _touched_requirements(delta: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """List ``(requirement name, operation)`` pairs a delta touches, new names included."""
+    
+    touched = [(req.get("title", ""), "ADDED") for req in delta.get("added_requirements", [])]
+    touched += delta_targets(delta)
+    touched += [(rename["to"], "RENAMED") for rename in delta.get("renamed_requirements", [])]
+    return touched
+
+
+class ArchiveValidationError(ValueError):
+    """Raised when a change's spec deltas fail pre-archive validation."""
+    
+    def __init__(self, change_name: str, errors: List[str]):
+        self.change_name = change_name
+        self.errors = errors
+        super().__init__(
+            f"Change '{change_name}' failed validation with {len(errors)} error(s)"
+        )
+
+
+@dataclass
+class SpecDeltaPlan:
+    """A parsed spec delta together with the parsed main spec it targets.
+    
+    Plans are built once per archive so validation and the merge work on
+    the same parsed objects.
+    """
+    spec_name: str
+    delta_path: Path
+    delta: Dict[str, Any]
+    main_spec_path: Path
+    existing: Optional[Dict[str, Any]] = None
+
+
+def archive_change(
+    project_path: str,
+    name: str,
+    skip_specs: bool = False,
+    validate: bool = True,
+    storage: Optional[Storage] = None,
+) -> str:
+    """Archive a change by moving it to the archive directory and updating specs.
+    
+    Unless ``validate`` is False, the spec deltas are validated against the
+    current specs first, including a check that requirements with recorded
+    base fingerprints have not changed since, and ArchiveValidationError is
+    raised before any file is written. Spec updates and the move into the
+    archive are applied as one journaled transaction (see archive_journal).
+    
+    With a ``storage`` other than the local disk (e.g. a MemoryStorage for a
+    dry run) the spec writes and the move go to that backend instead, and
+    the archive index is left alone.
+    """
     
+    storage = storage or LOCAL_STORAGE
+    on_disk = isinstance(storage, LocalStorage)
     changes_dir = Path(project_path) / "openspec" / "changes"
     source_path = changes_dir / name
     
-    if not source_path.exists():
+    if not storage.is_dir(source_path):
         raise ValueError(f"Change '{name}' not found")
     
-    # Apply spec deltas before archiving (unless skipped)
-    if not skip_specs:
-        _apply_spec_deltas(project_path, source_path, name)
+    if on_disk and journal_path(changes_dir, name).exists():
+        raise RuntimeError(
+            f"An interrupted archive of '{name}' is pending; run 'openspec archive --recover' first"
+        )
+    
+    # Parse the change deltas and their target specs once
+    plans = [] if skip_specs else load_spec_delta_plans(project_path, source_path, storage)
+    
+    if validate and plans:
+        errors = validate_spec_delta_plans(plans)
+        # Refuse to overwrite requirements that moved on since the change was authored
+        errors.extend(str(stale) for stale in find_stale_requirements(source_path, plans, storage))
+        if errors:
+            raise ArchiveValidationError(name, errors)
     
     # Create archive directory
     archive_dir = changes_dir / "archive"
-    ensure_directory(str(archive_dir))
     
     # Move to archive with date prefix
     from datetime import date
     date_prefix = date.today().isoformat()
     archived_name = f"{date_prefix}-{name}"
-    dest_path = archive_dir / archived_name
+    dest_path = archive_destination(archive_dir, archived_name)
     
-    # Check if archive already exists
-    if dest_path.exists():
+    # Check if archive already exists, in either layout or in the pack
+    if (
+        locate_archived(archive_dir, archived_name)
+        or storage.exists(dest_path)
+        or PackStore(archive_dir).has_change(archived_name)
+    ):
         raise FileExistsError(f"Archive '{archived_name}' already exists")
     
-    source_path.rename(dest_path)
+    # Render every updated spec first so a failure leaves nothing half-written
+    writes = _render_spec_updates(plans, name)
+    
+    if not on_disk:
+        for target, content in writes:
+            storage.write_text(target, content)
+        storage.rename(source_path, dest_path)
+        return str(dest_path)
+    
+    ensure_directory(str(dest_path.parent))
+    if writes:
+        writes.append(_preimage_write(source_path, plans, writes))
+        ArchiveTransaction(changes_dir, name, source_path, dest_path).run(writes)
+    else:
+        source_path.rename(dest_path)
+    record_archive(archive_dir, name, dest_path)
     
     return str(dest_path)
 
 
-def _apply_spec_deltas(project_path: str, change_path: Path, change_name: str) -> None:
-    """Apply spec deltas from a change to the main specs."""
+def _preimage_write(change_path: Path, plans: List[SpecDeltaPlan], writes: List[Tuple[Path, str]]) -> Tuple[Path, str]:
+    """The meta.json write recording what each spec held before the change (None if new).
+    
+    The archived change keeps it, so ``show --as-of`` can recover a spec's
+    exact earlier text instead of replaying deltas onto a guess.
+    """
+    
+    written = {target for target, _ in writes}
+    meta = read_change_meta(change_path)
+    meta["preimages"] = {
+        plan.spec_name: plan.existing.get("raw_content") if plan.existing is not None else None
+        for plan in plans if plan.main_spec_path in written
+    }
+    return change_path / META_FILE_NAME, render_change_meta(meta)
+
+
+def load_spec_delta_plans(project_path: str, change_path: Path, storage: Optional[Storage] = None) -> List[SpecDeltaPlan]:
+    """Parse every spec delta in a change along with the main spec it targets."""
+    
+    storage = storage or LOCAL_STORAGE
+    plans = []
     
     # Find all spec deltas in the change
     change_specs_dir = change_path / "specs"
-    if not change_specs_dir.exists():
-        return
+    if not storage.is_dir(change_specs_dir):
+        return plans
+    
+    specs_dir = Path(project_path) / "openspec" / "specs"
+    parser = MarkdownParser()
     
-    for spec_name in list_directories(str(change_specs_dir)):
+    for spec_name in sorted(storage.list_directories(change_specs_dir)):
         spec_delta_path = change_specs_dir / spec_name / "spec.md"
-        if not spec_delta_path.exists():
+        if not storage.is_file(spec_delta_path):
             continue
         
-        # Read the spec delta
-        try:
-            delta_content = read_file(str(spec_delta_path))
-            from .parsers.markdown_parser import MarkdownParser
-            parser = MarkdownParser()
-            delta_spec = parser.parse_change_spec(delta_content)
+        main_spec_path = specs_dir / spec_name / "spec.md"
+        existing = None
+        if storage.is_file(main_spec_path):
+            existing = parser.parse_spec(storage.read_text(main_spec_path))
+        
+        plans.append(SpecDeltaPlan(
+            spec_name=spec_name,
+            delta_path=spec_delta_path,
+            delta=parser.parse_change_spec(storage.read_text(spec_delta_path)),
+            main_spec_path=main_spec_path,
+            existing=existing
+        ))
+    
+    return plans
+
+
+def validate_spec_delta_plans(plans: List[SpecDeltaPlan]) -> List[str]:
+    """Check that spec deltas can be applied cleanly to their target specs."""
+    
+    errors = []
+    
+    for plan in plans:
+        prefix = f"{plan.spec_name}:"
+        
+        if has_conflict_markers(plan.delta.get("raw_content", "")):
+            errors.append(f"{prefix} Unresolved merge conflict markers in the delta")
+        
+        existing_titles = {
+            req.get("title") for req in (plan.existing or {}).get("requirements", [])
+        }
+        
+        # ADDED requirements must be unique and not already present
+        seen = set()
+        for req in plan.delta.get("added_requirements", []):
+            title = req.get("title")
+            if title in seen:
+                errors.append(f"{prefix} Duplicate ADDED requirement '{title}'")
+            elif title in existing_titles:
+                errors.append(f"{prefix} ADDED requirement '{title}' already exists in the spec")
+            seen.add(title)
+        
+        # RENAMED requirements must exist under the old name and not the new one
+        for rename in plan.delta.get("renamed_requirements", []):
+            if rename["from"] not in existing_titles:
+                errors.append(f"{prefix} RENAMED requirement '{rename['from']}' not found in the spec")
+            if rename["to"] in existing_titles:
+                errors.append(f"{prefix} RENAMED target '{rename['to']}' already exists in the spec")
+            existing_titles = (existing_titles - {rename["from"]}) | {rename["to"]}
+        
+        # MODIFIED and REMOVED requirements must target existing requirements
+        for operation in ("modified", "removed"):
+            for req in plan.delta.get(f"{operation}_requirements", []):
+                if req.get("title") not in existing_titles:
+                    errors.append(
+                        f"{prefix} {operation.upper()} requirement '{req.get('title')}' not found in the spec"
+                    )
+        
+        # ADDED and MODIFIED requirements must carry at least one scenario
+        for operation in ("added", "modified"):
+            for req in plan.delta.get(f"{operation}_requirements", []):
+                if not req.get("scenarios") and not _has_scenario_ops(req):
+                    errors.append(
+                        f"{prefix} {operation.upper()} requirement '{req.get('title')}' has no scenarios"
+                    )
+        
+        errors.extend(_validate_scenario_ops(plan, prefix))
+    
+    return errors
+
+
+def _has_scenario_ops(requirement: Dict[str, Any]) -> bool:
+    """Whether a delta requirement carries scenario-level operations."""
+    return any(requirement.get("scenario_ops", {}).values())
+
+
+def _validate_scenario_ops(plan: SpecDeltaPlan, prefix: str) -> List[str]:
+    """Check scenario-level operations against the targeted requirements."""
+    
+    errors = []
+    renames = {r["to"]: r["from"] for r in plan.delta.get("renamed_requirements", [])}
+    existing = {
+        req.get("title"): req for req in (plan.existing or {}).get("requirements", [])
+    }
+    
+    for req in plan.delta.get("modified_requirements", []):
+        ops = req.get("scenario_ops")
+        if not ops:
+            continue
+        title = req.get("title")
+        target = existing.get(renames.get(title, title))
+        if target is None:
+            continue  # Reported as a missing MODIFIED target
+        
+        scenario_ids = {
+            scenario_id(scenario.get("title", "")) for scenario in target.get("scenarios", [])
+        }
+        seen = set()
+        for scenario in ops.get("added", []):
+            if scenario["id"] in scenario_ids or scenario["id"] in seen:
+                errors.append(
+                    f"{prefix} ADDED scenario '{scenario['title']}' already exists in requirement '{title}'"
+                )
+            seen.add(scenario["id"])
+        
+        targets = [(s["id"], "MODIFIED") for s in ops.get("modified", [])]
+        targets += [(sid, "REMOVED") for sid in ops.get("removed", [])]
+        for sid, operation in targets:
+            if sid not in scenario_ids:
+                errors.append(
+                    f"{prefix} {operation} scenario '{sid}' not found in requirement '{title}'"
+                )
+    
+    return errors
+
+
+@dataclass
+class SyncOutcome:
+    """Result of syncing one requirement targeted by a change."""
+    spec_name: str
+    requirement: str
+    operation: str
+    status: str  # "up-to-date", "merged", "conflict", "rebased", "needs-review", "confirmed", "missing" or "no-base"
+    conflicts: int = 0
+
+
+# Operations that drop a requirement's current text, so a stale base needs review
+_REVIEWED_OPERATIONS = ("REMOVED", "RENAMED")
+
+
+def sync_change(project_path: str, name: str, confirm: bool = False) -> List[SyncOutcome]:
+    """Rebase a change's deltas onto the current specs.
+    
+    For every MODIFIED requirement whose live text moved on since its base
+    fingerprint was recorded, the stored base, the live requirement and the
+    change's block are three-way merged. The merged block replaces the one in
+    the delta; conflicts are written as markers for the author to resolve.
+    Base fingerprints are refreshed to the live spec either way.
+    
+    A REMOVED or RENAMED requirement edited since its base was recorded is
+    reported as "needs-review" and its base is left as is, so the change
+    stays stale, unless ``confirm`` is set.
+    """
+    
+    change_path = Path(project_path) / "openspec" / "changes" / name
+    if not change_path.exists():
+        raise ValueError(f"Change '{name}' not found")
+    
+    plans = load_spec_delta_plans(project_path, change_path)
+    meta = read_change_meta(change_path)
+    bases = meta.get("bases", {})
+    outcomes = []
+    meta_changed = False
+    
+    for plan in plans:
+        live_blocks = live_requirement_blocks(plan)
+        spec_bases = bases.get(plan.spec_name, {})
+        delta_content = plan.delta.get("raw_content", "")
+        modified_blocks = {
+            block.name: block
+            for block in extract_requirement_blocks(delta_content, section="modified requirements")
+        }
+        scenario_op_titles = {
+            req.get("title") for req in plan.delta.get("modified_requirements", [])
+            if _has_scenario_ops(req)
+        }
+        replacements = []
+        
+        for requirement, operation in delta_targets(plan.delta):
+            base = spec_bases.get(requirement)
+            live = live_blocks.get(requirement)
+            if base is None:
+                outcomes.append(SyncOutcome(plan.spec_name, requirement, operation, "no-base"))
+                continue
+            if live is None:
+                outcomes.append(SyncOutcome(plan.spec_name, requirement, operation, "missing"))
+                continue
+            
+            live_hash = fingerprint_requirement(live.raw)
+            if live_hash == base.get("hash"):
+                outcomes.append(SyncOutcome(plan.spec_name, requirement, operation, "up-to-date"))
+                continue
             
-            # Apply deltas to main spec
-            _update_main_spec(project_path, spec_name, delta_spec, change_name)
+            if operation in _REVIEWED_OPERATIONS and not confirm:
+                outcomes.append(SyncOutcome(plan.spec_name, requirement, operation, "needs-review"))
+                continue
             
-        except Exception as e:
-            print(f"Warning: Failed to apply spec delta for {spec_name}: {e}")
+            status = "confirmed" if operation in _REVIEWED_OPERATIONS else "rebased"
+            outcome = SyncOutcome(plan.spec_name, requirement, operation, status)
+            block = modified_blocks.get(requirement)
+            # Scenario-level operations apply to the live requirement as is
+            if operation == "MODIFIED" and block is not None and requirement not in scenario_op_titles:
+                result = merge_requirement(base.get("text", ""), live.raw, block.raw)
+                replacements.append((block, result.text))
+                outcome.status = "merged" if result.is_clean else "conflict"
+                outcome.conflicts = result.conflicts
+            outcomes.append(outcome)
+            
+            spec_bases[requirement] = {"operation": operation, "hash": live_hash, "text": live.raw}
+            bases[plan.spec_name] = spec_bases
+            meta_changed = True
+        
+        if replacements:
+            # Replace from the bottom up so earlier line numbers stay valid
+            updated_content = delta_content
+            for block, merged_text in sorted(replacements, key=lambda r: r[0].start_line, reverse=True):
+                updated_content = replace_requirement_block(updated_content, block, merged_text)
+            write_file(str(plan.delta_path), updated_content)
+    
+    if meta_changed:
+        meta["bases"] = bases
+        write_change_meta(change_path, meta)
+    
+    return outcomes
 
 
-def _update_main_spec(project_path: str, spec_name: str, delta_spec: Dict[str, Any], change_name: str) -> None:
-    """Update a main spec with deltas from a change spec."""
+def _render_spec_updates(plans: List[SpecDeltaPlan], change_name: str) -> List[Tuple[Path, str]]:
+    """Render the updated content of every main spec a change writes."""
     
-    specs_dir = Path(project_path) / "openspec" / "specs"
-    main_spec_dir = specs_dir / spec_name
-    main_spec_path = main_spec_dir / "spec.md"
-    
-    # Create spec directory if it doesn't exist
-    ensure_directory(str(main_spec_dir))
-    
-    # Read existing spec or create from skeleton
-    if main_spec_path.exists():
-        existing_content = read_file(str(main_spec_path))
-        from .parsers.markdown_parser import MarkdownParser
-        parser = MarkdownParser()
-        existing_spec = parser.parse_spec(existing_content)
+    writes = []
+    for plan in plans:
+        content = render_main_spec(plan, change_name)
+        if content is not None:
+            writes.append((plan.main_spec_path, content))
+    return writes
+
+
+def render_main_spec(plan: SpecDeltaPlan, change_name: str) -> Optional[str]:
+    """Render a main spec with deltas from a change spec applied.
+    
+    Returns None when the spec text would not change.
+    """
+    
+    spec_name = plan.spec_name
+    
+    # Scenario-level edits are patched into the spec text in place
+    if plan.existing is not None and _is_scenario_only_delta(plan.delta):
+        raw_content = plan.existing.get("raw_content", "")
+        updated_content = _patch_scenarios(raw_content, plan.delta)
+        return updated_content if updated_content != raw_content else None
+    
+    # Use the already-parsed spec or create from skeleton
+    if plan.existing is not None:
+        existing_spec = plan.existing
     else:
         # Create new spec from skeleton
         existing_spec = {
@@ -160,8 +601,79 @@ def _update_main_spec(project_path: str, spec_name: str, delta_spec: Dict[str, A
             "raw_content": ""
         }
     
+    updated_requirements = merge_requirements(existing_spec.get("requirements", []), plan.delta)
+    
+    # Generate updated spec content
+    updated_content = generate_spec_content(
+        title=existing_spec.get("title", f"{spec_name} Specification"),
+        purpose=existing_spec.get("purpose", f"Specification for {spec_name}"),
+        requirements=updated_requirements
+    )
+    
+    if plan.existing is not None and updated_content == plan.existing.get("raw_content"):
+        return None
+    return updated_content
+
+
+def _is_scenario_only_delta(delta_spec: Dict[str, Any]) -> bool:
+    """Whether a delta only adds, modifies or removes individual scenarios."""
+    
+    if any(delta_spec.get(key) for key in ("added_requirements", "removed_requirements", "renamed_requirements")):
+        return False
+    modified = delta_spec.get("modified_requirements", [])
+    return bool(modified) and all(
+        _has_scenario_ops(req) and not req.get("scenarios") and not req.get("description")
+        for req in modified
+    )
+
+
+def _patch_scenarios(content: str, delta_spec: Dict[str, Any]) -> str:
+    """Apply scenario-level operations to the requirement blocks of a spec's text."""
+    
+    blocks = index_requirement_blocks(content)
+    targets = [
+        (blocks[req["title"]], req["scenario_ops"])
+        for req in delta_spec.get("modified_requirements", [])
+        if req.get("title") in blocks
+    ]
+    
+    # Patch from the bottom up so earlier line numbers stay valid
+    for block, ops in sorted(targets, key=lambda t: t[0].start_line, reverse=True):
+        content = replace_requirement_block(content, block, apply_scenario_ops(block.raw, ops))
+    return content
+
+
+def _apply_scenario_ops(scenarios: List[Dict[str, Any]], ops: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Apply scenario-level operations to a parsed requirement's scenarios."""
+    
+    modified = {scenario["id"]: scenario for scenario in ops.get("modified", [])}
+    removed = set(ops.get("removed", []))
+    
+    updated = []
+    for scenario in scenarios:
+        sid = scenario_id(scenario.get("title", ""))
+        if sid in removed:
+            continue
+        updated.append(dict(modified.get(sid, scenario)))
+    updated.extend(dict(scenario) for scenario in ops.get("added", []))
+    return updated
+
+
+def merge_requirements(requirements: List[Dict[str, Any]], delta_spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Apply a parsed change delta to a list of requirements.
+    
+    Returns a new list; the input requirements are not mutated.
+    """
+    
     # Merge requirements
-    updated_requirements = list(existing_spec.get("requirements", []))
+    updated_requirements = [dict(req) for req in requirements]
+    
+    # Rename requirements first so later operations can use the new names
+    for rename in delta_spec.get("renamed_requirements", []):
+        for req in updated_requirements:
+            if req.get("title") == rename["from"]:
+                req["title"] = rename["to"]
+                break
     
     # Add new requirements
     for req in delta_spec.get("added_requirements", []):
@@ -173,8 +685,15 @@ def _update_main_spec(project_path: str, spec_name: str, delta_spec: Dict[str, A
         for i, existing_req in enumerate(updated_requirements):
             if existing_req.get("title") == modified_req.get("title"):
                 # Apply modifications
-                if modified_req.get("change_description"):
-                    existing_req["description"] = modified_req.get("description", existing_req.get("description", ""))
+                if modified_req.get("description"):
+                    existing_req["description"] = modified_req["description"]
+                if _has_scenario_ops(modified_req):
+                    existing_req["scenarios"] = _apply_scenario_ops(
+                        existing_req.get("scenarios", []), modified_req["scenario_ops"]
+                    )
+                elif modified_req.get("scenarios"):
+                    # A full block replaces the requirement's scenarios
+                    existing_req["scenarios"] = [dict(scenario) for scenario in modified_req["scenarios"]]
                 updated_requirements[i] = existing_req
                 break
         else:
@@ -188,18 +707,10 @@ def _update_main_spec(project_path: str, spec_name: str, delta_spec: Dict[str, A
             if req.get("title") != removed_req.get("title")
         ]
     
-    # Generate updated spec content
-    updated_content = _generate_spec_content(
-        title=existing_spec.get("title", f"{spec_name} Specification"),
-        purpose=existing_spec.get("purpose", f"Specification for {spec_name}"),
-        requirements=updated_requirements
-    )
-    
-    # Write updated spec
-    write_file(str(main_spec_path), updated_content)
+    return updated_requirements
 
 
-def _generate_spec_content(title: str, purpose: str, requirements: List[Dict[str, Any]]) -> str:
+def generate_spec_content(title: str, purpose: str, requirements: List[Dict[str, Any]]) -> str:
     """Generate markdown content for a spec."""
     
     content_lines = [
@@ -51,18 +51,20 @@ class SlashCommandConfigurator(ABC):
     
     async def generate_all(self, project_path: str, openspec_dir: str) -> List[str]:
         """Generate all slash command files for this tool."""
-        from ...utils.file_system import ensure_directory, write_file, read_file
-        from ..config import OPENSPEC_MARKERS
+        from ...utils.file_system import ensure_directory, write_file
+        from ...utils.file_markers import block_start_marker, block_end_marker
         
         created_or_updated = []
+        targets = self.get_targets()
         
-        for target in self.get_targets():
+        # Create each target directory once, not once per file
+        for directory in dict.fromkeys((Path(project_path) / t.path).parent for t in targets):
+            ensure_directory(str(directory))
+        
+        for target in targets:
             body = self.get_body(target.id)
             file_path = Path(project_path) / target.path
             
-            # Ensure directory exists
-            ensure_directory(str(file_path.parent))
-            
             if file_path.exists():
                 self._update_body(str(file_path), body)
             else:
@@ -70,7 +72,7 @@ class SlashCommandConfigurator(ABC):
                 sections = []
                 if frontmatter:
                     sections.append(frontmatter.strip())
-                sections.append(f"{OPENSPEC_MARKERS['start']}\n{body}\n{OPENSPEC_MARKERS['end']}")
+                sections.append(f"{block_start_marker()}\n{body}\n{block_end_marker()}")
                 content = "\n".join(sections) + "\n"
                 write_file(str(file_path), content)
             
@@ -113,21 +115,6 @@ class SlashCommandConfigurator(ABC):
     
     def _update_body(self, file_path: str, body: str) -> None:
         """Update the body content between OpenSpec markers."""
-        from ...utils.file_system import read_file, write_file
-        from ..config import OPENSPEC_MARKERS
-        
-        content = read_file(file_path)
-        start_marker = OPENSPEC_MARKERS["start"]
-        end_marker = OPENSPEC_MARKERS["end"]
-        
-        start_index = content.find(start_marker)
-        end_index = content.find(end_marker)
-        
-        if start_index == -1 or end_index == -1 or end_index <= start_index:
-            raise ValueError(f"Missing OpenSpec markers in {file_path}")
-        
-        before = content[:start_index + len(start_marker)]
-        after = content[end_index:]
-        updated_content = f"{before}\n{body}\n{after}"
+        from ...utils.file_markers import update_file_blocks, DEFAULT_BLOCK
         
-        write_file(file_path, updated_content)
\ No newline at end of file
+        update_file_blocks(file_path, {DEFAULT_BLOCK: body}, append_missing=False)
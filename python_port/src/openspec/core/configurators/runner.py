@@ -0,0 +1,122 @@
+"""Run tool and slash command configurators for many tools at once."""
+
+import asyncio
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+from .registry import ToolRegistry
+from .slash.registry import SlashCommandRegistry
+from ...utils.file_system import ensure_directory
+
+# Configurators only do small file reads and writes, so a few threads are
+# enough to overlap them without oversubscribing the disk.
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class ConfiguratorResult:
+    """Outcome of running one configurator."""
+    tool_id: str
+    kind: str  # "config" or "slash"
+    paths: List[str] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _Job:
+    tool_id: str
+    kind: str
+    run: Callable[[], Awaitable[Optional[List[str]]]]
+    paths: List[str]
+
+
+async def run_configurators(
+    project_path: str,
+    openspec_dir: str,
+    tool_ids: Sequence[str],
+    update_only: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[ConfiguratorResult]:
+    """Configure tools concurrently through the tool and slash command registries.
+
+    Every configurator's target directories are created up front in one pass,
+    then the configurators run with ``asyncio.gather`` on a bounded thread
+    pool, since their file I/O is blocking. With ``update_only`` only files
+    that already exist are refreshed. Results follow the order of
+    ``tool_ids``; a failing configurator is reported, not raised.
+    """
+    jobs = _collect_jobs(project_path, openspec_dir, tool_ids, update_only)
+    if not jobs:
+        return []
+
+    if not update_only:
+        for directory in sorted({Path(path).parent for job in jobs for path in job.paths}):
+            ensure_directory(str(directory))
+
+    if max_workers is None:
+        max_workers = min(DEFAULT_MAX_WORKERS, len(jobs), (os.cpu_count() or 1) + 4)
+
+    # Each job runs in a copy of the caller's context so track_writes() still sees its writes
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(await asyncio.gather(*(
+            loop.run_in_executor(executor, contextvars.copy_context().run, _run_job, job)
+            for job in jobs
+        )))
+
+
+def configure_tools(
+    project_path: str,
+    openspec_dir: str,
+    tool_ids: Sequence[str],
+    update_only: bool = False,
+) -> List[ConfiguratorResult]:
+    """Synchronous entry point for run_configurators, for CLI commands."""
+    return asyncio.run(run_configurators(project_path, openspec_dir, tool_ids, update_only))
+
+
+def _collect_jobs(
+    project_path: str, openspec_dir: str, tool_ids: Sequence[str], update_only: bool
+) -> List[_Job]:
+    """Build one job per registered configurator of each selected tool."""
+    jobs = []
+
+    for tool_id in dict.fromkeys(tool_ids):
+        tool = ToolRegistry.get(tool_id)
+        if tool and tool.is_available and tool.config_file_name:
+            config_path = Path(project_path) / tool.config_file_name
+            if not update_only or config_path.exists():
+                jobs.append(_Job(
+                    tool_id, "config",
+                    lambda tool=tool: tool.configure(project_path, openspec_dir),
+                    [str(config_path)],
+                ))
+
+        slash = SlashCommandRegistry.get(tool_id)
+        if slash and slash.is_available:
+            run = slash.update_existing if update_only else slash.generate_all
+            jobs.append(_Job(
+                tool_id, "slash",
+                lambda run=run: run(project_path, openspec_dir),
+                [str(Path(project_path) / target.path) for target in slash.get_targets()],
+            ))
+
+    return jobs
+
+
+def _run_job(job: _Job) -> ConfiguratorResult:
+    """Run a configurator coroutine to completion on a worker thread."""
+    try:
+        written = asyncio.run(job.run())
+    except Exception as e:
+        return ConfiguratorResult(job.tool_id, job.kind, error=e)
+    paths = written if isinstance(written, list) else job.paths
+    return ConfiguratorResult(job.tool_id, job.kind, paths=paths)
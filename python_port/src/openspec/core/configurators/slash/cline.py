@@ -12,9 +12,9 @@ class ClineSlashCommandConfigurator(SlashCommandConfigurator):
     
     # File paths for Cline slash commands
     _FILE_PATHS: Dict[str, str] = {
-        "proposal": ".cline/prompts/openspec/proposal.md",
-        "apply": ".cline/prompts/openspec/apply.md",
-        "archive": ".cline/prompts/openspec/archive.md"
+        "proposal": ".clinerules/openspec-proposal.md",
+        "apply": ".clinerules/openspec-apply.md",
+        "archive": ".clinerules/openspec-archive.md"
     }
     
     # Frontmatter for each command
@@ -12,22 +12,31 @@ class CursorSlashCommandConfigurator(SlashCommandConfigurator):
     
     # File paths for Cursor slash commands
     _FILE_PATHS: Dict[str, str] = {
-        "proposal": ".cursor/prompts/openspec/proposal.md",
-        "apply": ".cursor/prompts/openspec/apply.md",
-        "archive": ".cursor/prompts/openspec/archive.md"
+        "proposal": ".cursor/commands/openspec-proposal.md",
+        "apply": ".cursor/commands/openspec-apply.md",
+        "archive": ".cursor/commands/openspec-archive.md"
     }
     
     # Frontmatter for each command
     _FRONTMATTER: Dict[str, str] = {
-        "proposal": """# OpenSpec: Proposal
-
-Scaffold a new OpenSpec change and validate strictly.""",
-        "apply": """# OpenSpec: Apply
-
-Implement an approved OpenSpec change and keep tasks in sync.""",
-        "archive": """# OpenSpec: Archive
-
-Archive a deployed OpenSpec change and update specs."""
+        "proposal": """---
+name: /openspec-proposal
+id: openspec-proposal
+category: OpenSpec
+description: Scaffold a new OpenSpec change and validate strictly.
+---""",
+        "apply": """---
+name: /openspec-apply
+id: openspec-apply
+category: OpenSpec
+description: Implement an approved OpenSpec change and keep tasks in sync.
+---""",
+        "archive": """---
+name: /openspec-archive
+id: openspec-archive
+category: OpenSpec
+description: Archive a deployed OpenSpec change and update specs.
+---"""
     }
     
     def get_relative_path(self, command_id: str) -> str:
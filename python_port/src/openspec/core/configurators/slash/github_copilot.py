@@ -12,22 +12,28 @@ class GitHubCopilotSlashCommandConfigurator(SlashCommandConfigurator):
     
     # File paths for GitHub Copilot slash commands
     _FILE_PATHS: Dict[str, str] = {
-        "proposal": ".github/copilot/openspec/proposal.md",
-        "apply": ".github/copilot/openspec/apply.md",
-        "archive": ".github/copilot/openspec/archive.md"
+        "proposal": ".github/prompts/openspec-proposal.prompt.md",
+        "apply": ".github/prompts/openspec-apply.prompt.md",
+        "archive": ".github/prompts/openspec-archive.prompt.md"
     }
     
     # Frontmatter for each command
     _FRONTMATTER: Dict[str, str] = {
-        "proposal": """# OpenSpec: Proposal
+        "proposal": """---
+description: Scaffold a new OpenSpec change and validate strictly.
+---
 
-Scaffold a new OpenSpec change and validate strictly.""",
-        "apply": """# OpenSpec: Apply
+$ARGUMENTS""",
+        "apply": """---
+description: Implement an approved OpenSpec change and keep tasks in sync.
+---
 
-Implement an approved OpenSpec change and keep tasks in sync.""",
-        "archive": """# OpenSpec: Archive
+$ARGUMENTS""",
+        "archive": """---
+description: Archive a deployed OpenSpec change and update specs.
+---
 
-Archive a deployed OpenSpec change and update specs."""
+$ARGUMENTS"""
     }
     
     def get_relative_path(self, command_id: str) -> str:
@@ -12,22 +12,25 @@ class WindsurfSlashCommandConfigurator(SlashCommandConfigurator):
     
     # File paths for Windsurf slash commands
     _FILE_PATHS: Dict[str, str] = {
-        "proposal": ".windsurf/prompts/openspec/proposal.md",
-        "apply": ".windsurf/prompts/openspec/apply.md",
-        "archive": ".windsurf/prompts/openspec/archive.md"
+        "proposal": ".windsurf/workflows/openspec-proposal.md",
+        "apply": ".windsurf/workflows/openspec-apply.md",
+        "archive": ".windsurf/workflows/openspec-archive.md"
     }
     
     # Frontmatter for each command
     _FRONTMATTER: Dict[str, str] = {
-        "proposal": """# OpenSpec: Proposal
-
-Scaffold a new OpenSpec change and validate strictly.""",
-        "apply": """# OpenSpec: Apply
-
-Implement an approved OpenSpec change and keep tasks in sync.""",
-        "archive": """# OpenSpec: Archive
-
-Archive a deployed OpenSpec change and update specs."""
+        "proposal": """---
+description: Scaffold a new OpenSpec change and validate strictly.
+auto_execution_mode: 3
+---""",
+        "apply": """---
+description: Implement an approved OpenSpec change and keep tasks in sync.
+auto_execution_mode: 3
+---""",
+        "archive": """---
+description: Archive a deployed OpenSpec change and update specs.
+auto_execution_mode: 3
+---"""
     }
     
     def get_relative_path(self, command_id: str) -> str:
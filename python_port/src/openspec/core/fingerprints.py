@@ -0,0 +1,213 @@
+"""Base fingerprints for the requirements a change modifies.
+
+When a change is validated, the current text of every requirement it
+MODIFIES, REMOVES or RENAMES is hashed and stored in ``changes/<id>/meta.json``.
+At archive time the live spec is hashed again; a different hash means the
+requirement moved on after the change was authored and archiving the delta
+would silently overwrite someone else's edit.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .parsers.requirement_blocks import (
+    REQUIREMENT_HEADER_PATTERN,
+    RequirementBlock,
+    index_requirement_blocks,
+    normalize_line_endings,
+    scenario_id,
+    split_scenarios,
+)
+from ..utils.storage import LOCAL_STORAGE, Storage
+
+META_FILE_NAME = "meta.json"
+META_VERSION = 1
+HASH_PREFIX = "sha256:"
+
+
+@dataclass
+class StaleRequirement:
+    """A requirement whose live text no longer matches the recorded base."""
+    spec_name: str
+    requirement: str
+    operation: str
+    reason: str  # "changed" or "missing"
+
+    def __str__(self) -> str:
+        if self.reason == "missing":
+            detail = "no longer exists in the spec"
+        else:
+            detail = (
+                "changed in the spec since the change was authored "
+                "(run 'openspec change sync' to rebase)"
+            )
+        return f"{self.spec_name}: {self.operation} requirement '{self.requirement}' {detail}"
+
+
+def canonicalize_requirement(raw: str) -> str:
+    """Reduce a requirement block to a canonical form for hashing.
+
+    Line endings, trailing whitespace, runs of blank lines and spacing in the
+    header are normalized so purely cosmetic edits do not count as changes.
+    """
+    lines = [line.rstrip() for line in normalize_line_endings(raw).split("\n")]
+
+    canonical = []
+    for line in lines:
+        if not line and (not canonical or not canonical[-1]):
+            continue
+        header_match = REQUIREMENT_HEADER_PATTERN.match(line)
+        if header_match:
+            line = f"### Requirement: {header_match.group(1).strip()}"
+        else:
+            line = re.sub(r"^(#+)\s+", r"\1 ", line)
+        canonical.append(line)
+
+    return "\n".join(canonical).strip("\n")
+
+
+def fingerprint_requirement(raw: str) -> str:
+    """Return the SHA-256 fingerprint of a requirement block's canonical form."""
+    digest = hashlib.sha256(canonicalize_requirement(raw).encode("utf-8")).hexdigest()
+    return f"{HASH_PREFIX}{digest}"
+
+
+def read_change_meta(change_path: Path, storage: Optional[Storage] = None) -> Dict[str, Any]:
+    """Read a change's meta.json, or return an empty skeleton."""
+    storage = storage or LOCAL_STORAGE
+    meta_path = Path(change_path) / META_FILE_NAME
+    if storage.is_file(meta_path):
+        try:
+            meta = json.loads(storage.read_text(meta_path))
+            if isinstance(meta, dict):
+                meta.setdefault("version", META_VERSION)
+                meta.setdefault("bases", {})
+                return meta
+        except ValueError:
+            pass
+    return {"version": META_VERSION, "bases": {}}
+
+
+def write_change_meta(change_path: Path, meta: Dict[str, Any], storage: Optional[Storage] = None) -> None:
+    """Write a change's meta.json."""
+    (storage or LOCAL_STORAGE).write_text(Path(change_path) / META_FILE_NAME, render_change_meta(meta))
+
+
+def render_change_meta(meta: Dict[str, Any]) -> str:
+    """The text of a meta.json, for writers that stage files themselves."""
+    meta.setdefault("createdAt", datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    return json.dumps(meta, indent=2, ensure_ascii=False)
+
+
+def delta_targets(delta: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """List ``(requirement name, operation)`` pairs a delta expects to exist."""
+    targets = []
+    for req in delta.get("modified_requirements", []):
+        targets.append((req.get("title", ""), "MODIFIED"))
+    for req in delta.get("removed_requirements", []):
+        targets.append((req.get("title", ""), "REMOVED"))
+    for rename in delta.get("renamed_requirements", []):
+        targets.append((rename["from"], "RENAMED"))
+    return targets
+
+
+def live_requirement_blocks(plan: Any) -> Dict[str, RequirementBlock]:
+    """Index the requirement blocks of a plan's already-parsed main spec."""
+    if plan.existing is None:
+        return {}
+    return index_requirement_blocks(plan.existing.get("raw_content", ""))
+
+
+def record_base_fingerprints(change_path: Path, plans: Sequence[Any], storage: Optional[Storage] = None) -> int:
+    """Record fingerprints for targeted requirements that have none yet.
+
+    Existing entries are kept as they are: they describe what the change was
+    authored against, and refreshing them would hide divergence. Entries for
+    requirements the delta no longer targets are dropped. Returns the number
+    of newly recorded fingerprints.
+    """
+    meta = read_change_meta(change_path, storage)
+    old_bases = meta.get("bases", {})
+    bases: Dict[str, Dict[str, Any]] = {}
+    recorded = 0
+
+    for plan in plans:
+        live_blocks = live_requirement_blocks(plan)
+        spec_bases = {}
+        for name, operation in delta_targets(plan.delta):
+            previous = old_bases.get(plan.spec_name, {}).get(name)
+            if previous:
+                spec_bases[name] = previous
+            elif name in live_blocks:
+                raw = live_blocks[name].raw
+                spec_bases[name] = {
+                    "operation": operation,
+                    "hash": fingerprint_requirement(raw),
+                    "text": raw,
+                }
+                recorded += 1
+        if spec_bases:
+            bases[plan.spec_name] = spec_bases
+
+    if bases != old_bases:
+        meta["bases"] = bases
+        write_change_meta(change_path, meta, storage)
+
+    return recorded
+
+
+def find_stale_requirements(
+    change_path: Path, plans: Sequence[Any], storage: Optional[Storage] = None
+) -> List[StaleRequirement]:
+    """Compare recorded base fingerprints against the live specs.
+
+    Each targeted requirement costs one dictionary lookup and one hash; the
+    requirement text is never re-diffed. Requirements without a recorded base
+    cannot be checked and are skipped. A requirement modified through
+    scenario-level operations only counts as stale when one of the scenarios
+    it modifies or removes changed.
+    """
+    bases = read_change_meta(change_path, storage).get("bases", {})
+    stale = []
+
+    for plan in plans:
+        spec_bases = bases.get(plan.spec_name)
+        if not spec_bases:
+            continue
+        live_blocks = live_requirement_blocks(plan)
+        scenario_ops = {
+            req.get("title"): req["scenario_ops"]
+            for req in plan.delta.get("modified_requirements", [])
+            if req.get("scenario_ops")
+        }
+        for name, operation in delta_targets(plan.delta):
+            base = spec_bases.get(name)
+            if not base:
+                continue
+            live = live_blocks.get(name)
+            if live is None:
+                stale.append(StaleRequirement(plan.spec_name, name, operation, "missing"))
+            elif fingerprint_requirement(live.raw) == base.get("hash"):
+                continue
+            elif operation != "MODIFIED" or name not in scenario_ops or _targeted_scenarios_changed(
+                base.get("text", ""), live.raw, scenario_ops[name]
+            ):
+                stale.append(StaleRequirement(plan.spec_name, name, operation, "changed"))
+
+    return stale
+
+
+def _targeted_scenarios_changed(base: str, live: str, ops: Dict[str, Any]) -> bool:
+    """Whether any scenario modified or removed by ``ops`` differs from its base."""
+    base_parts = {scenario_id(k): v for k, v in split_scenarios(base).items() if k}
+    live_parts = {scenario_id(k): v for k, v in split_scenarios(live).items() if k}
+    targeted = [scenario["id"] for scenario in ops.get("modified", [])] + list(ops.get("removed", []))
+    return any(
+        canonicalize_requirement(base_parts.get(sid, "")) != canonicalize_requirement(live_parts.get(sid, ""))
+        for sid in targeted
+    )
@@ -0,0 +1,187 @@
+"""Manifest of generated files, for detecting drift without regenerating them."""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config import OPENSPEC_DIR_NAME
+from ..utils.file_markers import scan_markers
+from ..utils.file_system import write_file
+
+MANIFEST_FILE_NAME = ".manifest.json"
+MANIFEST_VERSION = 1
+
+# Scaffolded once for the user to fill in, so edits to them are not drift
+USER_OWNED_FILES = frozenset({f"{OPENSPEC_DIR_NAME}/project.md"})
+
+
+@dataclass
+class ManifestEntry:
+    """A generated file and the hash of the region OpenSpec manages in it."""
+    path: str
+    kind: str  # "block" for a marker-managed region, "file" for the whole file
+    hash: str
+    size: int
+    mtime_ns: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "kind": self.kind,
+            "hash": self.hash,
+            "size": self.size,
+            "mtimeNs": self.mtime_ns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ManifestEntry":
+        return cls(data["path"], data["kind"], data["hash"], data["size"], data["mtimeNs"])
+
+
+@dataclass
+class Drift:
+    """A generated file that no longer matches the manifest."""
+    path: str
+    reason: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"path": self.path, "reason": self.reason}
+
+
+@dataclass
+class ManifestCheck:
+    """Result of checking a project's generated files against its manifest."""
+    project_path: Path
+    checked: int = 0
+    drift: List[Drift] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.drift
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "project": str(self.project_path),
+            "checked": self.checked,
+            "ok": self.ok,
+            "drift": [item.to_dict() for item in self.drift],
+        }
+
+
+def manifest_path(project_path: Path) -> Path:
+    """Location of a project's manifest."""
+    return Path(project_path) / OPENSPEC_DIR_NAME / MANIFEST_FILE_NAME
+
+
+def managed_region(content: str) -> Optional[str]:
+    """The text between the OpenSpec markers, or None if the file has none."""
+    return scan_markers(content).body()
+
+
+def record_manifest(project_path: Path, paths: Iterable[str]) -> Path:
+    """Record the generated ``paths`` in the project's manifest.
+
+    Entries of files not among ``paths`` are kept, so a partial refresh
+    (e.g. ``update --agents``) does not forget the other generated files.
+    """
+    project_path = Path(project_path).resolve()
+    existing = _load(project_path)
+    entries = {entry.path: entry for entry in existing.get("files", [])}
+
+    for path in paths:
+        absolute = Path(path).resolve()
+        try:
+            relative = absolute.relative_to(project_path).as_posix()
+        except ValueError:
+            continue
+        if relative in USER_OWNED_FILES or not absolute.is_file():
+            continue
+        stat = absolute.stat()
+        kind, digest = _hash_managed(absolute.read_text(encoding="utf-8"))
+        entries[relative] = ManifestEntry(relative, kind, digest, stat.st_size, stat.st_mtime_ns)
+
+    target = manifest_path(project_path)
+    write_file(str(target), json.dumps({
+        "version": MANIFEST_VERSION,
+        "templateVersion": _template_version(),
+        "files": [entries[key].to_dict() for key in sorted(entries)],
+    }, indent=2) + "\n")
+    return target
+
+
+def check_manifest(project_path: Path) -> ManifestCheck:
+    """Compare generated files with the manifest.
+
+    A file whose size and mtime match its entry is trusted without being
+    read; otherwise only its managed region is hashed, so edits outside
+    the markers are not drift. A manifest written by another template
+    version counts as drift too, since a regenerate would change files.
+    """
+    project_path = Path(project_path).resolve()
+    result = ManifestCheck(project_path)
+
+    data = _load(project_path)
+    if not data:
+        result.drift.append(Drift(f"{OPENSPEC_DIR_NAME}/{MANIFEST_FILE_NAME}", "missing, run 'openspec update'"))
+        return result
+    installed = _template_version()
+    if data.get("templateVersion") != installed:
+        result.drift.append(Drift(
+            f"{OPENSPEC_DIR_NAME}/{MANIFEST_FILE_NAME}",
+            f"generated by {data.get('templateVersion')}, installed {installed}",
+        ))
+
+    for entry in data["files"]:
+        result.checked += 1
+        reason = _entry_drift(project_path / entry.path, entry)
+        if reason:
+            result.drift.append(Drift(entry.path, reason))
+
+    return result
+
+
+def _entry_drift(path: Path, entry: ManifestEntry) -> Optional[str]:
+    """Why a file no longer matches its entry, or None if it still does."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+    if stat.st_size == entry.size and stat.st_mtime_ns == entry.mtime_ns:
+        return None
+
+    try:
+        kind, digest = _hash_managed(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return "unreadable"
+    if kind != entry.kind:
+        return "OpenSpec markers removed" if entry.kind == "block" else "OpenSpec markers added"
+    if digest != entry.hash:
+        return "managed block modified" if kind == "block" else "modified"
+    return None
+
+
+def _hash_managed(content: str):
+    """The kind of managed region in ``content`` and its SHA-256."""
+    region = managed_region(content)
+    kind = "file" if region is None else "block"
+    text = content if region is None else region
+    return kind, hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _template_version() -> str:
+    """Version of the templates generated files come from."""
+    from .. import __version__
+    return __version__
+
+
+def _load(project_path: Path) -> Dict[str, Any]:
+    """Read the manifest, or an empty dict if it is missing or unreadable."""
+    try:
+        data = json.loads(manifest_path(project_path).read_text(encoding="utf-8"))
+        data["files"] = [ManifestEntry.from_dict(item) for item in data.get("files", [])]
+        return data
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
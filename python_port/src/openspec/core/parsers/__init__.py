@@ -1,5 +1,6 @@
 """Parser modules for OpenSpec."""
 
-from .markdown_parser import parse_markdown_file, extract_json_from_markdown
+from .markdown_parser import parse_markdown_file, extract_json_from_markdown, extract_json_block
+from .parallel import parse_many
 
-__all__ = ["parse_markdown_file", "extract_json_from_markdown"]
\ No newline at end of file
+__all__ = ["parse_markdown_file", "extract_json_from_markdown", "extract_json_block", "parse_many"]
@@ -4,6 +4,8 @@ import json
 import re
 from typing import Optional, Dict, Any
 
+from .requirement_blocks import SCENARIO_DIRECTIVE_PATTERN, parse_renamed_pairs, scenario_id
+
 
 class MarkdownParser:
     """Parser for OpenSpec markdown files."""
@@ -58,12 +60,14 @@ class MarkdownParser:
         added_requirements = self._parse_requirements(sections.get("added requirements", ""))
         modified_requirements = self._parse_requirements(sections.get("modified requirements", ""))
         removed_requirements = self._parse_requirements(sections.get("removed requirements", ""))
+        renamed_requirements = parse_renamed_pairs(sections.get("renamed requirements", ""))
         
         return {
             "title": self._extract_title(content),
             "added_requirements": added_requirements,
             "modified_requirements": modified_requirements,
             "removed_requirements": removed_requirements,
+            "renamed_requirements": renamed_requirements,
             "configuration": result.get("json"),
             "sections": sections,
             "raw_content": content
@@ -112,13 +116,22 @@ class MarkdownParser:
         return sections
     
     def _parse_requirements(self, requirements_text: str) -> list:
-        """Parse requirements section into structured requirements."""
+        """Parse requirements section into structured requirements.
+        
+        A requirement may nest ``#### ADDED Scenarios``, ``#### MODIFIED
+        Scenarios`` and ``#### REMOVED Scenarios`` directives. Scenarios under
+        them are collected in ``scenario_ops`` instead of ``scenarios``, so a
+        MODIFIED requirement can touch single scenarios.
+        """
         requirements = []
         lines = requirements_text.split('\n')
         current_requirement = None
+        current_scenario = None
+        directive = None
         
         for line in lines:
             line = line.strip()
+            directive_match = SCENARIO_DIRECTIVE_PATTERN.match(line)
             if line.startswith('### Requirement:') or line.startswith('#### Requirement:'):
                 # Save previous requirement
                 if current_requirement:
@@ -133,14 +146,32 @@ class MarkdownParser:
                     "change_description": "",
                     "removal_reason": ""
                 }
+                current_scenario = None
+                directive = None
+            elif directive_match and current_requirement:
+                directive = directive_match.group(1).lower()
+                current_requirement.setdefault(
+                    "scenario_ops", {"added": [], "modified": [], "removed": []}
+                )
+                current_scenario = None
             elif line.startswith('#### Scenario:') or line.startswith('##### Scenario:'):
                 if current_requirement:
                     title_start = 14 if line.startswith('#### Scenario:') else 15
+                    title = line[title_start:].strip()
                     current_scenario = {
-                        "title": line[title_start:].strip(),
+                        "id": scenario_id(title),
+                        "title": title,
                         "steps": []
                     }
-                    current_requirement["scenarios"].append(current_scenario)
+                    if directive == "removed":
+                        current_requirement["scenario_ops"]["removed"].append(current_scenario["id"])
+                    elif directive:
+                        current_requirement["scenario_ops"][directive].append(current_scenario)
+                    else:
+                        current_requirement["scenarios"].append(current_scenario)
+            elif directive == "removed" and line.startswith('- ') and not line.startswith('- **'):
+                # Removed scenarios may also be listed by title or ID
+                current_requirement["scenario_ops"]["removed"].append(scenario_id(line[2:].strip('` ')))
             elif line.startswith('**CHANGE:**') and current_requirement:
                 # Change description for modified requirements
                 change_desc = line[11:].strip()
@@ -151,8 +182,8 @@ class MarkdownParser:
                 current_requirement["removal_reason"] = reason
             elif line.startswith('- **') and current_requirement:
                 # Scenario step
-                if current_requirement["scenarios"]:
-                    current_requirement["scenarios"][-1]["steps"].append(line)
+                if current_scenario is not None:
+                    current_scenario["steps"].append(line)
             elif line and current_requirement and not line.startswith('#'):
                 # Add to description
                 if current_requirement["description"]:
@@ -221,14 +252,10 @@ def parse_markdown_file(content: str) -> Dict[str, Any]:
 def extract_json_from_markdown(content: str) -> Optional[Dict[str, Any]]:
     """Extract JSON configuration from markdown content."""
     
-    # Look for JSON code blocks
-    json_pattern = r'```json\s*\n(.*?)\n```'
-    matches = re.findall(json_pattern, content, re.DOTALL)
+    json_str = extract_json_block(content)
     
-    if matches:
+    if json_str is not None:
         try:
-            # Use the last JSON block found
-            json_str = matches[-1].strip()
             return json.loads(json_str)
         except json.JSONDecodeError:
             return None
@@ -236,6 +263,24 @@ def extract_json_from_markdown(content: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+def extract_json_block(content: str) -> Optional[str]:
+    """Extract the raw text of the last JSON code block, without parsing it."""
+    
+    # Cheap check first - most spec files have no JSON block at all
+    if '```json' not in content:
+        return None
+    
+    # Look for JSON code blocks
+    json_pattern = r'```json\s*\n(.*?)\n```'
+    matches = re.findall(json_pattern, content, re.DOTALL)
+    
+    if matches:
+        # Use the last JSON block found
+        return matches[-1].strip()
+    
+    return None
+
+
 def _extract_markdown_sections(content: str) -> Dict[str, str]:
     """Extract sections from markdown content."""
     
@@ -0,0 +1,173 @@
+"""Raw requirement block extraction for OpenSpec markdown files.
+
+Unlike MarkdownParser, which builds structured requirement dicts, these
+helpers keep each requirement's exact source text so it can be hashed,
+compared and rewritten in place.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+REQUIREMENT_HEADER_PATTERN = re.compile(r'^#{3,4}\s*Requirement:\s*(.+?)\s*$')
+SECTION_HEADER_PATTERN = re.compile(r'^##\s+(.+?)\s*$')
+RENAMED_FROM_PATTERN = re.compile(r'^\s*-?\s*FROM:\s*`?#{3,4}\s*Requirement:\s*(.+?)`?\s*$')
+RENAMED_TO_PATTERN = re.compile(r'^\s*-?\s*TO:\s*`?#{3,4}\s*Requirement:\s*(.+?)`?\s*$')
+SCENARIO_HEADER_PATTERN = re.compile(r'^#{4,5}\s*Scenario:\s*(.+?)\s*$')
+SCENARIO_DIRECTIVE_PATTERN = re.compile(r'^#{4}\s+(ADDED|MODIFIED|REMOVED)\s+Scenarios\s*$', re.IGNORECASE)
+
+
+@dataclass
+class RequirementBlock:
+    """A requirement's source text, from its header to the next block."""
+    name: str
+    header_line: str
+    raw: str
+    section: str
+    start_line: int
+    end_line: int
+
+
+def normalize_line_endings(content: str) -> str:
+    """Convert CRLF and CR line endings to LF."""
+    return content.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def extract_requirement_blocks(content: str, section: Optional[str] = None) -> List[RequirementBlock]:
+    """Extract all requirement blocks from markdown content.
+
+    Each block records the lower-cased ``## `` section it appears under, so
+    the same helper works for main specs (``requirements``) and change deltas
+    (``added requirements``, ``modified requirements``, ...). Pass ``section``
+    to keep only blocks from that section. Line numbers are 0-based and
+    ``end_line`` is exclusive.
+    """
+    lines = normalize_line_endings(content).split('\n')
+    blocks = []
+    current_section = ""
+    i = 0
+
+    while i < len(lines):
+        line = lines[i]
+        section_match = SECTION_HEADER_PATTERN.match(line)
+        if section_match:
+            current_section = section_match.group(1).strip().lower()
+            i += 1
+            continue
+
+        header_match = REQUIREMENT_HEADER_PATTERN.match(line)
+        if not header_match:
+            i += 1
+            continue
+
+        start = i
+        i += 1
+        while i < len(lines) and not _ends_block(lines[i]):
+            i += 1
+
+        # Trailing blank lines belong to the gap between blocks, not the block
+        end = i
+        while end > start + 1 and not lines[end - 1].strip():
+            end -= 1
+
+        if section is None or current_section == section.lower():
+            blocks.append(RequirementBlock(
+                name=header_match.group(1).strip(),
+                header_line=line,
+                raw='\n'.join(lines[start:end]),
+                section=current_section,
+                start_line=start,
+                end_line=end
+            ))
+
+    return blocks
+
+
+def scenario_id(title: str) -> str:
+    """Return the stable ID of a scenario: its title as a lower-case slug.
+
+    Scenario-level delta operations match scenarios by ID, so changes in case
+    or punctuation of a title do not break the match.
+    """
+    return re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
+
+
+def index_requirement_blocks(content: str, section: Optional[str] = None) -> Dict[str, RequirementBlock]:
+    """Map requirement names to their blocks. Later duplicates win."""
+    return {block.name: block for block in extract_requirement_blocks(content, section)}
+
+
+def parse_renamed_pairs(section_body: str) -> List[Dict[str, str]]:
+    """Parse ``- FROM:`` / ``- TO:`` pairs from a RENAMED Requirements section."""
+    pairs = []
+    current: Dict[str, str] = {}
+
+    for line in normalize_line_endings(section_body).split('\n'):
+        from_match = RENAMED_FROM_PATTERN.match(line)
+        to_match = RENAMED_TO_PATTERN.match(line)
+        if from_match:
+            current = {"from": from_match.group(1).strip()}
+        elif to_match and "from" in current:
+            current["to"] = to_match.group(1).strip()
+            pairs.append(current)
+            current = {}
+
+    return pairs
+
+
+def replace_requirement_block(content: str, block: RequirementBlock, new_raw: str) -> str:
+    """Return ``content`` with ``block`` replaced by ``new_raw``."""
+    lines = normalize_line_endings(content).split('\n')
+    new_lines = normalize_line_endings(new_raw).rstrip('\n').split('\n')
+    return '\n'.join(lines[:block.start_line] + new_lines + lines[block.end_line:])
+
+
+def split_scenarios(raw: str) -> Dict[str, str]:
+    """Split a requirement block into its head and scenarios, keyed by title.
+
+    The head (requirement header and description) is stored under the empty
+    key. Dict order follows the block.
+    """
+    parts: Dict[str, List[str]] = {"": []}
+    key = ""
+
+    for line in normalize_line_endings(raw).split('\n'):
+        match = SCENARIO_HEADER_PATTERN.match(line)
+        if match:
+            key = match.group(1).strip()
+            parts[key] = []
+        parts[key].append(line)
+
+    return {k: '\n'.join(lines).strip('\n') for k, lines in parts.items()}
+
+
+def render_scenario(scenario: Dict[str, Any]) -> str:
+    """Render a parsed scenario as main spec markdown."""
+    return '\n'.join([f"#### Scenario: {scenario.get('title', 'Untitled')}", *scenario.get('steps', [])])
+
+
+def apply_scenario_ops(raw: str, ops: Dict[str, Any]) -> str:
+    """Apply scenario-level delta operations to a requirement block's text.
+
+    MODIFIED scenarios replace the scenario with the same ID, REMOVED ones are
+    dropped and ADDED ones are appended. Untouched scenarios and the
+    requirement head keep their exact source text.
+    """
+    parts = split_scenarios(raw)
+    keys_by_id = {scenario_id(key): key for key in parts if key}
+
+    for scenario in ops.get("modified", []):
+        key = keys_by_id.get(scenario["id"])
+        if key is not None:
+            parts[key] = render_scenario(scenario)
+
+    removed = set(ops.get("removed", []))
+    kept = [text for key, text in parts.items() if not key or scenario_id(key) not in removed]
+    kept.extend(render_scenario(scenario) for scenario in ops.get("added", []))
+
+    return '\n\n'.join(text for text in kept if text.strip())
+
+
+def _ends_block(line: str) -> bool:
+    """Whether a line starts a new requirement block or section."""
+    return bool(REQUIREMENT_HEADER_PATTERN.match(line) or re.match(r'^#{1,2}\s', line))
@@ -0,0 +1,204 @@
+"""Three-way merging of requirement blocks.
+
+Used by ``openspec change sync`` to rebase a change's MODIFIED requirement
+onto a spec that moved on since the change was authored. Requirements are
+merged scenario by scenario first, so edits to different scenarios never
+conflict, and only scenarios edited on both sides fall back to a line-level
+diff3.
+"""
+
+import re
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .parsers.requirement_blocks import normalize_line_endings, split_scenarios
+
+CONFLICT_START = "<<<<<<< change"
+CONFLICT_SEPARATOR = "======="
+CONFLICT_END = ">>>>>>> current"
+CONFLICT_MARKER_PATTERN = re.compile(r'^(<{7} |={7}$|>{7} )', re.MULTILINE)
+
+
+@dataclass
+class MergeResult:
+    """Outcome of a three-way requirement merge."""
+    text: str
+    conflicts: int = 0
+    conflicting_parts: List[str] = field(default_factory=list)
+
+    @property
+    def is_clean(self) -> bool:
+        return self.conflicts == 0
+
+
+def has_conflict_markers(content: str) -> bool:
+    """Whether text contains unresolved merge conflict markers."""
+    return bool(CONFLICT_MARKER_PATTERN.search(normalize_line_endings(content)))
+
+
+def merge_requirement(base: str, current: str, change: str) -> MergeResult:
+    """Three-way merge a requirement block.
+
+    ``base`` is the requirement as the change author saw it, ``current`` is
+    the live spec's version and ``change`` is the change's MODIFIED block.
+    """
+    base_parts = split_scenarios(base)
+    current_parts = split_scenarios(current)
+    change_parts = split_scenarios(change)
+
+    merged_parts = []
+    conflicts = 0
+    conflicting = []
+
+    for key in _merged_order(current_parts, change_parts):
+        text, part_conflicts = _merge_part(
+            base_parts.get(key), current_parts.get(key), change_parts.get(key)
+        )
+        if text is not None:
+            merged_parts.append(text)
+        if part_conflicts:
+            conflicts += part_conflicts
+            conflicting.append(key or "(description)")
+
+    merged = "\n\n".join(part.strip("\n") for part in merged_parts if part.strip())
+    return MergeResult(text=merged, conflicts=conflicts, conflicting_parts=conflicting)
+
+
+def diff3_merge(
+    base: Sequence[str], current: Sequence[str], change: Sequence[str]
+) -> Tuple[List[str], int]:
+    """Line-level diff3 merge. Returns the merged lines and the conflict count.
+
+    The two pairwise diffs against ``base`` give the regions where all three
+    versions agree; a walk over those regions then takes whichever side
+    changed each gap, or emits conflict markers when both did. Lines shared
+    at the start and end are matched in linear time; only the span between
+    goes to ``difflib.SequenceMatcher``, which is quadratic in the worst
+    case. Inputs are the lines of one scenario or description, so that span
+    stays small.
+    """
+    merged: List[str] = []
+    conflicts = 0
+    i_base = i_cur = i_chg = 0
+
+    for base_start, base_end, cur_start, cur_end, chg_start, chg_end in _sync_regions(base, current, change):
+        cur_gap = current[i_cur:cur_start]
+        chg_gap = change[i_chg:chg_start]
+        base_gap = base[i_base:base_start]
+
+        if cur_gap or chg_gap:
+            if cur_gap == chg_gap:
+                merged.extend(cur_gap)
+            elif cur_gap == base_gap:
+                merged.extend(chg_gap)
+            elif chg_gap == base_gap:
+                merged.extend(cur_gap)
+            else:
+                merged.append(CONFLICT_START)
+                merged.extend(chg_gap)
+                merged.append(CONFLICT_SEPARATOR)
+                merged.extend(cur_gap)
+                merged.append(CONFLICT_END)
+                conflicts += 1
+
+        merged.extend(base[base_start:base_end])
+        i_base, i_cur, i_chg = base_end, cur_end, chg_end
+
+    return merged, conflicts
+
+
+def _sync_regions(
+    base: Sequence[str], current: Sequence[str], change: Sequence[str]
+) -> List[Tuple[int, int, int, int, int, int]]:
+    """Find base ranges matched identically in both other versions."""
+    cur_blocks = _matching_blocks(base, current)
+    chg_blocks = _matching_blocks(base, change)
+
+    regions = []
+    ci = hi = 0
+    while ci < len(cur_blocks) and hi < len(chg_blocks):
+        c_base, c_other, c_len = cur_blocks[ci]
+        h_base, h_other, h_len = chg_blocks[hi]
+
+        start = max(c_base, h_base)
+        end = min(c_base + c_len, h_base + h_len)
+        if start < end:
+            regions.append((
+                start, end,
+                c_other + (start - c_base), c_other + (end - c_base),
+                h_other + (start - h_base), h_other + (end - h_base),
+            ))
+
+        if c_base + c_len < h_base + h_len:
+            ci += 1
+        else:
+            hi += 1
+
+    # Sentinel so the trailing gap is merged too
+    regions.append((len(base), len(base), len(current), len(current), len(change), len(change)))
+    return regions
+
+
+def _matching_blocks(a: Sequence[str], b: Sequence[str]) -> List[Tuple[int, int, int]]:
+    """``(i, j, n)`` runs where ``a[i:i+n] == b[j:j+n]``, ending with ``(len(a), len(b), 0)``.
+
+    The common prefix and suffix are matched directly, so an edit in the
+    middle of a long part only diffs the lines around it.
+    """
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[len(a) - 1 - suffix] == b[len(b) - 1 - suffix]:
+        suffix += 1
+
+    blocks = [(0, 0, prefix)] if prefix else []
+    middle = SequenceMatcher(
+        None, a[prefix:len(a) - suffix], b[prefix:len(b) - suffix], autojunk=False
+    ).get_matching_blocks()
+    blocks.extend((i + prefix, j + prefix, n) for i, j, n in middle if n)
+    if suffix:
+        blocks.append((len(a) - suffix, len(b) - suffix, suffix))
+    blocks.append((len(a), len(b), 0))
+    return blocks
+
+
+def _merge_part(
+    base: Optional[str], current: Optional[str], change: Optional[str]
+) -> Tuple[Optional[str], int]:
+    """Merge one part (head or scenario). ``None`` means the part is absent."""
+    if current == change:
+        return current, 0
+    if base == current:
+        return change, 0
+    if base == change:
+        return current, 0
+    if current is None or change is None:
+        # One side deleted a part the other side edited; the author decides
+        change_lines = change.split("\n") if change is not None else []
+        current_lines = current.split("\n") if current is not None else []
+        lines = [CONFLICT_START, *change_lines, CONFLICT_SEPARATOR, *current_lines, CONFLICT_END]
+        return "\n".join(lines), 1
+
+    base_lines = base.split("\n") if base is not None else []
+    lines, conflicts = diff3_merge(base_lines, current.split("\n"), change.split("\n"))
+    return "\n".join(lines), conflicts
+
+
+def _merged_order(current: Dict[str, str], change: Dict[str, str]) -> List[str]:
+    """Order parts as in the live spec, slotting in parts only the change has.
+
+    A part that only exists in the change is placed right after the part that
+    precedes it in the change, keeping the result deterministic.
+    """
+    order = list(current)
+    change_keys = list(change)
+    for index, key in enumerate(change_keys):
+        if key in order:
+            continue
+        previous = change_keys[index - 1] if index > 0 else None
+        position = order.index(previous) + 1 if previous in order else len(order)
+        order.insert(position, key)
+    return order
@@ -1,8 +1,22 @@
-"""Schema definitions for OpenSpec."""
+"""Schema definitions for OpenSpec.
 
-from .base import RequirementSchema
-from .change import ChangeSchema, DeltaSchema, DeltaOperation, Change, Delta
-from .spec import SpecSchema, Spec
+The schema classes are built on pydantic, which is comparatively slow to
+import. They are loaded on first attribute access so commands that never
+touch a JSON block do not pay for it.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    "RequirementSchema": ".base",
+    "ChangeSchema": ".change",
+    "DeltaSchema": ".change",
+    "DeltaOperation": ".change",
+    "Change": ".change",
+    "Delta": ".change",
+    "SpecSchema": ".spec",
+    "Spec": ".spec",
+}
 
 __all__ = [
     "RequirementSchema",
@@ -13,4 +27,12 @@ __all__ = [
     "Delta",
     "SpecSchema",
     "Spec",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
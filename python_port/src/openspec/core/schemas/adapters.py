@@ -0,0 +1,82 @@
+"""Cached pydantic type adapters for validating JSON configuration blocks.
+
+Importing this module imports pydantic; callers should import it lazily,
+only once a JSON block has actually been found.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from pydantic import TypeAdapter, ValidationError
+
+from .change import Change
+from .spec import Spec
+
+SCHEMA_TYPES: Dict[str, Any] = {
+    "change": Change,
+    "spec": Spec,
+}
+
+_ADAPTERS: Dict[str, TypeAdapter] = {}
+
+
+@dataclass
+class SchemaIssue:
+    """A single schema validation problem with its location in the JSON block."""
+    location: Tuple[Union[str, int], ...]
+    message: str
+    error_type: str
+
+    @property
+    def path(self) -> str:
+        """Dotted path to the offending value, e.g. ``deltas.0.operation``."""
+        return ".".join(str(part) for part in self.location)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {"path": self.path, "message": self.message, "type": self.error_type}
+
+    def __str__(self) -> str:
+        if self.path:
+            return f"{self.path}: {self.message}"
+        return self.message
+
+
+def get_type_adapter(kind: str) -> TypeAdapter:
+    """Return the cached TypeAdapter for a schema kind (``change`` or ``spec``)."""
+    adapter = _ADAPTERS.get(kind)
+    if adapter is None:
+        if kind not in SCHEMA_TYPES:
+            raise ValueError(f"Unknown schema kind: {kind}")
+        adapter = TypeAdapter(SCHEMA_TYPES[kind])
+        _ADAPTERS[kind] = adapter
+    return adapter
+
+
+def validate_json_block(
+    kind: str, raw: Union[str, bytes]
+) -> Tuple[Optional[Any], List[SchemaIssue]]:
+    """Validate a raw JSON block against the schema for ``kind``.
+
+    The JSON text is handed straight to pydantic's ``validate_json`` so it is
+    parsed and validated in one pass. Returns the validated model (or None)
+    and the list of issues found.
+    """
+    try:
+        return get_type_adapter(kind).validate_json(raw), []
+    except ValidationError as e:
+        return None, [
+            SchemaIssue(
+                location=tuple(error.get("loc", ())),
+                message=error.get("msg", ""),
+                error_type=error.get("type", ""),
+            )
+            for error in e.errors(include_url=False)
+        ]
+
+
+def validate_json_blocks(
+    blocks: Iterable[Tuple[str, Union[str, bytes]]]
+) -> List[Tuple[Optional[Any], List[SchemaIssue]]]:
+    """Validate many ``(kind, raw_json)`` blocks, reusing the cached adapters."""
+    return [validate_json_block(kind, raw) for kind, raw in blocks]
@@ -0,0 +1,189 @@
+"""Requirement provenance: which archived change last touched each requirement.
+
+Archived change deltas are replayed oldest first (in archive index order)
+into an index of spec -> requirement -> origin, with a per-scenario origin
+inside each requirement. The index is cached in
+``openspec/.cache/blame.json`` together with the archive directories it
+has replayed; when new changes are archived only those are replayed, so
+keeping the index current costs O(delta). If the archive history changed
+in any other way (an entry removed or inserted in the middle) the index
+is rebuilt from scratch.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .archive_index import ArchiveEntry, ArchiveIndex, read_archived_deltas
+from .archive_pack import PackStore
+from .config import OPENSPEC_DIR_NAME
+from .parsers.markdown_parser import MarkdownParser
+from ..utils.file_system import read_file, read_json_file, write_json_file
+
+CACHE_DIR_NAME = ".cache"
+CACHE_FILE_NAME = "blame.json"
+CACHE_VERSION = 1
+
+
+@dataclass
+class ScenarioBlame:
+    """Origin of one scenario of the current spec."""
+    title: str
+    changed_by: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"title": self.title, "lastChangedBy": self.changed_by}
+
+
+@dataclass
+class RequirementBlame:
+    """Origin of one requirement of the current spec.
+
+    Origins are archive directory names (``YYYY-MM-DD-<id>``); None means
+    the requirement predates the archive history or was edited by hand.
+    """
+    title: str
+    introduced_by: Optional[str]
+    changed_by: Optional[str]
+    scenarios: List[ScenarioBlame] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "introducedBy": self.introduced_by,
+            "lastChangedBy": self.changed_by,
+            "scenarios": [scenario.to_dict() for scenario in self.scenarios],
+        }
+
+
+def blame_spec(project_path: Path, spec_name: str) -> Optional[List[RequirementBlame]]:
+    """Blame every requirement and scenario of a spec as it is now.
+
+    Returns None if the spec does not exist.
+    """
+    spec_file = Path(project_path) / OPENSPEC_DIR_NAME / "specs" / spec_name / "spec.md"
+    if not spec_file.is_file():
+        return None
+
+    provenance = load_provenance(project_path).get(spec_name, {})
+    blamed = []
+    for req in MarkdownParser().parse_spec(read_file(str(spec_file)))["requirements"]:
+        origin = provenance.get(_title_key(req["title"]), {})
+        scenarios = origin.get("scenarios", {})
+        blamed.append(RequirementBlame(
+            req["title"],
+            origin.get("introducedBy"),
+            origin.get("changedBy"),
+            [
+                ScenarioBlame(scenario["title"], scenarios.get(scenario["id"], {}).get("changedBy"))
+                for scenario in req.get("scenarios", [])
+            ],
+        ))
+    return blamed
+
+
+def load_provenance(project_path: Path) -> Dict[str, Dict[str, Any]]:
+    """The provenance index, brought up to date with the archive and cached."""
+    project_path = Path(project_path)
+    archive_dir = project_path / OPENSPEC_DIR_NAME / "changes" / "archive"
+    entries = ArchiveIndex.load(archive_dir).entries
+    directories = [entry.directory for entry in entries]
+
+    cache_file = cache_path(project_path)
+    try:
+        cached = read_json_file(str(cache_file))
+    except (OSError, ValueError):
+        cached = None
+    replayed: List[str] = []
+    specs: Dict[str, Dict[str, Any]] = {}
+    if isinstance(cached, dict) and cached.get("version") == CACHE_VERSION:
+        replayed = cached.get("replayed", [])
+        if directories[:len(replayed)] == replayed:
+            specs = cached.get("specs", {})
+        else:
+            replayed = []
+
+    pending = entries[len(replayed):]
+    if pending or not cache_file.exists():
+        store = PackStore(archive_dir)
+        parser = MarkdownParser()
+        for entry in pending:
+            _replay(specs, entry, read_archived_deltas(archive_dir, entry, store), parser)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        write_json_file(str(cache_file), {
+            "version": CACHE_VERSION,
+            "replayed": directories,
+            "specs": specs,
+        })
+    return specs
+
+
+def cache_path(project_path: Path) -> Path:
+    return Path(project_path) / OPENSPEC_DIR_NAME / CACHE_DIR_NAME / CACHE_FILE_NAME
+
+
+def _replay(specs: Dict[str, Dict[str, Any]], entry: ArchiveEntry, deltas: Dict[str, str], parser: MarkdownParser) -> None:
+    """Apply one archived change's deltas in archive order: renames, adds, modifications, removals."""
+    origin = entry.directory
+    for spec_name, content in deltas.items():
+        requirements = specs.setdefault(spec_name, {})
+        delta = parser.parse_change_spec(content)
+
+        for rename in delta["renamed_requirements"]:
+            existing = requirements.pop(_title_key(rename["from"]), None)
+            if existing is not None:
+                existing.update(title=rename["to"], changedBy=origin)
+                requirements[_title_key(rename["to"])] = existing
+
+        for req in delta["added_requirements"]:
+            requirements[_title_key(req["title"])] = {
+                "title": req["title"],
+                "introducedBy": origin,
+                "changedBy": origin,
+                "scenarios": {
+                    scenario["id"]: _scenario_origin(scenario, origin)
+                    for scenario in req.get("scenarios", [])
+                },
+            }
+
+        for req in delta["modified_requirements"]:
+            existing = requirements.setdefault(_title_key(req["title"]), {
+                "title": req["title"],
+                "introducedBy": None,
+                "scenarios": {},
+            })
+            existing["changedBy"] = origin
+            scenarios = existing["scenarios"]
+            if "scenario_ops" in req:
+                ops = req["scenario_ops"]
+                for scenario in ops["added"] + ops["modified"]:
+                    scenarios[scenario["id"]] = _scenario_origin(scenario, origin)
+                for removed in ops["removed"]:
+                    scenarios.pop(removed, None)
+            else:
+                # A full MODIFIED block replaces the scenarios; unchanged ones keep their origin
+                replaced = {}
+                for scenario in req.get("scenarios", []):
+                    previous = scenarios.get(scenario["id"])
+                    current = _scenario_origin(scenario, origin)
+                    replaced[scenario["id"]] = previous if previous and previous["hash"] == current["hash"] else current
+                existing["scenarios"] = replaced
+
+        for req in delta["removed_requirements"]:
+            requirements.pop(_title_key(req["title"]), None)
+
+
+def _scenario_origin(scenario: Dict[str, Any], origin: str) -> Dict[str, Any]:
+    steps = [_collapse(step) for step in scenario.get("steps", [])]
+    digest = hashlib.sha256("\n".join(steps).encode("utf-8")).hexdigest()
+    return {"title": scenario["title"], "changedBy": origin, "hash": digest}
+
+
+def _collapse(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _title_key(title: str) -> str:
+    return _collapse(title).casefold()
@@ -0,0 +1,224 @@
+"""Requirement-level diff between two states of a spec.
+
+Both sides are parsed with ``MarkdownParser.parse_spec``. Requirements and
+scenarios are hashed in a canonical form (whitespace collapsed), matched by
+title through a dict, and only the leftovers are compared pairwise to
+detect renames, so the common case stays linear in the number of
+requirements.
+"""
+
+import difflib
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .parsers.markdown_parser import MarkdownParser
+
+# Unmatched requirements at least this similar are reported as renamed
+RENAME_SIMILARITY = 0.6
+
+
+@dataclass
+class ScenarioChange:
+    """A scenario added, removed or modified inside a requirement."""
+    title: str
+    status: str  # "added", "removed" or "modified"
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"title": self.title, "status": self.status}
+
+
+@dataclass
+class RequirementChange:
+    """A requirement that differs between the two sides."""
+    title: str
+    status: str  # "added", "removed", "modified" or "renamed"
+    old_title: Optional[str] = None
+    description_changed: bool = False
+    scenarios: List[ScenarioChange] = field(default_factory=list)
+    similarity: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"title": self.title, "status": self.status}
+        if self.old_title is not None:
+            data["oldTitle"] = self.old_title
+        if self.similarity is not None:
+            data["similarity"] = round(self.similarity, 3)
+        if self.description_changed:
+            data["descriptionChanged"] = True
+        if self.scenarios:
+            data["scenarios"] = [scenario.to_dict() for scenario in self.scenarios]
+        return data
+
+
+@dataclass
+class SpecDiff:
+    """All requirement changes of one spec."""
+    spec_name: str
+    status: str  # "added", "removed" or "modified"
+    changes: List[RequirementChange] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "spec": self.spec_name,
+            "status": self.status,
+            "changes": [change.to_dict() for change in self.changes],
+        }
+
+
+@dataclass
+class _Requirement:
+    title: str
+    description: str
+    scenarios: Dict[str, Tuple[str, str]]  # id -> (title, hash)
+    hash: str
+
+    @property
+    def text(self) -> str:
+        """Canonical text, for similarity when looking for renames."""
+        return self.description + "\n" + "\n".join(title for title, _ in self.scenarios.values())
+
+
+def diff_specs(old: Dict[str, str], new: Dict[str, str]) -> List[SpecDiff]:
+    """Diff two sets of specs given as spec name to markdown content.
+
+    Returns one SpecDiff per spec that differs, sorted by spec name.
+    """
+    parser = MarkdownParser()
+    diffs = []
+
+    for spec_name in sorted(set(old) | set(new)):
+        before = _requirements(parser, old.get(spec_name))
+        after = _requirements(parser, new.get(spec_name))
+        changes = _diff_requirements(before, after)
+        if spec_name not in old:
+            diffs.append(SpecDiff(spec_name, "added", changes))
+        elif spec_name not in new:
+            diffs.append(SpecDiff(spec_name, "removed", changes))
+        elif changes:
+            diffs.append(SpecDiff(spec_name, "modified", changes))
+
+    return diffs
+
+
+def _diff_requirements(before: List[_Requirement], after: List[_Requirement]) -> List[RequirementChange]:
+    """Match requirements by title, then pair the leftovers up as renames."""
+    old_by_title = {_title_key(req.title): req for req in before}
+    new_keys = {_title_key(req.title) for req in after}
+
+    changes = []
+    added = []
+    for req in after:
+        old_req = old_by_title.get(_title_key(req.title))
+        if old_req is None:
+            added.append(req)
+        elif old_req.hash != req.hash:
+            changes.append(_modification(old_req, req, "modified"))
+    removed = [req for req in before if _title_key(req.title) not in new_keys]
+
+    renames, added, removed = _match_renames(removed, added)
+    changes.extend(renames)
+    changes.extend(RequirementChange(req.title, "added") for req in added)
+    changes.extend(RequirementChange(req.title, "removed") for req in removed)
+    return changes
+
+
+def _match_renames(
+    removed: List[_Requirement], added: List[_Requirement]
+) -> Tuple[List[RequirementChange], List[_Requirement], List[_Requirement]]:
+    """Pair unmatched requirements whose bodies are identical or similar enough."""
+    renames = []
+    if not removed or not added:
+        return renames, added, removed
+
+    # Identical bodies first, through a hash lookup
+    added_by_hash: Dict[str, List[int]] = {}
+    for position, req in enumerate(added):
+        added_by_hash.setdefault(req.hash, []).append(position)
+    paired = set()
+    leftover_removed = []
+    for old_req in removed:
+        candidates = added_by_hash.get(old_req.hash)
+        if candidates:
+            position = candidates.pop(0)
+            paired.add(position)
+            renames.append(RequirementChange(added[position].title, "renamed", old_title=old_req.title, similarity=1.0))
+        else:
+            leftover_removed.append(old_req)
+    leftover_added = [req for position, req in enumerate(added) if position not in paired]
+
+    # Then the most similar remaining pairs
+    scored = []
+    for i, old_req in enumerate(leftover_removed):
+        for j, new_req in enumerate(leftover_added):
+            matcher = difflib.SequenceMatcher(None, old_req.text, new_req.text, autojunk=False)
+            if matcher.real_quick_ratio() < RENAME_SIMILARITY or matcher.quick_ratio() < RENAME_SIMILARITY:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= RENAME_SIMILARITY:
+                scored.append((ratio, i, j))
+    used_old, used_new = set(), set()
+    for ratio, i, j in sorted(scored, key=lambda item: (-item[0], item[1], item[2])):
+        if i in used_old or j in used_new:
+            continue
+        used_old.add(i)
+        used_new.add(j)
+        change = _modification(leftover_removed[i], leftover_added[j], "renamed")
+        change.old_title = leftover_removed[i].title
+        change.similarity = ratio
+        renames.append(change)
+
+    return (
+        renames,
+        [req for j, req in enumerate(leftover_added) if j not in used_new],
+        [req for i, req in enumerate(leftover_removed) if i not in used_old],
+    )
+
+
+def _modification(old_req: _Requirement, new_req: _Requirement, status: str) -> RequirementChange:
+    """Describe how a matched requirement changed, scenario by scenario."""
+    change = RequirementChange(new_req.title, status, description_changed=old_req.description != new_req.description)
+    for scenario_key, (title, digest) in new_req.scenarios.items():
+        previous = old_req.scenarios.get(scenario_key)
+        if previous is None:
+            change.scenarios.append(ScenarioChange(title, "added"))
+        elif previous[1] != digest:
+            change.scenarios.append(ScenarioChange(title, "modified"))
+    for scenario_key, (title, _) in old_req.scenarios.items():
+        if scenario_key not in new_req.scenarios:
+            change.scenarios.append(ScenarioChange(title, "removed"))
+    return change
+
+
+def _requirements(parser: MarkdownParser, content: Optional[str]) -> List[_Requirement]:
+    """Parse a spec into canonical, hashed requirements."""
+    if content is None:
+        return []
+    requirements = []
+    for req in parser.parse_spec(content)["requirements"]:
+        scenarios = {}
+        for scenario in req.get("scenarios", []):
+            steps = [_collapse(step) for step in scenario.get("steps", [])]
+            scenarios[scenario["id"]] = (scenario["title"], _hash([_collapse(scenario["title"]), steps]))
+        description = _collapse(req.get("description", ""))
+        requirements.append(_Requirement(
+            req["title"],
+            description,
+            scenarios,
+            _hash([description, sorted(digest for _, digest in scenarios.values())]),
+        ))
+    return requirements
+
+
+def _collapse(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _title_key(title: str) -> str:
+    return _collapse(title).casefold()
+
+
+def _hash(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False).encode("utf-8")).hexdigest()
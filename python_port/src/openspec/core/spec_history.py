@@ -0,0 +1,199 @@
+"""Reconstruct what the specs looked like on a past date.
+
+Archiving a change records in its ``meta.json`` the exact text each spec
+had before the change was applied (``preimages``). A spec as of a date is
+therefore the pre-image kept by the first later change that touched it,
+or the current spec when no later change did.
+
+Changes archived before pre-images were recorded only say what a change
+set a requirement to, not what it replaced. When one of those is in the
+way, the archive is replayed forward in archive index order through the
+same ``merge_requirements`` that ``archive_change`` uses, starting from
+any pre-image met along the way. Every ``CHECKPOINT_INTERVAL`` changes the
+replayed state of all specs is saved, gzip-compressed, in
+``openspec/.cache/history/``, so a replay only covers the changes since
+the nearest checkpoint. A checkpoint records a hash of the archive
+history it covers and is ignored once that history no longer matches.
+A replay is checked by replaying the whole archive and comparing with the
+current spec; when they differ the result is flagged as unverified.
+"""
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .archive_index import ArchiveEntry, ArchiveIndex, read_archived_deltas, read_archived_file
+from .archive_pack import PackStore
+from .change_operations import generate_spec_content, merge_requirements
+from .config import OPENSPEC_DIR_NAME
+from .fingerprints import META_FILE_NAME
+from .parsers.markdown_parser import MarkdownParser
+from ..utils.file_system import read_file
+
+CHECKPOINT_INTERVAL = 25
+CHECKPOINT_VERSION = 2
+HISTORY_DIR_NAME = "history"
+
+# Where a reconstructed spec came from
+SOURCE_RECORDED = "recorded"  # pre-image kept by a later archived change
+SOURCE_CURRENT = "current"  # no later archived change touched the spec
+SOURCE_REPLAYED = "replayed"  # replayed from archived deltas
+
+
+@dataclass
+class SpecSnapshot:
+    """A spec as of a date; ``content`` is None if it did not exist yet."""
+    content: Optional[str]
+    source: str
+    verified: bool = True  # False if replaying the archive does not reproduce the current spec
+    change: str = ""  # the archived change whose pre-image was used
+
+
+def spec_as_of(project_path: Path, spec_name: str, day: str) -> SpecSnapshot:
+    """The markdown of a spec as of the end of an ISO date."""
+    project_path = Path(project_path)
+    archive_dir = project_path / OPENSPEC_DIR_NAME / "changes" / "archive"
+    index = ArchiveIndex.load(archive_dir)
+    store = PackStore(archive_dir)
+
+    for entry in index.entries[len(index.until(day)):]:
+        if spec_name not in entry.specs:
+            continue
+        preimages = _read_preimages(archive_dir, entry, store)
+        if preimages is None:
+            break  # archived before pre-images were recorded
+        if spec_name in preimages:
+            return SpecSnapshot(preimages[spec_name], SOURCE_RECORDED, change=entry.directory)
+    else:
+        return SpecSnapshot(_read_live_spec(project_path, spec_name), SOURCE_CURRENT)
+
+    state = specs_as_of(project_path, day).get(spec_name)
+    content = None if state is None else _render(state)
+    final = specs_as_of(project_path, "9999-12-31").get(spec_name)
+    live = _read_live_spec(project_path, spec_name)
+    verified = (final is None and live is None) or (
+        final is not None and live is not None and _render(final) == _render(_parse_state(live))
+    )
+    return SpecSnapshot(content, SOURCE_REPLAYED, verified=verified)
+
+
+def specs_as_of(project_path: Path, day: str) -> Dict[str, Dict[str, Any]]:
+    """Replayed state (title, purpose, requirements) of every spec as of an ISO date."""
+    project_path = Path(project_path)
+    archive_dir = project_path / OPENSPEC_DIR_NAME / "changes" / "archive"
+    index = ArchiveIndex.load(archive_dir)
+    entries = index.entries
+    target = len(index.until(day))
+    directories = [entry.directory for entry in entries]
+
+    history_dir = checkpoint_dir(project_path)
+    start, specs = _nearest_checkpoint(history_dir, directories, target)
+
+    store = PackStore(archive_dir)
+    parser = MarkdownParser()
+    for position in range(start, target):
+        entry = entries[position]
+        _apply(
+            specs, entry, read_archived_deltas(archive_dir, entry, store),
+            _read_preimages(archive_dir, entry, store) or {}, parser,
+        )
+        if (position + 1) % CHECKPOINT_INTERVAL == 0:
+            _write_checkpoint(history_dir, directories[:position + 1], specs)
+    return specs
+
+
+def checkpoint_dir(project_path: Path) -> Path:
+    return Path(project_path) / OPENSPEC_DIR_NAME / ".cache" / HISTORY_DIR_NAME
+
+
+def _apply(
+    specs: Dict[str, Dict[str, Any]],
+    entry: ArchiveEntry,
+    deltas: Dict[str, str],
+    preimages: Dict[str, Optional[str]],
+    parser: MarkdownParser,
+) -> None:
+    """Apply one archived change the way archive_change applied it.
+
+    A recorded pre-image replaces the replayed state first, so the replay
+    continues from the spec's real text.
+    """
+    for spec_name, content in deltas.items():
+        if spec_name in preimages:
+            specs.pop(spec_name, None)
+            if preimages[spec_name] is not None:
+                specs[spec_name] = _parse_state(preimages[spec_name], parser)
+        state = specs.get(spec_name) or {
+            "title": f"{spec_name} Specification",
+            "purpose": f"Specification created by archiving change {entry.change_id}",
+            "requirements": [],
+        }
+        state["requirements"] = merge_requirements(state["requirements"], parser.parse_change_spec(content))
+        specs[spec_name] = state
+
+
+def _parse_state(content: str, parser: Optional[MarkdownParser] = None) -> Dict[str, Any]:
+    spec = (parser or MarkdownParser()).parse_spec(content)
+    return {
+        "title": spec.get("title", ""),
+        "purpose": spec.get("purpose", ""),
+        "requirements": spec.get("requirements", []),
+    }
+
+
+def _render(state: Dict[str, Any]) -> str:
+    return generate_spec_content(state["title"], state["purpose"], state["requirements"])
+
+
+def _read_preimages(archive_dir: Path, entry: ArchiveEntry, store: PackStore) -> Optional[Dict[str, Optional[str]]]:
+    """Spec texts recorded before an archived change applied, or None if it has none."""
+    content = read_archived_file(archive_dir, entry, META_FILE_NAME, store)
+    try:
+        preimages = json.loads(content).get("preimages") if content else None
+    except (ValueError, AttributeError):
+        return None
+    return preimages if isinstance(preimages, dict) else None
+
+
+def _read_live_spec(project_path: Path, spec_name: str) -> Optional[str]:
+    spec_path = project_path / OPENSPEC_DIR_NAME / "specs" / spec_name / "spec.md"
+    return read_file(str(spec_path)) if spec_path.is_file() else None
+
+
+def _nearest_checkpoint(
+    history_dir: Path, directories: List[str], target: int
+) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+    """The latest valid checkpoint at or before ``target`` changes, or an empty start."""
+    for count in range(target - target % CHECKPOINT_INTERVAL, 0, -CHECKPOINT_INTERVAL):
+        try:
+            with gzip.open(_checkpoint_path(history_dir, count), "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if data.get("version") == CHECKPOINT_VERSION and data.get("history") == _history_hash(directories[:count]):
+            return count, data["specs"]
+    return 0, {}
+
+
+def _write_checkpoint(history_dir: Path, directories: List[str], specs: Dict[str, Dict[str, Any]]) -> None:
+    history_dir.mkdir(parents=True, exist_ok=True)
+    path = _checkpoint_path(history_dir, len(directories))
+    temporary = path.with_name(path.name + ".tmp")
+    with gzip.open(temporary, "wt", encoding="utf-8") as f:
+        json.dump({
+            "version": CHECKPOINT_VERSION,
+            "history": _history_hash(directories),
+            "specs": specs,
+        }, f)
+    temporary.replace(path)
+
+
+def _checkpoint_path(history_dir: Path, count: int) -> Path:
+    return history_dir / f"checkpoint-{count:06d}.json.gz"
+
+
+def _history_hash(directories: List[str]) -> str:
+    return hashlib.sha256("\n".join(directories).encode("utf-8")).hexdigest()
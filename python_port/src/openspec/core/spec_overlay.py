@@ -0,0 +1,80 @@
+"""Preview specs with active changes applied, without writing anything.
+
+A SpecOverlay layers spec contents over ``openspec/specs`` in memory. When
+a spec is read, the deltas the given changes carry for it are applied in
+order with the same validation and rendering ``archive_change`` uses, and
+the result is kept for later reads. Only the deltas of requested specs are
+parsed, so previewing one spec stays cheap however many changes are active.
+A delta that would not apply cleanly is skipped and reported as a conflict.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .change_operations import SpecDeltaPlan, render_main_spec, validate_spec_delta_plans
+from .config import OPENSPEC_DIR_NAME
+from .parsers.markdown_parser import MarkdownParser
+from ..utils.file_system import list_directories, read_file
+
+
+@dataclass
+class OverlayConflict:
+    """A change's delta that could not be applied on top of the earlier ones."""
+    change: str
+    spec_name: str
+    message: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"change": self.change, "spec": self.spec_name, "message": self.message}
+
+
+class SpecOverlay:
+    """Specs as they would be after archiving ``changes`` in order."""
+
+    def __init__(self, project_path: Path, changes: Sequence[str]):
+        self.project_path = Path(project_path)
+        self.changes = list(changes)
+        self.conflicts: List[OverlayConflict] = []
+        self._specs_dir = self.project_path / OPENSPEC_DIR_NAME / "specs"
+        self._changes_dir = self.project_path / OPENSPEC_DIR_NAME / "changes"
+        self._contents: Dict[str, Optional[str]] = {}
+        self._parser = MarkdownParser()
+
+    def read(self, spec_name: str) -> Optional[str]:
+        """The spec's content with every change applied, or None if it would not exist."""
+        if spec_name not in self._contents:
+            self._contents[spec_name] = self._apply_changes(spec_name)
+        return self._contents[spec_name]
+
+    def _apply_changes(self, spec_name: str) -> Optional[str]:
+        main_spec_path = self._specs_dir / spec_name / "spec.md"
+        content = read_file(str(main_spec_path)) if main_spec_path.is_file() else None
+
+        for change in self.changes:
+            delta_path = self._changes_dir / change / "specs" / spec_name / "spec.md"
+            if not delta_path.is_file():
+                continue
+            plan = SpecDeltaPlan(
+                spec_name=spec_name,
+                delta_path=delta_path,
+                delta=self._parser.parse_change_spec(read_file(str(delta_path))),
+                main_spec_path=main_spec_path,
+                existing=self._parser.parse_spec(content) if content is not None else None,
+            )
+            errors = validate_spec_delta_plans([plan])
+            if errors:
+                self.conflicts.extend(OverlayConflict(change, spec_name, error) for error in errors)
+                continue
+            rendered = render_main_spec(plan, change)
+            if rendered is not None:
+                content = rendered
+
+        return content
+
+
+def active_changes(project_path: Path) -> List[str]:
+    """Names of all active changes, in the order ``archive --all`` would take them."""
+    changes_dir = Path(project_path) / OPENSPEC_DIR_NAME / "changes"
+    return sorted(name for name in list_directories(str(changes_dir)) if name != "archive")
+
@@ -0,0 +1,179 @@
+"""Load sets of specs from files, directories or git revisions."""
+
+import os
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .config import OPENSPEC_DIR_NAME
+from ..utils.file_system import list_directories, read_file
+from ..utils.git_objects import GitError, GitObjectReader, blob_sha
+
+SPEC_FILE_NAME = "spec.md"
+
+
+class SpecSourceError(Exception):
+    """A spec source could not be resolved or read."""
+
+
+def load_specs(project_path: Path, source: str, spec_name: Optional[str] = None) -> Dict[str, str]:
+    """Read the specs named by ``source`` as spec name to markdown content.
+
+    ``source`` may be a ``spec.md`` (or any markdown) file, a single spec's
+    directory, a specs directory, or a git revision, optionally followed by
+    ``:path`` to a file or directory in that revision. Paths that exist on
+    disk win over revisions of the same name. With ``spec_name`` only that
+    spec is returned.
+    """
+    path = Path(source)
+    if path.exists():
+        specs = _load_path(path)
+    else:
+        specs = _load_revision(Path(project_path), source)
+    if spec_name is not None:
+        specs = {name: content for name, content in specs.items() if name == spec_name}
+    return specs
+
+
+def _load_path(path: Path) -> Dict[str, str]:
+    if path.is_file():
+        return {_spec_name_for_file(path): read_file(str(path))}
+    if (path / SPEC_FILE_NAME).is_file():
+        return {path.name: read_file(str(path / SPEC_FILE_NAME))}
+    if (path / OPENSPEC_DIR_NAME / "specs").is_dir():
+        path = path / OPENSPEC_DIR_NAME / "specs"
+    return {
+        name: read_file(str(path / name / SPEC_FILE_NAME))
+        for name in list_directories(str(path))
+        if (path / name / SPEC_FILE_NAME).is_file()
+    }
+
+
+def _spec_name_for_file(path: Path) -> str:
+    return path.parent.name if path.name == SPEC_FILE_NAME else path.stem
+
+
+def _load_revision(project_path: Path, source: str) -> Dict[str, str]:
+    """Read specs from a git revision, by default the project's specs directory."""
+    revision, _, inner = source.partition(":")
+    base = inner.strip("/") if inner else f"{OPENSPEC_DIR_NAME}/specs"
+
+    with GitObjectReader(project_path) as reader:
+        try:
+            prefix = _repo_prefix(project_path)
+            # Paths in a revision are relative to the repository root
+            target = f"{prefix}{base}".strip("/")
+            files = reader.list_files(revision, target)
+        except GitError:
+            raise SpecSourceError(f"'{source}' is neither a path nor a git revision")
+        if not files:
+            raise SpecSourceError(f"'{base}' does not exist in {revision}")
+
+        if list(files) == [target]:
+            name = _spec_name_for_file(Path(target))
+            return {name: _decode(reader.read_blob(files[target]))}
+
+        specs = {}
+        for file_path, sha in files.items():
+            relative = Path(file_path).relative_to(target)
+            if relative.name == SPEC_FILE_NAME and len(relative.parts) <= 2:
+                name = relative.parts[0] if len(relative.parts) == 2 else Path(target).name
+                specs[name] = _decode(reader.read_blob(sha))
+        return specs
+
+
+@dataclass
+class ChangedItems:
+    """Active changes and specs that differ from a git revision."""
+    changes: Set[str] = field(default_factory=set)
+    specs: Set[str] = field(default_factory=set)
+
+
+def changed_since(project_path: Path, revision: str) -> ChangedItems:
+    """Find the changes and specs whose files differ between ``revision`` and the working tree.
+
+    Working files are hashed as git blobs and compared with the revision's
+    tree, so uncommitted and untracked edits count. Active changes carrying
+    deltas for a changed spec are included too, since they apply on top of it.
+    """
+    project_path = Path(project_path)
+    openspec_dir = project_path / OPENSPEC_DIR_NAME
+
+    with GitObjectReader(project_path) as reader:
+        try:
+            prefix = _repo_prefix(project_path)
+            committed = {
+                path[len(prefix):]: sha
+                for area in ("changes", "specs")
+                for path, sha in reader.list_files(
+                    revision, f"{prefix}{OPENSPEC_DIR_NAME}/{area}",
+                    descend=lambda path: _walks_into(path[len(prefix):].split("/")),
+                ).items()
+            }
+        except GitError:
+            raise SpecSourceError(f"'{revision}' is not a git revision")
+
+    current = {}
+    for area in ("changes", "specs"):
+        for directory, dir_names, file_names in os.walk(openspec_dir / area):
+            relative_dir = Path(directory).relative_to(project_path).as_posix()
+            # Prune the archive and hidden directories before reading anything below them
+            dir_names[:] = [name for name in dir_names if _walks_into(f"{relative_dir}/{name}".split("/"))]
+            for file_name in file_names:
+                current[f"{relative_dir}/{file_name}"] = blob_sha((Path(directory) / file_name).read_bytes())
+
+    changed = ChangedItems()
+    for path in set(committed) | set(current):
+        if committed.get(path) == current.get(path):
+            continue
+        parts = path.split("/")
+        if len(parts) < 4 or parts[0] != OPENSPEC_DIR_NAME or parts[2].startswith("."):
+            continue
+        if parts[1] == "specs":
+            changed.specs.add(parts[2])
+        elif parts[1] == "changes" and parts[2] != "archive":
+            changed.changes.add(parts[2])
+
+    changes_dir = openspec_dir / "changes"
+    for change_name in list_directories(str(changes_dir)):
+        if change_name == "archive" or change_name in changed.changes:
+            continue
+        if any((changes_dir / change_name / "specs" / spec).is_dir() for spec in changed.specs):
+            changed.changes.add(change_name)
+
+    # Changes deleted since the revision have nothing left to validate
+    changed.changes = {name for name in changed.changes if (changes_dir / name).is_dir()}
+    changed.specs = {name for name in changed.specs if (openspec_dir / "specs" / name).is_dir()}
+    return changed
+
+
+def _walks_into(parts: List[str]) -> bool:
+    """Whether a directory below openspec/ can hold files ``changed_since`` compares."""
+    if len(parts) < 3:
+        return True
+    return not parts[2].startswith(".") and not (parts[1] == "changes" and parts[2] == "archive")
+
+
+def _repo_prefix(project_path: Path) -> str:
+    """The project's path inside its repository, with a trailing slash."""
+    prefix = _git(project_path, "rev-parse", "--show-prefix")
+    if prefix is None:
+        raise GitError(f"{project_path} is not inside a git repository")
+    return prefix.strip()
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8")
+
+
+def _git(project_path: Path, *args: str) -> Optional[str]:
+    """Run a git command in the project and return its output, or None if it failed."""
+    try:
+        completed = subprocess.run(
+            ["git", "-C", str(project_path), *args],
+            capture_output=True, text=True, encoding="utf-8",
+        )
+    except OSError:
+        return None
+    return completed.stdout if completed.returncode == 0 else None
@@ -137,6 +137,11 @@ class TemplateManager:
         """Get the Cline configuration template (uses agents root stub)."""
         return TemplateManager._read_ts_template("agents-root-stub.ts", "agentsRootStubTemplate")
     
+    @staticmethod
+    def get_agents_standard_template() -> str:
+        """Get the universal AGENTS.md configuration template (uses agents root stub)."""
+        return TemplateManager._read_ts_template("agents-root-stub.ts", "agentsRootStubTemplate")
+    
     @staticmethod
     def get_agents_root_stub() -> str:
         """Get the root AGENTS.md stub template."""
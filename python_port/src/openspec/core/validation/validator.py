@@ -2,12 +2,19 @@
 
 import re
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Set, TYPE_CHECKING
+from dataclasses import dataclass, field
 
-from ..schemas import ChangeSchema, SpecSchema
-from ..parsers import parse_markdown_file, extract_json_from_markdown
-from ...utils.file_system import find_files_with_extension, read_file
+from ..parsers import parse_markdown_file, extract_json_block
+from ..change_operations import load_spec_delta_plans
+from ..fingerprints import find_stale_requirements, record_base_fingerprints
+from ..requirement_merge import has_conflict_markers
+from ...utils.file_system import find_files_with_extension
+from ...utils.storage import LOCAL_STORAGE, Storage
+
+if TYPE_CHECKING:
+    from ..schemas import ChangeSchema, SpecSchema
+    from ..schemas.adapters import SchemaIssue
 
 
 @dataclass
@@ -18,15 +25,29 @@ class ValidationResult:
     is_valid: bool
     errors: List[str]
     metadata: Optional[Dict[str, Any]] = None
+    issues: List["SchemaIssue"] = field(default_factory=list)
 
 
-def validate_project(project_path: str, scope: Optional[str] = None) -> List[ValidationResult]:
-    """Validate all files in an OpenSpec project."""
+def validate_project(
+    project_path: str,
+    scope: Optional[str] = None,
+    change_names: Optional[Set[str]] = None,
+    spec_names: Optional[Set[str]] = None,
+    storage: Optional[Storage] = None,
+) -> List[ValidationResult]:
+    """Validate all files in an OpenSpec project.
+    
+    ``change_names`` and ``spec_names``, when given, further restrict
+    validation to those changes and specs (see ``validate --since``).
+    Files are read through ``storage`` (the local disk by default); base
+    fingerprints are only recorded when the storage is writable.
+    """
     
+    storage = storage or LOCAL_STORAGE
     results = []
     openspec_dir = Path(project_path) / "openspec"
     
-    if not openspec_dir.exists():
+    if not storage.is_dir(openspec_dir):
         return results
     
     # Find all markdown files
@@ -48,42 +69,48 @@ def validate_project(project_path: str, scope: Optional[str] = None) -> List[Val
             specific_item = scope
     
     # Validate change proposals
-    if validate_changes and changes_dir.exists():
-        for change_dir in changes_dir.iterdir():
-            if change_dir.is_dir() and not change_dir.name.startswith(".") and change_dir.name != "archive":
+    if validate_changes and storage.is_dir(changes_dir):
+        for change_dir in (changes_dir / name for name in storage.list_dir(changes_dir)):
+            if storage.is_dir(change_dir) and not change_dir.name.startswith(".") and change_dir.name != "archive":
                 # Skip if specific item is specified and doesn't match
                 if specific_item and specific_item != change_dir.name:
                     continue
+                if change_names is not None and change_dir.name not in change_names:
+                    continue
                     
                 proposal_file = change_dir / "proposal.md"
-                if proposal_file.exists():
-                    result = _validate_change_file(str(proposal_file))
+                if storage.is_file(proposal_file):
+                    result = _validate_change_file(str(proposal_file), storage)
+                    _check_change_deltas(project_path, change_dir, result, storage)
                     results.append(result)
     
     # Validate specs
-    if validate_specs and specs_dir.exists():
-        for spec_dir in specs_dir.iterdir():
-            if spec_dir.is_dir() and not spec_dir.name.startswith("."):
+    if validate_specs and storage.is_dir(specs_dir):
+        for spec_dir in (specs_dir / name for name in storage.list_dir(specs_dir)):
+            if storage.is_dir(spec_dir) and not spec_dir.name.startswith("."):
                 # Skip if specific item is specified and doesn't match
                 if specific_item and specific_item != spec_dir.name:
                     continue
+                if spec_names is not None and spec_dir.name not in spec_names:
+                    continue
                     
                 spec_file = spec_dir / "spec.md"
-                if spec_file.exists():
-                    result = _validate_spec_file(str(spec_file))
+                if storage.is_file(spec_file):
+                    result = _validate_spec_file(str(spec_file), storage)
                     results.append(result)
     
     return results
 
 
-def _validate_change_file(file_path: str) -> ValidationResult:
+def _validate_change_file(file_path: str, storage: Optional[Storage] = None) -> ValidationResult:
     """Validate a change proposal file."""
     
     errors = []
+    issues = []
     
     try:
         # Parse the markdown file
-        content = read_file(file_path)
+        content = (storage or LOCAL_STORAGE).read_text(file_path)
         
         # Basic markdown validation first
         if not content.strip():
@@ -105,17 +132,11 @@ def _validate_change_file(file_path: str) -> ValidationResult:
         if not has_what_changes:
             errors.append("Missing required section: ## What Changes")
         
-        # Try to extract JSON configuration (optional for basic proposals)
-        json_data = extract_json_from_markdown(content)
-        
-        if json_data:
-            # Validate against schema if JSON is present
-            try:
-                change = ChangeSchema.model_validate(json_data)
-                # Additional validations
-                _validate_change_business_rules(change, errors)
-            except Exception as e:
-                errors.append(f"Schema validation failed: {str(e)}")
+        # Validate JSON configuration if present (optional for basic proposals)
+        change = _validate_json_config("change", content, errors, issues)
+        if change is not None:
+            # Additional validations
+            _validate_change_business_rules(change, errors)
         
     except Exception as e:
         errors.append(f"Failed to parse file: {str(e)}")
@@ -124,18 +145,46 @@ def _validate_change_file(file_path: str) -> ValidationResult:
         file_path=file_path,
         file_type="change",
         is_valid=len(errors) == 0,
-        errors=errors
+        errors=errors,
+        issues=issues
     )
 
 
-def _validate_spec_file(file_path: str) -> ValidationResult:
+def _check_change_deltas(
+    project_path: str, change_dir: Path, result: ValidationResult, storage: Optional[Storage] = None
+) -> None:
+    """Flag conflict markers and requirements that diverged from their recorded base.
+    
+    Bases are recorded for targeted requirements that do not have one yet.
+    """
+    
+    try:
+        storage = storage or LOCAL_STORAGE
+        plans = load_spec_delta_plans(project_path, change_dir, storage)
+        for plan in plans:
+            if has_conflict_markers(plan.delta.get("raw_content", "")):
+                result.errors.append(
+                    f"{plan.spec_name}: Unresolved merge conflict markers in the delta"
+                )
+        for stale in find_stale_requirements(change_dir, plans, storage):
+            result.errors.append(str(stale))
+        if not storage.read_only:
+            record_base_fingerprints(change_dir, plans, storage)
+    except Exception as e:
+        result.errors.append(f"Failed to check requirement fingerprints: {str(e)}")
+    
+    result.is_valid = len(result.errors) == 0
+
+
+def _validate_spec_file(file_path: str, storage: Optional[Storage] = None) -> ValidationResult:
     """Validate a spec file."""
     
     errors = []
+    issues = []
     
     try:
         # Parse the markdown file
-        content = read_file(file_path)
+        content = (storage or LOCAL_STORAGE).read_text(file_path)
         
         # Basic markdown validation first
         if not content.strip():
@@ -157,17 +206,11 @@ def _validate_spec_file(file_path: str) -> ValidationResult:
         if not has_requirements:
             errors.append("Missing required section: ## Requirements")
         
-        # Try to extract JSON configuration (optional for basic specs)
-        json_data = extract_json_from_markdown(content)
-        
-        if json_data:
-            # Validate against schema if JSON is present
-            try:
-                spec = SpecSchema.model_validate(json_data)
-                # Additional validations
-                _validate_spec_business_rules(spec, errors)
-            except Exception as e:
-                errors.append(f"Schema validation failed: {str(e)}")
+        # Validate JSON configuration if present (optional for basic specs)
+        spec = _validate_json_config("spec", content, errors, issues)
+        if spec is not None:
+            # Additional validations
+            _validate_spec_business_rules(spec, errors)
         
     except Exception as e:
         errors.append(f"Failed to parse file: {str(e)}")
@@ -176,11 +219,32 @@ def _validate_spec_file(file_path: str) -> ValidationResult:
         file_path=file_path,
         file_type="spec",
         is_valid=len(errors) == 0,
-        errors=errors
+        errors=errors,
+        issues=issues
     )
 
 
-def _validate_change_business_rules(change: ChangeSchema, errors: List[str]) -> None:
+def _validate_json_config(kind: str, content: str, errors: List[str], issues: List["SchemaIssue"]) -> Optional[Any]:
+    """Validate the JSON configuration block in ``content``, if there is one.
+    
+    Returns the validated model, or None when there is no block or it is
+    invalid. Schema problems are appended to ``errors`` and ``issues``.
+    """
+    raw_json = extract_json_block(content)
+    if raw_json is None:
+        return None
+    
+    # Only pay for the pydantic import when a JSON block actually exists
+    from ..schemas.adapters import validate_json_block
+    
+    model, block_issues = validate_json_block(kind, raw_json)
+    for issue in block_issues:
+        errors.append(f"Schema validation failed: {issue}")
+    issues.extend(block_issues)
+    return model
+
+
+def _validate_change_business_rules(change: "ChangeSchema", errors: List[str]) -> None:
     """Validate business rules for changes."""
     
     # Check delta operations
@@ -193,7 +257,7 @@ def _validate_change_business_rules(change: ChangeSchema, errors: List[str]) ->
             errors.append(f"Delta cannot have both 'requirement' and 'requirements': {delta.spec}")
 
 
-def _validate_spec_business_rules(spec: SpecSchema, errors: List[str]) -> None:
+def _validate_spec_business_rules(spec: "SpecSchema", errors: List[str]) -> None:
     """Validate business rules for specs."""
     
     # Check for duplicate requirement IDs
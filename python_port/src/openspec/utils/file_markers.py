@@ -1,78 +1,140 @@
-"""Utilities for managing OpenSpec file markers."""
+"""Utilities for managing OpenSpec file markers.
 
-from pathlib import Path
-from typing import Optional
-from .file_system import write_file, read_file, file_exists
-
-
-def create_file_with_markers(file_path: str, content: str) -> None:
-    """Create a new file with OpenSpec markers."""
-    marked_content = f"""<!-- OPENSPEC:START -->
-{content}
-<!-- OPENSPEC:END -->"""
-    
-    write_file(file_path, marked_content)
-
-
-def update_file_with_markers(file_path: str, new_content: str) -> None:
-    """Update an existing file with OpenSpec markers."""
-    
-    if not file_exists(file_path):
-        create_file_with_markers(file_path, new_content)
-        return
-    
-    existing_content = read_file(file_path)
-    
-    if has_openspec_markers(existing_content):
-        # Replace content between markers
-        updated_content = replace_content_between_markers(existing_content, new_content)
-        write_file(file_path, updated_content)
-    else:
-        # Add markers around new content
-        create_file_with_markers(file_path, new_content)
-
-
-def has_openspec_markers(content: str) -> bool:
-    """Check if content has OpenSpec markers."""
-    return "<!-- OPENSPEC:START -->" in content and "<!-- OPENSPEC:END -->" in content
-
-
-def extract_content_between_markers(content: str) -> Optional[str]:
-    """Extract content between OpenSpec markers."""
-    start_marker = "<!-- OPENSPEC:START -->"
-    end_marker = "<!-- OPENSPEC:END -->"
-    
-    start_pos = content.find(start_marker)
-    end_pos = content.find(end_marker)
-    
-    if start_pos == -1 or end_pos == -1:
-        return None
-    
-    start_pos += len(start_marker)
-    return content[start_pos:end_pos].strip()
-
-
-def replace_content_between_markers(content: str, new_content: str) -> str:
-    """Replace content between OpenSpec markers."""
-    start_marker = "<!-- OPENSPEC:START -->"
-    end_marker = "<!-- OPENSPEC:END -->"
-    
-    start_pos = content.find(start_marker)
-    end_pos = content.find(end_marker)
-    
-    if start_pos == -1 or end_pos == -1:
-        # No markers found, return original content
-        return content
-    
-    before = content[:start_pos + len(start_marker)]
-    after = content[end_pos:]
-    
-    return f"{before}\n{new_content}\n{after}"
+A file can hold several managed blocks. The default block is delimited by
+``<!-- OPENSPEC:START -->`` and ``<!-- OPENSPEC:END -->``; named blocks add
+the name to both markers, e.g. ``<!-- OPENSPEC:START:commands -->``. All
+blocks of a file are found in one scan and updated with one read and one
+write.
+"""
 
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Mapping, Optional
+
 from .file_system import read_file, write_file
 
+# Name of the block delimited by the plain OPENSPEC:START/END markers
+DEFAULT_BLOCK = ""
+
+_MARKER_PATTERN = re.compile(r"<!-- OPENSPEC:(START|END)(?::([\w.-]+))? -->")
+
+
+@dataclass
+class MarkerBlock:
+    """A managed block: offsets of its markers and of the text between them."""
+    name: str
+    start: int
+    end: int
+    body_start: int
+    body_end: int
+
+
+@dataclass
+class MarkerScan:
+    """Every managed block in a file's content, keyed by block name."""
+    content: str
+    blocks: Dict[str, MarkerBlock]
+    # Blocks whose end marker came before their start marker
+    misordered: frozenset = frozenset()
+
+    def body(self, name: str = DEFAULT_BLOCK) -> Optional[str]:
+        """The exact text between a block's markers, or None if it is absent."""
+        block = self.blocks.get(name)
+        return None if block is None else self.content[block.body_start:block.body_end]
+
+
+def block_start_marker(name: str = DEFAULT_BLOCK) -> str:
+    """Start marker of a named block."""
+    return f"<!-- OPENSPEC:START:{name} -->" if name else "<!-- OPENSPEC:START -->"
+
+
+def block_end_marker(name: str = DEFAULT_BLOCK) -> str:
+    """End marker of a named block."""
+    return f"<!-- OPENSPEC:END:{name} -->" if name else "<!-- OPENSPEC:END -->"
+
+
+def scan_markers(content: str) -> MarkerScan:
+    """Find all managed blocks in one pass over ``content``.
+
+    The first complete block of each name wins, like a ``find`` for its
+    markers would; later duplicates are left alone as ordinary text.
+    """
+    blocks: Dict[str, MarkerBlock] = {}
+    open_blocks: Dict[str, re.Match] = {}
+    misordered = set()
+
+    for match in _MARKER_PATTERN.finditer(content):
+        kind, name = match.group(1), match.group(2) or DEFAULT_BLOCK
+        if name in blocks:
+            continue
+        if kind == "START":
+            open_blocks.setdefault(name, match)
+        elif name in open_blocks:
+            opening = open_blocks.pop(name)
+            blocks[name] = MarkerBlock(name, opening.start(), match.end(), opening.end(), match.start())
+        else:
+            misordered.add(name)
+
+    return MarkerScan(content, blocks, frozenset(misordered - set(blocks)))
+
+
+def replace_blocks(content: str, updates: Mapping[str, str]) -> str:
+    """Set the bodies of several blocks, appending the ones that are missing.
+
+    Text outside the blocks is kept as is. Raises ValueError if a block's
+    end marker appears before its start marker.
+    """
+    scan = scan_markers(content)
+    for name in updates:
+        if name in scan.misordered:
+            raise ValueError("End marker appears before start marker")
+
+    parts = []
+    position = 0
+    for block in sorted(scan.blocks.values(), key=lambda block: block.start):
+        if block.name not in updates:
+            continue
+        parts.append(content[position:block.body_start])
+        parts.append(f"\n{updates[block.name]}\n")
+        position = block.body_end
+    parts.append(content[position:])
+
+    for name, body in updates.items():
+        if name not in scan.blocks:
+            parts.append(f"\n{block_start_marker(name)}\n{body}\n{block_end_marker(name)}\n")
+
+    return "".join(parts)
+
+
+def update_file_blocks(file_path: str, updates: Mapping[str, str], append_missing: bool = True) -> bool:
+    """Update managed blocks of a file with a single read and write.
+
+    A missing file is created with just the blocks. Unless ``append_missing``,
+    a block that is not already in the file raises ValueError instead of
+    being appended. Returns True if the file was written.
+    """
+    path = Path(file_path)
+    if not path.exists():
+        content = "".join(f"{block_start_marker(name)}\n{body}\n{block_end_marker(name)}\n" for name, body in updates.items())
+        return write_file(file_path, content)
+
+    existing = read_file(file_path)
+    if not append_missing:
+        blocks = scan_markers(existing).blocks
+        missing = [name for name in updates if name not in blocks]
+        if missing:
+            raise ValueError(f"Missing OpenSpec markers in {file_path}")
+    return write_file(file_path, replace_blocks(existing, updates))
+
+
+def read_file_blocks(file_path: str) -> Optional[MarkerScan]:
+    """Scan a file's managed blocks, or None if it cannot be read."""
+    try:
+        return scan_markers(read_file(file_path))
+    except (FileNotFoundError, PermissionError):
+        return None
+
 
 async def update_file_with_markers(
     file_path: str,
@@ -81,21 +143,7 @@ async def update_file_with_markers(
     end_marker: str
 ) -> None:
     """Update content between OpenSpec markers in a file."""
-    file_path_obj = Path(file_path)
-    
-    if file_path_obj.exists():
-        # Update existing file
-        existing_content = read_file(file_path)
-        updated_content = _replace_content_between_markers(
-            existing_content, content, start_marker, end_marker
-        )
-    else:
-        # Create new file
-        updated_content = f"{start_marker}\n{content}\n{end_marker}\n"
-    
-    # Ensure parent directory exists
-    file_path_obj.parent.mkdir(parents=True, exist_ok=True)
-    write_file(file_path, updated_content)
+    update_file_blocks(file_path, {_block_name(start_marker, end_marker): content})
 
 
 def _replace_content_between_markers(
@@ -105,30 +153,13 @@ def _replace_content_between_markers(
     end_marker: str
 ) -> str:
     """Replace content between markers, preserving everything else."""
-    start_index = existing_content.find(start_marker)
-    end_index = existing_content.find(end_marker)
-    
-    if start_index == -1 or end_index == -1:
-        # No markers found, append at end
-        return f"{existing_content}\n{start_marker}\n{new_content}\n{end_marker}\n"
-    
-    if end_index <= start_index:
-        raise ValueError("End marker appears before start marker")
-    
-    # Replace content between markers
-    before = existing_content[:start_index + len(start_marker)]
-    after = existing_content[end_index:]
-    
-    return f"{before}\n{new_content}\n{after}"
+    return replace_blocks(existing_content, {_block_name(start_marker, end_marker): new_content})
 
 
 def has_openspec_markers(file_path: str, start_marker: str, end_marker: str) -> bool:
     """Check if a file contains OpenSpec markers."""
-    try:
-        content = read_file(file_path)
-        return start_marker in content and end_marker in content
-    except (FileNotFoundError, PermissionError):
-        return False
+    scan = read_file_blocks(file_path)
+    return scan is not None and _block_name(start_marker, end_marker) in scan.blocks
 
 
 def extract_content_between_markers(
@@ -137,15 +168,21 @@ def extract_content_between_markers(
     end_marker: str
 ) -> Optional[str]:
     """Extract content between OpenSpec markers."""
-    try:
-        content = read_file(file_path)
-        start_index = content.find(start_marker)
-        end_index = content.find(end_marker)
-        
-        if start_index == -1 or end_index == -1 or end_index <= start_index:
-            return None
-        
-        start_pos = start_index + len(start_marker)
-        return content[start_pos:end_index].strip()
-    except (FileNotFoundError, PermissionError):
-        return None
\ No newline at end of file
+    scan = read_file_blocks(file_path)
+    if scan is None:
+        return None
+    body = scan.body(_block_name(start_marker, end_marker))
+    return None if body is None else body.strip()
+
+
+def _block_name(start: str, end: str) -> str:
+    """The block name a start/end marker pair refers to."""
+    start_match = _MARKER_PATTERN.fullmatch(start)
+    end_match = _MARKER_PATTERN.fullmatch(end)
+    if (
+        not start_match or not end_match
+        or start_match.group(1) != "START" or end_match.group(1) != "END"
+        or start_match.group(2) != end_match.group(2)
+    ):
+        raise ValueError(f"Not an OpenSpec marker pair: {start!r}, {end!r}")
+    return start_match.group(2) or DEFAULT_BLOCK
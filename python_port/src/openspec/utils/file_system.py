@@ -2,8 +2,12 @@
 
 import os
 import json
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 
 from ..core.config import OPENSPEC_DIR_NAME
 
@@ -30,12 +34,74 @@ def ensure_directory(path: str) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
 
 
-def write_file(path: str, content: str) -> None:
-    """Write content to a file."""
+@dataclass
+class WriteReport:
+    """Files written and skipped as unchanged while a report was active."""
+    written: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    
+    def summary(self) -> str:
+        """Describe the counts, e.g. ``2 file(s) written, 5 unchanged``."""
+        return f"{len(self.written)} file(s) written, {len(self.skipped)} unchanged"
+
+
+_active_report: ContextVar[Optional[WriteReport]] = ContextVar("openspec_write_report", default=None)
+
+
+@contextmanager
+def track_writes() -> Iterator[WriteReport]:
+    """Collect every write_file call made inside the block into a WriteReport."""
+    report = WriteReport()
+    token = _active_report.set(report)
+    try:
+        yield report
+    finally:
+        _active_report.reset(token)
+
+
+def write_file(path: str, content: str) -> bool:
+    """Write content to a file, skipping the write if it is already identical.
+    
+    The existing file's size is compared first, so only same-sized files are
+    read back. Real writes go to a temp file in the same directory that is
+    then renamed over the target, so readers never see a partial file.
+    Returns True if the file was written.
+    """
     path_obj = Path(path)
+    data = content.encode("utf-8")
+    report = _active_report.get()
+    
+    if _has_content(path_obj, data):
+        if report is not None:
+            report.skipped.append(str(path_obj))
+        return False
+    
     # Ensure parent directories exist
     path_obj.parent.mkdir(parents=True, exist_ok=True)
-    path_obj.write_text(content, encoding="utf-8")
+    temp_path = path_obj.with_name(f".{path_obj.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(temp_path, "xb") as f:
+            f.write(data)
+        if path_obj.exists():
+            os.chmod(temp_path, path_obj.stat().st_mode & 0o7777)
+        os.replace(temp_path, path_obj)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    
+    if report is not None:
+        report.written.append(str(path_obj))
+    return True
+
+
+def _has_content(path: Path, data: bytes) -> bool:
+    """Whether a file exists with exactly the given bytes."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
 
 
 def read_file(path: str) -> str:
@@ -0,0 +1,167 @@
+"""Read files at git revisions through one long-lived ``git cat-file --batch``."""
+
+import hashlib
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class GitError(Exception):
+    """git is unavailable or an object could not be read."""
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    """One entry of a git tree object."""
+    mode: str
+    name: str
+    sha: str
+
+    @property
+    def is_tree(self) -> bool:
+        return self.mode == "40000"
+
+
+class GitObjectReader:
+    """Stream objects out of a repository without a subprocess per file.
+
+    A single ``git cat-file --batch`` process is started on first use and
+    kept open until :meth:`close`; trees are parsed once and cached, so
+    walking a directory at several revisions only reads new trees. Only
+    the local ``git`` binary is used.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = Path(repo_path)
+        self._process: Optional[subprocess.Popen] = None
+        self._trees: Dict[str, List[TreeEntry]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+    def read_object(self, name: str) -> Optional[Tuple[str, str, bytes]]:
+        """Read any object expression (``sha``, ``rev^{tree}``, ``rev:path``).
+
+        Returns ``(sha, type, data)``, or None if the object does not exist.
+        """
+        with self._lock:
+            process = self._start()
+            process.stdin.write(name.encode("utf-8") + b"\n")
+            process.stdin.flush()
+            header = process.stdout.readline()
+            if not header:
+                raise GitError("git cat-file exited unexpectedly")
+            parts = header.split()
+            if len(parts) != 3:
+                # "<name> missing" or "<name> ambiguous"
+                return None
+            sha, kind, size = parts[0].decode(), parts[1].decode(), int(parts[2])
+            data = process.stdout.read(size)
+            process.stdout.read(1)  # trailing newline
+            return sha, kind, data
+
+    def resolve_commit(self, revision: str) -> Optional[str]:
+        """The commit SHA a revision names, or None if it names no commit."""
+        found = self.read_object(f"{revision}^{{commit}}")
+        return found[0] if found else None
+
+    def tree_entries(self, tree_sha: str) -> List[TreeEntry]:
+        """Parse a tree object, once per SHA."""
+        if tree_sha not in self._trees:
+            found = self.read_object(tree_sha)
+            if found is None or found[1] != "tree":
+                raise GitError(f"{tree_sha} is not a tree")
+            self._trees[tree_sha] = _parse_tree(found[2])
+        return self._trees[tree_sha]
+
+    def list_files(
+        self, revision: str, path: str = "", descend: Optional[Callable[[str], bool]] = None
+    ) -> Dict[str, str]:
+        """Every blob below ``path`` at ``revision``, as repo-relative path to blob SHA.
+
+        ``path`` may also name a single file. Returns {} if it does not exist.
+        Subdirectories whose repo-relative path ``descend`` rejects are not read.
+        """
+        commit = self.resolve_commit(revision)
+        if commit is None:
+            raise GitError(f"'{revision}' is not a commit")
+        found = self.read_object(f"{commit}^{{tree}}")
+        entry = TreeEntry("40000", "", found[0])
+
+        parts = [part for part in path.strip("/").split("/") if part]
+        for part in parts:
+            if not entry.is_tree:
+                return {}
+            match = next((child for child in self.tree_entries(entry.sha) if child.name == part), None)
+            if match is None:
+                return {}
+            entry = match
+
+        base = "/".join(parts)
+        if not entry.is_tree:
+            return {base: entry.sha}
+        files: Dict[str, str] = {}
+        self._collect(entry.sha, base, files, descend)
+        return files
+
+    def read_blob(self, sha: str) -> bytes:
+        found = self.read_object(sha)
+        if found is None or found[1] != "blob":
+            raise GitError(f"{sha} is not a blob")
+        return found[2]
+
+    def _collect(
+        self, tree_sha: str, prefix: str, files: Dict[str, str], descend: Optional[Callable[[str], bool]] = None
+    ) -> None:
+        for entry in self.tree_entries(tree_sha):
+            path = f"{prefix}/{entry.name}" if prefix else entry.name
+            if entry.is_tree:
+                if descend is None or descend(path):
+                    self._collect(entry.sha, path, files, descend)
+            elif entry.mode != "160000":  # skip submodules
+                files[path] = entry.sha
+
+    def _start(self) -> subprocess.Popen:
+        if self._process is None:
+            try:
+                self._process = subprocess.Popen(
+                    ["git", "-C", str(self.repo_path), "cat-file", "--batch"],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                raise GitError(f"Could not run git: {e}") from e
+        return self._process
+
+
+def blob_sha(data: bytes) -> str:
+    """The SHA git would give ``data`` as a blob, to compare files with a revision."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _parse_tree(data: bytes) -> List[TreeEntry]:
+    """Decode a binary tree object: ``<mode> <name>\\0<20-byte sha>`` repeated."""
+    entries = []
+    position = 0
+    while position < len(data):
+        space = data.index(b" ", position)
+        nul = data.index(b"\0", space)
+        mode = data[position:space].decode()
+        name = data[space + 1:nul].decode("utf-8", "surrogateescape")
+        sha = data[nul + 1:nul + 21].hex()
+        entries.append(TreeEntry(mode, name, sha))
+        position = nul + 21
+    return entries
@@ -0,0 +1,88 @@
+"""Discover every OpenSpec project below a directory, e.g. in a monorepo."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import pathspec
+
+from ..core.config import OPENSPEC_DIR_NAME
+
+# Directories that never contain projects and are expensive to walk
+PRUNED_DIRS = frozenset({"node_modules", "__pycache__", "venv", "dist", "build"})
+
+# (directory the .gitignore lives in, its compiled patterns)
+_IgnoreRule = Tuple[Path, pathspec.PathSpec]
+
+
+def find_openspec_roots(root: str, workers: Optional[int] = None) -> List[Path]:
+    """Find every directory below ``root`` that contains an ``openspec/`` folder.
+
+    The tree is walked level by level, scanning each level's directories in
+    parallel. Hidden directories, well-known build and dependency folders
+    and anything matched by a ``.gitignore`` on the way down are pruned.
+    Returns sorted project paths.
+    """
+    root_path = Path(root).resolve()
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) + 4)
+
+    roots: List[Path] = []
+    frontier: List[Tuple[Path, Tuple[_IgnoreRule, ...]]] = [(root_path, ())]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while frontier:
+            next_frontier = []
+            for project, children in executor.map(lambda item: _scan(*item), frontier):
+                if project is not None:
+                    roots.append(project)
+                next_frontier.extend(children)
+            frontier = next_frontier
+
+    return sorted(roots)
+
+
+def _scan(
+    directory: Path, inherited: Tuple[_IgnoreRule, ...]
+) -> Tuple[Optional[Path], List[Tuple[Path, Tuple[_IgnoreRule, ...]]]]:
+    """Scan one directory. Returns it if it is a project, plus the subdirectories to walk."""
+    rules = inherited
+    gitignore = directory / ".gitignore"
+    if gitignore.is_file():
+        try:
+            lines = gitignore.read_text(encoding="utf-8").splitlines()
+            rules = inherited + ((directory, pathspec.GitIgnoreSpec.from_lines(lines)),)
+        except (OSError, UnicodeDecodeError):
+            pass
+
+    project = None
+    children = []
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return None, []
+
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        if entry.name == OPENSPEC_DIR_NAME:
+            project = directory
+            continue
+        if entry.name.startswith(".") or entry.name in PRUNED_DIRS:
+            continue
+        child = Path(entry.path)
+        if _is_ignored(child, rules):
+            continue
+        children.append((child, rules))
+
+    return project, children
+
+
+def _is_ignored(path: Path, rules: Sequence[_IgnoreRule]) -> bool:
+    """Whether any applicable .gitignore excludes a directory."""
+    for base, spec in rules:
+        relative = path.relative_to(base).as_posix() + "/"
+        if spec.match_file(relative):
+            return True
+    return False
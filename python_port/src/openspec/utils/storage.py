@@ -0,0 +1,278 @@
+"""Storage backends for reading and writing project files.
+
+Core operations that accept a ``storage`` argument do their file I/O
+through it instead of touching the disk directly:
+
+* ``LocalStorage`` is the default and works on the real file system.
+* ``MemoryStorage`` keeps writes and renames in memory, optionally on top
+  of another backend it reads through to; a dry run is a normal run
+  against a ``MemoryStorage`` layered over the disk.
+* ``GitTreeStorage`` reads files as they are at a git revision and
+  refuses writes.
+
+Paths are ordinary (absolute) paths in every backend.
+"""
+
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Set, Union
+
+from .file_system import ensure_directory, read_file, write_file
+from .git_objects import GitError, GitObjectReader
+
+PathLike = Union[str, Path]
+
+
+@dataclass(frozen=True)
+class FileStat:
+    """What ``Storage.stat`` reports about a path."""
+    is_dir: bool
+    size: int = 0
+    mtime_ns: int = 0
+
+
+class Storage(ABC):
+    """Interface of a storage backend: read, write, list, stat and rename."""
+
+    read_only = False
+
+    @abstractmethod
+    def read_text(self, path: PathLike) -> str:
+        """Read a file; FileNotFoundError if it does not exist."""
+
+    @abstractmethod
+    def write_text(self, path: PathLike, content: str) -> None:
+        """Write a file, creating its parent directories."""
+
+    @abstractmethod
+    def list_dir(self, path: PathLike) -> List[str]:
+        """Names of the entries of a directory ([] if it does not exist)."""
+
+    @abstractmethod
+    def stat(self, path: PathLike) -> Optional[FileStat]:
+        """Information about a path, or None if it does not exist."""
+
+    @abstractmethod
+    def rename(self, source: PathLike, destination: PathLike) -> None:
+        """Move a file or directory, creating the destination's parents."""
+
+    def exists(self, path: PathLike) -> bool:
+        return self.stat(path) is not None
+
+    def is_file(self, path: PathLike) -> bool:
+        info = self.stat(path)
+        return info is not None and not info.is_dir
+
+    def is_dir(self, path: PathLike) -> bool:
+        info = self.stat(path)
+        return info is not None and info.is_dir
+
+    def list_directories(self, path: PathLike) -> List[str]:
+        """Non-hidden subdirectories of a directory, like ``file_system.list_directories``."""
+        return [
+            name for name in self.list_dir(path)
+            if not name.startswith(".") and self.is_dir(Path(path) / name)
+        ]
+
+
+class LocalStorage(Storage):
+    """The real file system."""
+
+    def read_text(self, path: PathLike) -> str:
+        return read_file(str(path))
+
+    def write_text(self, path: PathLike, content: str) -> None:
+        write_file(str(path), content)
+
+    def list_dir(self, path: PathLike) -> List[str]:
+        try:
+            return os.listdir(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    def stat(self, path: PathLike) -> Optional[FileStat]:
+        try:
+            info = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return FileStat(os.path.isdir(path), info.st_size, info.st_mtime_ns)
+
+    def rename(self, source: PathLike, destination: PathLike) -> None:
+        ensure_directory(str(Path(destination).parent))
+        Path(source).rename(destination)
+
+
+class MemoryStorage(Storage):
+    """Files held in memory, optionally layered over a ``base`` backend.
+
+    Reads fall through to ``base`` for paths not written in memory; writes
+    and renames never reach it. ``written`` lists the paths written or
+    moved into place, in order.
+    """
+
+    def __init__(self, base: Optional[Storage] = None):
+        self.base = base
+        self.written: List[str] = []
+        self._files: Dict[str, str] = {}
+        self._removed: Set[str] = set()
+        # archive_changes may archive independent chains from several threads
+        self._lock = threading.RLock()
+
+    def read_text(self, path: PathLike) -> str:
+        key = _key(path)
+        if key in self._files:
+            return self._files[key]
+        if self.base is not None and not self._is_removed(key):
+            return self.base.read_text(path)
+        raise FileNotFoundError(key)
+
+    def write_text(self, path: PathLike, content: str) -> None:
+        key = _key(path)
+        with self._lock:
+            self._files[key] = content
+            self.written.append(key)
+
+    def list_dir(self, path: PathLike) -> List[str]:
+        key = _key(path)
+        names = set()
+        if self.base is not None and not self._is_removed(key):
+            names.update(
+                name for name in self.base.list_dir(path)
+                if not self._is_removed(f"{key}/{name}")
+            )
+        prefix = key.rstrip("/") + "/"
+        for file_key in list(self._files):
+            if file_key.startswith(prefix):
+                names.add(file_key[len(prefix):].split("/", 1)[0])
+        return sorted(names)
+
+    def stat(self, path: PathLike) -> Optional[FileStat]:
+        key = _key(path)
+        if key in self._files:
+            return FileStat(False, len(self._files[key].encode("utf-8")))
+        prefix = key.rstrip("/") + "/"
+        if any(file_key.startswith(prefix) for file_key in list(self._files)):
+            return FileStat(True)
+        if self.base is not None and not self._is_removed(key):
+            return self.base.stat(path)
+        return None
+
+    def rename(self, source: PathLike, destination: PathLike) -> None:
+        source_key, destination_key = _key(source), _key(destination)
+        with self._lock:
+            if self.is_file(source):
+                self.write_text(destination_key, self.read_text(source_key))
+                self._files.pop(source_key, None)
+            elif self.is_dir(source):
+                for relative in self._walk(source_key):
+                    content = self.read_text(f"{source_key}/{relative}")
+                    self.write_text(f"{destination_key}/{relative}", content)
+                    self._files.pop(f"{source_key}/{relative}", None)
+            else:
+                raise FileNotFoundError(source_key)
+            self._removed.add(source_key)
+
+    def _walk(self, key: str) -> List[str]:
+        """Relative paths of all files below a directory."""
+        files = []
+        for name in self.list_dir(key):
+            child = f"{key}/{name}"
+            if self.is_dir(child):
+                files.extend(f"{name}/{relative}" for relative in self._walk(child))
+            else:
+                files.append(name)
+        return files
+
+    def _is_removed(self, key: str) -> bool:
+        """Whether a path was moved away (files written there since still count)."""
+        return any(
+            key == removed or key.startswith(removed + "/")
+            for removed in self._removed
+        )
+
+
+class GitTreeStorage(Storage):
+    """Read-only view of a repository's files at a revision.
+
+    Paths are resolved against the repository root ``repo_path``.
+    """
+
+    read_only = True
+
+    def __init__(self, repo_path: PathLike, revision: str, reader: Optional[GitObjectReader] = None):
+        self.repo_path = Path(repo_path).resolve()
+        self.revision = revision
+        self._owns_reader = reader is None
+        self.reader = reader or GitObjectReader(self.repo_path)
+        self._blobs: Optional[Dict[str, str]] = None
+        self._dirs: Set[str] = set()
+
+    def close(self) -> None:
+        """Stop the git reader, unless it was passed in."""
+        if self._owns_reader:
+            self.reader.close()
+
+    def read_text(self, path: PathLike) -> str:
+        sha = self._files().get(self._relative(path))
+        if sha is None:
+            raise FileNotFoundError(str(path))
+        return self.reader.read_blob(sha).decode("utf-8")
+
+    def write_text(self, path: PathLike, content: str) -> None:
+        raise PermissionError(f"{self.revision} is read-only")
+
+    def rename(self, source: PathLike, destination: PathLike) -> None:
+        raise PermissionError(f"{self.revision} is read-only")
+
+    def list_dir(self, path: PathLike) -> List[str]:
+        relative = self._relative(path)
+        if relative is None or (relative and relative not in self._dirs_of()):
+            return []
+        prefix = f"{relative}/" if relative else ""
+        return sorted({
+            file_path[len(prefix):].split("/", 1)[0]
+            for file_path in self._files()
+            if file_path.startswith(prefix)
+        })
+
+    def stat(self, path: PathLike) -> Optional[FileStat]:
+        relative = self._relative(path)
+        if relative is None:
+            return None
+        if relative == "" or relative in self._dirs_of():
+            return FileStat(True)
+        if relative in self._files():
+            return FileStat(False)
+        return None
+
+    def _relative(self, path: PathLike) -> Optional[str]:
+        try:
+            relative = PurePosixPath(Path(path).resolve().relative_to(self.repo_path).as_posix())
+        except ValueError:
+            return None
+        return "" if str(relative) == "." else str(relative)
+
+    def _files(self) -> Dict[str, str]:
+        if self._blobs is None:
+            try:
+                self._blobs = self.reader.list_files(self.revision)
+            except GitError as e:
+                raise FileNotFoundError(str(e)) from e
+            for file_path in self._blobs:
+                parts = file_path.split("/")[:-1]
+                self._dirs.update("/".join(parts[:depth]) for depth in range(1, len(parts) + 1))
+        return self._blobs
+
+    def _dirs_of(self) -> Set[str]:
+        self._files()
+        return self._dirs
+
+
+LOCAL_STORAGE = LocalStorage()
+
+
+def _key(path: PathLike) -> str:
+    return Path(path).as_posix()
@@ -0,0 +1,153 @@
+"""Task progress of a change, read from its ``tasks.md``.
+
+One pass over the file builds a tree of checkbox tasks grouped by section.
+Checkboxes may use ``-``, ``*``, ``+`` or numbered bullets and ``[x]`` or
+``[X]``. Nesting follows indentation. Sections start at markdown headings
+or at unindented numbered lines such as ``1. Implementation``. Results are
+cached per file by modification time and size, so listing many changes
+only rescans the task files that changed.
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+TASKS_FILE_NAME = "tasks.md"
+
+_CHECKBOX_PATTERN = re.compile(r"^(\s*)(?:[-*+]|\d+[.)])\s+\[([ xX]?)\](?:\s+(.*))?$")
+_HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+# The "." or ")" is required, so a line like "3 items left" stays plain text
+_NUMBERED_SECTION_PATTERN = re.compile(r"^\d+(?:\.\d+)*[.)]\s+(.+?)\s*$")
+
+_cache: Dict[str, Tuple[Tuple[int, int], "TaskProgress"]] = {}
+_cache_lock = threading.Lock()
+
+
+@dataclass
+class Task:
+    """One checkbox item."""
+    text: str
+    done: bool
+    depth: int
+    line: int  # 1-based
+    section: str
+    children: List["Task"] = field(default_factory=list)
+
+
+@dataclass
+class TaskSection:
+    """Tasks under one heading or numbered section ("" before the first one)."""
+    title: str
+    tasks: List[Task] = field(default_factory=list)  # every task, nested ones included
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for task in self.tasks if task.done)
+
+    @property
+    def total(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def percent(self) -> int:
+        return _percent(self.completed, self.total)
+
+
+@dataclass
+class TaskProgress:
+    """All tasks of a change, by section."""
+    sections: List[TaskSection] = field(default_factory=list)
+
+    @property
+    def tasks(self) -> List[Task]:
+        return [task for section in self.sections for task in section.tasks]
+
+    @property
+    def roots(self) -> List[Task]:
+        return [task for task in self.tasks if task.depth == 0]
+
+    @property
+    def completed(self) -> int:
+        return sum(section.completed for section in self.sections)
+
+    @property
+    def total(self) -> int:
+        return sum(section.total for section in self.sections)
+
+    @property
+    def incomplete(self) -> int:
+        return self.total - self.completed
+
+    @property
+    def percent(self) -> int:
+        return _percent(self.completed, self.total)
+
+
+def scan_tasks(content: str) -> TaskProgress:
+    """Build the task tree of a ``tasks.md`` in a single pass."""
+    progress = TaskProgress()
+    section = TaskSection("")
+    stack: List[Tuple[int, Task]] = []
+
+    for number, line in enumerate(content.splitlines(), 1):
+        checkbox = _CHECKBOX_PATTERN.match(line)
+        if checkbox:
+            indent = len(checkbox.group(1).expandtabs(4))
+            while stack and stack[-1][0] >= indent:
+                stack.pop()
+            task = Task(
+                text=(checkbox.group(3) or "").strip(),
+                done=checkbox.group(2) in ("x", "X"),
+                depth=len(stack),
+                line=number,
+                section=section.title,
+            )
+            if stack:
+                stack[-1][1].children.append(task)
+            stack.append((indent, task))
+            section.tasks.append(task)
+            continue
+
+        heading = _HEADING_PATTERN.match(line) or _NUMBERED_SECTION_PATTERN.match(line)
+        if heading:
+            if section.tasks or section.title:
+                progress.sections.append(section)
+            section = TaskSection(heading.group(1))
+            stack = []
+
+    if section.tasks or section.title:
+        progress.sections.append(section)
+    progress.sections = [s for s in progress.sections if s.tasks]
+    return progress
+
+
+def load_task_progress(change_path: Path) -> TaskProgress:
+    """The task progress of a change directory, rescanned only when tasks.md changed."""
+    tasks_file = str(Path(change_path) / TASKS_FILE_NAME)
+    try:
+        info = os.stat(tasks_file)
+    except OSError:
+        return TaskProgress()
+    stamp = (info.st_mtime_ns, info.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(tasks_file)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        with open(tasks_file, "r", encoding="utf-8") as f:
+            progress = scan_tasks(f.read())
+    except (OSError, UnicodeDecodeError):
+        return TaskProgress()
+    with _cache_lock:
+        _cache[tasks_file] = (stamp, progress)
+    return progress
+
+
+def _percent(completed: int, total: int) -> int:
+    # Rounded down, so 100% means every task is done
+    return completed * 100 // total if total else 0
@@ -0,0 +1,56 @@
+"""Tests for change subcommands."""
+
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from openspec.cli.main import main
+from openspec.core.change_operations import find_change_conflicts
+
+
+def _write_delta(project, change, spec, content):
+    delta_dir = project / "openspec" / "changes" / change / "specs" / spec
+    delta_dir.mkdir(parents=True)
+    (delta_dir / "spec.md").write_text(content)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with three active changes, two of them overlapping."""
+    (tmp_path / "openspec" / "specs").mkdir(parents=True)
+    _write_delta(tmp_path, "mfa", "auth", "## MODIFIED Requirements\n\n### Requirement: Login\nText\n")
+    _write_delta(
+        tmp_path, "sso", "auth",
+        "## RENAMED Requirements\n- FROM: `### Requirement: Login`\n- TO: `### Requirement: Sign in`\n",
+    )
+    _write_delta(tmp_path, "docs", "guide", "## ADDED Requirements\n\n### Requirement: Index\nText\n")
+    (tmp_path / "openspec" / "changes" / "archive" / "old").mkdir(parents=True)
+    return tmp_path
+
+
+def test_find_change_conflicts(project):
+    """Requirements touched by several changes are reported once each."""
+    report = find_change_conflicts(str(project))
+
+    assert report.changes == ["docs", "mfa", "sso"]
+    assert [(c.spec_name, c.requirement) for c in report.conflicts] == [("auth", "Login")]
+    assert report.conflicts[0].changes == [("mfa", "MODIFIED"), ("sso", "RENAMED")]
+    assert report.independent == ["docs"]
+
+
+def test_change_conflicts_json(project):
+    """The command emits the report as JSON."""
+    runner = CliRunner()
+    cwd = os.getcwd()
+    try:
+        os.chdir(str(project))
+        result = runner.invoke(main, ["change", "conflicts", "--json"])
+    finally:
+        os.chdir(cwd)
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["conflicts"][0]["requirement"] == "Login"
+    assert data["independent"] == ["docs"]
@@ -0,0 +1,36 @@
+"""Tests for running configurators concurrently."""
+
+from openspec.core.config import AI_TOOLS
+from openspec.core.configurators.runner import configure_tools
+from openspec.utils.file_system import track_writes
+
+
+def test_configure_all_tools_in_one_pass(tmp_path):
+    """Every registered configurator runs and a repeat run writes nothing."""
+    tool_ids = [tool.value for tool in AI_TOOLS if tool.available]
+
+    with track_writes() as first:
+        results = configure_tools(str(tmp_path), str(tmp_path / "openspec"), tool_ids)
+
+    assert all(result.ok for result in results)
+    assert (tmp_path / "CLAUDE.md").exists()
+    assert (tmp_path / ".cursor" / "commands" / "openspec-proposal.md").exists()
+    assert (tmp_path / ".clinerules" / "openspec-apply.md").exists()
+    assert (tmp_path / ".github" / "prompts" / "openspec-archive.prompt.md").exists()
+    assert (tmp_path / ".windsurf" / "workflows" / "openspec-proposal.md").exists()
+    assert len(first.written) >= 16
+
+    with track_writes() as second:
+        configure_tools(str(tmp_path), str(tmp_path / "openspec"), tool_ids, update_only=True)
+
+    assert second.written == []
+    assert len(second.skipped) == len(first.written)
+
+
+def test_update_only_skips_missing_files(tmp_path):
+    """Update mode leaves tools that were never configured alone."""
+    results = configure_tools(str(tmp_path), str(tmp_path / "openspec"), ["claude", "cursor"], update_only=True)
+
+    assert all(result.paths == [] for result in results)
+    assert not (tmp_path / "CLAUDE.md").exists()
+    assert not (tmp_path / ".cursor").exists()
@@ -213,6 +213,34 @@ The system SHALL provide secure user authentication with 2FA.
         assert removed_req["title"] == "Anonymous Access"
         assert "Security policy no longer allows" in removed_req["removal_reason"]
     
+    def test_parse_scenario_level_operations(self, parser):
+        """Test scenario directives nested under a MODIFIED requirement."""
+        content = """## MODIFIED Requirements
+
+### Requirement: User Authentication
+
+#### ADDED Scenarios
+##### Scenario: Hardware key
+- **WHEN** a hardware key is presented
+- **THEN** access is granted
+
+#### MODIFIED Scenarios
+##### Scenario: Valid Credentials!
+- **WHEN** credentials and code are valid
+
+#### REMOVED Scenarios
+- `remember-me`"""
+        
+        result = parser.parse_change_spec(content)
+        req = result["modified_requirements"][0]
+        
+        assert req["scenarios"] == []
+        ops = req["scenario_ops"]
+        assert [s["id"] for s in ops["added"]] == ["hardware-key"]
+        assert ops["added"][0]["steps"][1] == "- **THEN** access is granted"
+        assert ops["modified"][0]["id"] == "valid-credentials"
+        assert ops["removed"] == ["remember-me"]
+    
     def test_parse_empty_content(self, parser):
         """Test parsing empty content."""
         result = parser.parse_proposal("")
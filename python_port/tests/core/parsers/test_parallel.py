@@ -0,0 +1,108 @@
+"""Tests for the parallel multi-file parser."""
+
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+
+from openspec.core.parsers import parse_many
+from openspec.core.parsers import parallel
+
+
+SPEC_TEMPLATE = """# {name} Specification
+
+## Purpose
+Purpose of {name}.
+
+## Requirements
+
+### Requirement: {name} requirement
+The system SHALL support {name}.
+
+#### Scenario: {name} works
+- **WHEN** {name} is used
+- **THEN** it works
+"""
+
+
+@pytest.fixture
+def spec_files():
+    """Create a directory of spec files with varying sizes."""
+    temp_dir = tempfile.mkdtemp()
+    paths = []
+    for i in range(20):
+        name = f"spec-{i}"
+        path = Path(temp_dir) / f"{name}.md"
+        path.write_text(SPEC_TEMPLATE.format(name=name) + ("\n" * i * 50))
+        paths.append(str(path))
+    yield paths
+    shutil.rmtree(temp_dir)
+
+
+def test_parse_many_preserves_input_order(spec_files):
+    """Results line up with the input paths regardless of chunking."""
+    results = parse_many(spec_files, workers=4)
+
+    assert [r["path"] for r in results] == spec_files
+    for i, result in enumerate(results):
+        assert result["title"] == f"spec-{i} Specification"
+        assert result["requirements"][0]["title"] == f"spec-{i} requirement"
+
+
+def test_parse_many_compact_drops_raw_content(spec_files):
+    """Compact results omit the raw source text."""
+    compact = parse_many(spec_files[:2], workers=1)
+    full = parse_many(spec_files[:2], workers=1, compact=False)
+
+    assert "raw_content" not in compact[0]
+    assert "raw_content" in full[0]
+
+
+def test_parse_many_change_kind(tmp_path):
+    """Change deltas are parsed with parse_change_spec."""
+    delta = tmp_path / "spec.md"
+    delta.write_text("## ADDED Requirements\n\n### Requirement: New thing\nText\n")
+
+    results = parse_many([str(delta)], kind="change")
+
+    assert results[0]["added_requirements"][0]["title"] == "New thing"
+
+
+def test_parse_many_rejects_unknown_kind(spec_files):
+    """Unknown parse kinds raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown parse kind"):
+        parse_many(spec_files, kind="yaml")
+
+
+def test_parse_many_empty():
+    """An empty batch returns an empty list."""
+    assert parse_many([]) == []
+
+
+def test_choose_executor_thresholds():
+    """Small batches stay inline or on threads; large ones use processes."""
+    assert parallel._choose_executor(3, 10_000_000, 8) is None
+    assert parallel._choose_executor(100, 10_000_000, 1) is None
+    assert parallel._choose_executor(20, 50_000, 8) == "thread"
+    assert parallel._choose_executor(500, 10_000_000, 8) == "process"
+
+
+def test_chunk_by_size_balances_load():
+    """Chunks are balanced by total bytes, not file count."""
+    paths = [f"f{i}" for i in range(6)]
+    sizes = [100, 1, 1, 1, 1, 96]
+
+    chunks = parallel._chunk_by_size(paths, sizes, 2)
+    loads = sorted(sum(sizes[i] for i, _ in chunk) for chunk in chunks)
+
+    assert loads == [100, 100]
+
+
+def test_parse_many_process_pool(spec_files, monkeypatch):
+    """The process pool path returns the same results as the inline path."""
+    monkeypatch.setattr(parallel, "_choose_executor", lambda *args: "process")
+
+    results = parse_many(spec_files, workers=2)
+
+    assert [r["path"] for r in results] == spec_files
+    assert results[5]["requirements"][0]["title"] == "spec-5 requirement"
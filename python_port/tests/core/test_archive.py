@@ -5,6 +5,7 @@ import tempfile
 import shutil
 import os
 from pathlib import Path
+import click
 from unittest.mock import Mock, patch
 from datetime import date
 
@@ -274,4 +275,234 @@ New description"""
         assert change_dir.exists()
         archive_dir = temp_dir / "openspec" / "changes" / "archive"
         archives = list(archive_dir.iterdir())
-        assert len(archives) == 0
\ No newline at end of file
+        assert len(archives) == 0    
+    def test_should_fail_validation_before_touching_files(self, temp_dir, archive_command):
+        """Test that invalid deltas abort the archive before any write."""
+        change_name = "invalid-delta"
+        change_dir = temp_dir / "openspec" / "changes" / change_name
+        change_spec_dir = change_dir / "specs" / "existing-spec"
+        change_spec_dir.mkdir(parents=True)
+        
+        main_spec_dir = temp_dir / "openspec" / "specs" / "existing-spec"
+        main_spec_dir.mkdir(parents=True)
+        existing_content = """# existing-spec Specification
+
+## Purpose
+Existing purpose
+
+## Requirements
+
+### Requirement: Existing requirement
+Existing description
+
+#### Scenario: Works
+- **WHEN** used
+- **THEN** works"""
+        (main_spec_dir / "spec.md").write_text(existing_content)
+        
+        # Valid ADDED plus a MODIFIED that targets a missing requirement
+        (change_spec_dir / "spec.md").write_text("""## ADDED Requirements
+
+### Requirement: New requirement
+New description
+
+#### Scenario: New
+- **WHEN** new
+- **THEN** works
+
+## MODIFIED Requirements
+
+### Requirement: Missing requirement
+Changed
+
+#### Scenario: Changed
+- **WHEN** changed
+- **THEN** works""")
+        
+        with pytest.raises(click.exceptions.Abort):
+            archive_command.execute(change_name, yes=True)
+        
+        assert (main_spec_dir / "spec.md").read_text() == existing_content
+        assert change_dir.exists()
+        archive_dir = temp_dir / "openspec" / "changes" / "archive"
+        assert list(archive_dir.iterdir()) == []
+    
+    def test_should_archive_invalid_deltas_with_no_validate(self, temp_dir, archive_command):
+        """Test that --no-validate skips pre-archive validation."""
+        change_name = "unchecked-delta"
+        change_spec_dir = temp_dir / "openspec" / "changes" / change_name / "specs" / "new-spec"
+        change_spec_dir.mkdir(parents=True)
+        (change_spec_dir / "spec.md").write_text("## ADDED Requirements\n\n### Requirement: No scenarios\nText")
+        
+        archive_command.execute(change_name, yes=True, no_validate=True)
+        
+        main_spec_path = temp_dir / "openspec" / "specs" / "new-spec" / "spec.md"
+        assert "### Requirement: No scenarios" in main_spec_path.read_text()
+
+
+class TestSpecDeltaValidation:
+    """Test cases for pre-archive spec delta validation."""
+    
+    def _plans(self, tmp_path, delta_content, main_content=None):
+        from openspec.core.change_operations import load_spec_delta_plans
+        
+        change_dir = tmp_path / "openspec" / "changes" / "c1"
+        (change_dir / "specs" / "alpha").mkdir(parents=True)
+        (change_dir / "specs" / "alpha" / "spec.md").write_text(delta_content)
+        if main_content is not None:
+            (tmp_path / "openspec" / "specs" / "alpha").mkdir(parents=True)
+            (tmp_path / "openspec" / "specs" / "alpha" / "spec.md").write_text(main_content)
+        return load_spec_delta_plans(str(tmp_path), change_dir)
+    
+    def test_reports_duplicate_added_and_missing_scenarios(self, tmp_path):
+        """Test duplicate ADDED titles and missing scenarios are reported."""
+        from openspec.core.change_operations import validate_spec_delta_plans
+        
+        plans = self._plans(tmp_path, """## ADDED Requirements
+
+### Requirement: Twice
+#### Scenario: One
+- **WHEN** x
+
+### Requirement: Twice
+Text only
+
+## REMOVED Requirements
+
+### Requirement: Ghost""")
+        
+        errors = validate_spec_delta_plans(plans)
+        
+        assert "alpha: Duplicate ADDED requirement 'Twice'" in errors
+        assert "alpha: ADDED requirement 'Twice' has no scenarios" in errors
+        assert "alpha: REMOVED requirement 'Ghost' not found in the spec" in errors
+    
+    def test_plans_parse_target_spec_once(self, tmp_path):
+        """Test that the parsed main spec is carried on the plan for the merge."""
+        from openspec.core.change_operations import validate_spec_delta_plans
+        
+        plans = self._plans(
+            tmp_path,
+            "## REMOVED Requirements\n\n### Requirement: Old\n",
+            "# Alpha\n\n## Purpose\nP\n\n## Requirements\n\n### Requirement: Old\nText\n",
+        )
+        
+        assert plans[0].existing["requirements"][0]["title"] == "Old"
+        assert validate_spec_delta_plans(plans) == []
+
+
+class TestScenarioOperations:
+    """Test cases for scenario-level delta operations."""
+    
+    MAIN = """# alpha Specification
+
+## Purpose
+Alpha purpose
+
+## Requirements
+
+### Requirement: Login
+Users SHALL log in.
+
+#### Scenario: Valid credentials
+- **WHEN** credentials are valid
+- **THEN** access is granted
+
+#### Scenario: Remember me
+- **WHEN** remember me is checked
+- **THEN** the session persists
+
+### Requirement: Logout
+Users SHALL log out.
+
+#### Scenario: Logout
+- **WHEN** the user logs out
+- **THEN** the session ends
+"""
+    
+    DELTA = """## MODIFIED Requirements
+
+### Requirement: Login
+
+#### ADDED Scenarios
+##### Scenario: Hardware key
+- **WHEN** a hardware key is presented
+- **THEN** access is granted
+
+#### MODIFIED Scenarios
+##### Scenario: Valid credentials
+- **WHEN** credentials and code are valid
+- **THEN** access is granted
+
+#### REMOVED Scenarios
+- Remember me
+"""
+    
+    def _project(self, tmp_path, delta):
+        (tmp_path / "openspec" / "specs" / "alpha").mkdir(parents=True)
+        (tmp_path / "openspec" / "specs" / "alpha" / "spec.md").write_text(self.MAIN)
+        change_dir = tmp_path / "openspec" / "changes" / "c1"
+        (change_dir / "specs" / "alpha").mkdir(parents=True)
+        (change_dir / "specs" / "alpha" / "spec.md").write_text(delta)
+        return tmp_path
+    
+    def test_archive_patches_only_targeted_scenarios(self, tmp_path):
+        """Test that scenario operations leave the rest of the spec untouched."""
+        from openspec.core.change_operations import archive_change
+        
+        project = self._project(tmp_path, self.DELTA)
+        archive_change(str(project), "c1")
+        
+        content = (project / "openspec" / "specs" / "alpha" / "spec.md").read_text()
+        expected = self.MAIN.replace(
+            "- **WHEN** credentials are valid", "- **WHEN** credentials and code are valid"
+        ).replace(
+            "#### Scenario: Remember me\n- **WHEN** remember me is checked\n- **THEN** the session persists",
+            "#### Scenario: Hardware key\n- **WHEN** a hardware key is presented\n- **THEN** access is granted",
+        )
+        assert content == expected
+    
+    def test_merge_requirements_applies_scenario_operations(self, tmp_path):
+        """Test the structural merge used when a delta mixes operations."""
+        from openspec.core.change_operations import load_spec_delta_plans, merge_requirements
+        
+        project = self._project(tmp_path, self.DELTA)
+        plan = load_spec_delta_plans(str(project), project / "openspec" / "changes" / "c1")[0]
+        
+        merged = merge_requirements(plan.existing["requirements"], plan.delta)
+        
+        assert [s["title"] for s in merged[0]["scenarios"]] == ["Valid credentials", "Hardware key"]
+        assert "code are valid" in merged[0]["scenarios"][0]["steps"][0]
+        assert len(plan.existing["requirements"][0]["scenarios"]) == 2
+    
+    def test_validation_reports_unknown_scenarios(self, tmp_path):
+        """Test that scenario operations must match existing scenario IDs."""
+        from openspec.core.change_operations import load_spec_delta_plans, validate_spec_delta_plans
+        
+        delta = self.DELTA.replace("Scenario: Hardware key", "Scenario: Valid Credentials").replace(
+            "- Remember me", "- ghost"
+        )
+        project = self._project(tmp_path, delta)
+        plans = load_spec_delta_plans(str(project), project / "openspec" / "changes" / "c1")
+        
+        errors = validate_spec_delta_plans(plans)
+        
+        assert "alpha: ADDED scenario 'Valid Credentials' already exists in requirement 'Login'" in errors
+        assert "alpha: REMOVED scenario 'ghost' not found in requirement 'Login'" in errors
+    
+    def test_sibling_scenario_edits_are_not_stale(self, tmp_path):
+        """Test that edits to untouched scenarios do not block the archive."""
+        from openspec.core.change_operations import load_spec_delta_plans
+        from openspec.core.fingerprints import find_stale_requirements, record_base_fingerprints
+        
+        project = self._project(tmp_path, self.DELTA)
+        change_dir = project / "openspec" / "changes" / "c1"
+        record_base_fingerprints(change_dir, load_spec_delta_plans(str(project), change_dir))
+        spec_path = project / "openspec" / "specs" / "alpha" / "spec.md"
+        
+        spec_path.write_text(self.MAIN.replace("Users SHALL log in.", "Users SHALL sign in."))
+        assert find_stale_requirements(change_dir, load_spec_delta_plans(str(project), change_dir)) == []
+        
+        spec_path.write_text(self.MAIN.replace("the session persists", "the session lasts"))
+        stale = find_stale_requirements(change_dir, load_spec_delta_plans(str(project), change_dir))
+        assert [s.requirement for s in stale] == ["Login"]
@@ -0,0 +1,112 @@
+"""Tests for the archive name index."""
+
+import os
+from datetime import date
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.list_cmd import list_changes as list_command
+from openspec.core.archive_index import ArchiveEntry, ArchiveIndex, index_path, rebuild_archive_index
+from openspec.core.archive_pack import pack_archives
+from openspec.core.change_operations import archive_change, show_change
+
+
+def _archived(archive_dir, directory, spec=None):
+    (archive_dir / directory).mkdir(parents=True)
+    (archive_dir / directory / "tasks.md").write_text(f"- [x] {directory}\n")
+    if spec:
+        (archive_dir / directory / "specs" / spec).mkdir(parents=True)
+        (archive_dir / directory / "specs" / spec / "spec.md").write_text("## ADDED Requirements\n")
+
+
+def test_archive_change_records_entry_and_show_resolves_original_id(tmp_path):
+    """An archived change is found by the ID it had while active."""
+    change_dir = tmp_path / "openspec" / "changes" / "add-login"
+    change_dir.mkdir(parents=True)
+    (change_dir / "proposal.md").write_text("# add-login\n")
+
+    archived_path = archive_change(str(tmp_path), "add-login", skip_specs=True)
+
+    archive_dir = tmp_path / "openspec" / "changes" / "archive"
+    entry = ArchiveIndex.load(archive_dir).lookup("add-login")
+    assert entry.directory == os.path.basename(archived_path)
+    assert entry.archived_at.startswith(date.today().isoformat() + "T")
+    assert index_path(archive_dir).is_file()
+
+    info = show_change(str(tmp_path), "add-login")
+    assert info["is_archived"]
+    assert info["name"] == entry.directory
+
+
+def test_archive_change_indexes_same_day_archives_in_applied_order(tmp_path):
+    """A missing index is seeded from the archive and keeps each archive's time."""
+    archive_dir = tmp_path / "openspec" / "changes" / "archive"
+    _archived(archive_dir, "2024-01-02-older")
+    for name in ("zeta", "alpha"):
+        (tmp_path / "openspec" / "changes" / name).mkdir(parents=True)
+        (tmp_path / "openspec" / "changes" / name / "proposal.md").write_text(f"# {name}\n")
+        archive_change(str(tmp_path), name, skip_specs=True)
+
+    entries = ArchiveIndex.load(archive_dir).entries
+    assert [entry.change_id for entry in entries] == ["older", "zeta", "alpha"]
+    assert entries[0].archived_at == "2024-01-02"
+    assert all("T" in entry.archived_at for entry in entries[1:])
+
+
+def test_rebuild_from_directories_and_pack(tmp_path):
+    """Rebuilding recovers IDs, dates and specs from dated names and the pack."""
+    archive_dir = tmp_path / "openspec" / "changes" / "archive"
+    _archived(archive_dir, "2023-03-01-add-auth", spec="auth")
+    _archived(archive_dir, "2024-01-02-add-auth", spec="auth")
+    _archived(archive_dir, "2024-05-06-add-billing", spec="billing")
+    pack_archives(archive_dir, older_than_days=0, today=date(2024, 1, 31))
+    index_path(archive_dir).write_text("not json")
+
+    index = rebuild_archive_index(archive_dir)
+
+    assert [entry.directory for entry in index.entries] == [
+        "2023-03-01-add-auth", "2024-01-02-add-auth", "2024-05-06-add-billing",
+    ]
+    assert index.lookup("add-auth").directory == "2024-01-02-add-auth"
+    assert index.lookup("2023-03-01-add-auth").change_id == "add-auth"
+    assert [entry.directory for entry in index.since("2024-01-02")] == [
+        "2024-01-02-add-auth", "2024-05-06-add-billing",
+    ]
+    assert [entry.directory for entry in index.touching("auth")] == [
+        "2023-03-01-add-auth", "2024-01-02-add-auth",
+    ]
+    assert show_change(str(tmp_path), "add-auth")["is_packed"]
+
+
+def test_same_day_archives_keep_the_order_they_were_applied(tmp_path):
+    """Entries sort by the recorded timestamp, not by name, and reads never write."""
+    archive_dir = tmp_path / "openspec" / "changes" / "archive"
+    _archived(archive_dir, "2024-05-06-zeta", spec="auth")
+    _archived(archive_dir, "2024-05-06-alpha", spec="auth")
+
+    assert len(ArchiveIndex.load(archive_dir).entries) == 2
+    assert not index_path(archive_dir).exists()
+
+    ArchiveIndex(archive_dir, [
+        ArchiveEntry("zeta", "2024-05-06-zeta", "2024-05-06T09:00:00", ["auth"]),
+        ArchiveEntry("alpha", "2024-05-06-alpha", "2024-05-06T17:30:00", ["auth"]),
+    ]).save()
+    assert [e.directory for e in ArchiveIndex.load(archive_dir).entries] == ["2024-05-06-zeta", "2024-05-06-alpha"]
+    assert [e.directory for e in ArchiveIndex.load(archive_dir).until("2024-05-06")] == ["2024-05-06-zeta", "2024-05-06-alpha"]
+
+    # Rebuilding keeps the recorded timestamps
+    assert [e.directory for e in rebuild_archive_index(archive_dir).entries] == ["2024-05-06-zeta", "2024-05-06-alpha"]
+
+
+def test_list_since_filters_archived_changes(tmp_path, monkeypatch):
+    """list --since shows only changes archived on or after the date."""
+    archive_dir = tmp_path / "openspec" / "changes" / "archive"
+    _archived(archive_dir, "2023-03-01-old")
+    _archived(archive_dir, "2024-05-06-new")
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(list_command, ["--since", "2024-01-01"])
+
+    assert result.exit_code == 0, result.output
+    assert "2024-05-06-new" in result.output
+    assert "2023-03-01-old" not in result.output
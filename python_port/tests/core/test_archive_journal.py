@@ -0,0 +1,89 @@
+"""Tests for the journaled archive transaction."""
+
+import json
+
+import pytest
+
+from openspec.core.archive_journal import (
+    ArchiveTransaction,
+    journal_path,
+    pending_journals,
+    recover_archives,
+)
+from openspec.core.change_operations import archive_change
+
+
+@pytest.fixture
+def changes_dir(tmp_path):
+    """Create a change and two specs it rewrites."""
+    changes = tmp_path / "openspec" / "changes"
+    (changes / "c1").mkdir(parents=True)
+    (changes / "c1" / "proposal.md").write_text("# c1\n")
+    for spec_name in ("alpha", "beta"):
+        spec_dir = tmp_path / "openspec" / "specs" / spec_name
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "spec.md").write_text("old\n")
+    return changes
+
+
+def _transaction(changes_dir):
+    return ArchiveTransaction(
+        changes_dir, "c1", changes_dir / "c1", changes_dir / "archive" / "2024-01-01-c1"
+    )
+
+
+def _writes(changes_dir):
+    specs = changes_dir.parent / "specs"
+    return [(specs / "alpha" / "spec.md", "new alpha\n"), (specs / "beta" / "spec.md", "new beta\n")]
+
+
+def test_transaction_applies_all_writes(changes_dir):
+    """Specs are replaced, the change is moved and the journal removed."""
+    _transaction(changes_dir).run(_writes(changes_dir))
+
+    specs = changes_dir.parent / "specs"
+    assert (specs / "alpha" / "spec.md").read_text() == "new alpha\n"
+    assert (specs / "beta" / "spec.md").read_text() == "new beta\n"
+    assert (changes_dir / "archive" / "2024-01-01-c1" / "proposal.md").exists()
+    assert pending_journals(changes_dir) == []
+    assert not journal_path(changes_dir, "c1").parent.exists()
+    assert not list(specs.rglob("*.archive-tmp"))
+
+
+def test_recover_rolls_committed_journal_forward(changes_dir, monkeypatch):
+    """A crash after the commit point is completed by recovery."""
+    import openspec.core.archive_journal as archive_journal
+
+    def crash(journal):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(archive_journal, "roll_forward", crash)
+    with pytest.raises(KeyboardInterrupt):
+        _transaction(changes_dir).run(_writes(changes_dir))
+    monkeypatch.undo()
+
+    assert (changes_dir.parent / "specs" / "alpha" / "spec.md").read_text() == "old\n"
+    with pytest.raises(RuntimeError, match="--recover"):
+        archive_change(str(changes_dir.parent.parent), "c1")
+
+    assert recover_archives(changes_dir) == [{"change": "c1", "action": "completed"}]
+    assert (changes_dir.parent / "specs" / "beta" / "spec.md").read_text() == "new beta\n"
+    assert (changes_dir / "archive" / "2024-01-01-c1").exists()
+    assert not journal_path(changes_dir, "c1").parent.exists()
+
+
+def test_recover_rolls_prepared_journal_back(changes_dir):
+    """A journal that never committed only has its temp files removed."""
+    temp = changes_dir.parent / "specs" / "alpha" / ".spec.md.x.archive-tmp"
+    temp.write_text("partial")
+    journal_path(changes_dir, "c1").parent.mkdir()
+    journal_path(changes_dir, "c1").write_text(json.dumps({
+        "version": 1, "change": "c1", "state": "prepared",
+        "source": str(changes_dir / "c1"), "destination": str(changes_dir / "archive" / "x"),
+        "writes": [{"target": str(temp.parent / "spec.md"), "temp": str(temp)}],
+    }))
+
+    assert recover_archives(changes_dir) == [{"change": "c1", "action": "rolled back"}]
+    assert not temp.exists()
+    assert (changes_dir / "c1").exists()
+    assert (temp.parent / "spec.md").read_text() == "old\n"
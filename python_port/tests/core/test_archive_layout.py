@@ -0,0 +1,71 @@
+"""Tests for the date-partitioned archive layout."""
+
+from datetime import date
+
+import openspec.core.archive_layout as archive_layout
+from openspec.core.archive_layout import (
+    is_partitioned,
+    iter_archived,
+    list_archived,
+    migrate_to_partitions,
+)
+from openspec.core.change_operations import archive_change, list_changes, show_change
+
+NAMES = ["2023-11-02-a", "2024-01-15-b", "2024-01-20-c", "2024-03-01-d"]
+
+
+def _archive(tmp_path, names=NAMES):
+    archive_dir = tmp_path / "openspec" / "changes" / "archive"
+    for name in names:
+        (archive_dir / name).mkdir(parents=True)
+        (archive_dir / name / "proposal.md").write_text(f"# {name}\n")
+    return archive_dir
+
+
+def test_migrate_moves_flat_archives_into_partitions(tmp_path):
+    """Every dated archive ends up under YYYY/MM and is still found."""
+    archive_dir = _archive(tmp_path)
+    (archive_dir / "undated").mkdir()
+
+    assert migrate_to_partitions(archive_dir) == NAMES
+
+    assert is_partitioned(archive_dir)
+    assert (archive_dir / "2024" / "01" / "2024-01-15-b" / "proposal.md").exists()
+    assert (archive_dir / "undated").exists()
+    assert [c.name for c in iter_archived(archive_dir)] == ["undated"] + NAMES[::-1]
+    assert show_change(str(tmp_path), "2023-11-02-a")["path"].endswith("2023/11/2023-11-02-a")
+
+
+def test_newest_first_listing_only_opens_needed_partitions(tmp_path, monkeypatch):
+    """Taking the newest two archives does not list the older partitions."""
+    archive_dir = _archive(tmp_path)
+    migrate_to_partitions(archive_dir)
+
+    listed = []
+    original = archive_layout.list_directories
+
+    def recording(path):
+        listed.append(path)
+        return original(path)
+
+    monkeypatch.setattr(archive_layout, "list_directories", recording)
+    newest = list_archived(archive_dir, limit=2, include_packed=False)
+
+    assert [c.name for c in newest] == ["2024-03-01-d", "2024-01-20-c"]
+    assert str(archive_dir / "2023") not in listed
+    assert str(archive_dir / "2023" / "11") not in listed
+
+
+def test_archive_change_follows_partitioned_layout(tmp_path):
+    """New archives go into the partition for today once the archive is partitioned."""
+    archive_dir = _archive(tmp_path, ["2023-11-02-a"])
+    migrate_to_partitions(archive_dir)
+    change_dir = tmp_path / "openspec" / "changes" / "add-login"
+    change_dir.mkdir()
+
+    archived = archive_change(str(tmp_path), "add-login", skip_specs=True)
+
+    today = date.today()
+    assert archived == str(archive_dir / f"{today:%Y}" / f"{today:%m}" / f"{today.isoformat()}-add-login")
+    names = [c["name"] for c in list_changes(str(tmp_path), archived_limit=1)]
+    assert names == [f"{today.isoformat()}-add-login"]
@@ -0,0 +1,72 @@
+"""Tests for the content-addressed archive pack store."""
+
+from datetime import date
+
+import pytest
+
+from openspec.core.archive_pack import PackStore, pack_archives
+from openspec.core.change_operations import list_changes, show_change
+
+PROPOSAL = """# Change: Add login
+
+## Why
+Users need to sign in.
+
+## What Changes
+- Add a login form
+
+```json
+{"why": "Users need to sign in.", "whatChanges": "Add a login form"}
+```
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A project with two old archived changes sharing a file, and one recent one."""
+    archive = tmp_path / "openspec" / "changes" / "archive"
+    for name in ("2023-01-05-add-login", "2023-02-10-add-logout", "2024-06-01-recent"):
+        spec_dir = archive / name / "specs" / "auth"
+        spec_dir.mkdir(parents=True)
+        (archive / name / "proposal.md").write_text(PROPOSAL.replace("login", name))
+        (archive / name / "tasks.md").write_text("- [x] Done\n")
+        (spec_dir / "spec.md").write_text(f"## ADDED Requirements\n\n### Requirement: {name}\n")
+    return tmp_path
+
+
+def test_pack_folds_old_archives_and_deduplicates(project):
+    """Directories past the cutoff move into the pack; identical files are stored once."""
+    archive = project / "openspec" / "changes" / "archive"
+
+    result = pack_archives(archive, older_than_days=30, today=date(2024, 6, 15))
+
+    assert result.packed == ["2023-01-05-add-login", "2023-02-10-add-logout"]
+    assert result.files == 6
+    assert result.deduplicated == 1  # the shared tasks.md
+    assert result.blobs_added == 5
+    assert not (archive / "2023-01-05-add-login").exists()
+    assert (archive / "2024-06-01-recent").exists()
+
+    store = PackStore(archive)
+    assert store.read_text("2023-02-10-add-logout", "specs/auth/spec.md").endswith("2023-02-10-add-logout\n")
+    assert store.files("2023-01-05-add-login")["tasks.md"] == store.files("2023-02-10-add-logout")["tasks.md"]
+
+
+def test_packed_changes_are_listed_and_shown(project):
+    """list_changes and show_change read packed changes transparently."""
+    archive = project / "openspec" / "changes" / "archive"
+    before = [change["name"] for change in list_changes(str(project))]
+
+    pack_archives(archive)
+    (archive / "2025-01-01-later").mkdir()
+    (archive / "2025-01-01-later" / "tasks.md").write_text("- [x] Done\n")
+    pack_archives(archive)
+
+    changes = list_changes(str(project))
+    assert [change["name"] for change in changes] == sorted(before + ["2025-01-01-later"])
+    assert all(change["is_archived"] and change.get("is_packed") for change in changes)
+
+    info = show_change(str(project), "2023-01-05-add-login")
+    assert info["is_archived"] and info["is_packed"]
+    assert info["proposal"]["why"] == "Users need to sign in."
+    assert show_change(str(project), "2023-01-05-missing") is None
@@ -0,0 +1,48 @@
+"""Tests for the parallel archive scheduler."""
+
+import json
+
+import pytest
+
+from openspec.core.archive_scheduler import archive_changes, plan_archive_chains
+
+
+def _add_change(project, name, specs, created_at):
+    change_dir = project / "openspec" / "changes" / name
+    change_dir.mkdir(parents=True)
+    (change_dir / "meta.json").write_text(json.dumps({"version": 1, "createdAt": created_at, "bases": {}}))
+    for spec_name in specs:
+        (change_dir / "specs" / spec_name).mkdir(parents=True)
+        (change_dir / "specs" / spec_name / "spec.md").write_text(
+            f"## ADDED Requirements\n\n### Requirement: {name}\nText\n\n#### Scenario: {name}\n- **WHEN** x\n"
+        )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create changes where a and c are linked through b, and d stands alone."""
+    (tmp_path / "openspec" / "specs").mkdir(parents=True)
+    _add_change(tmp_path, "a", ["auth"], "2024-01-03T00:00:00+00:00")
+    _add_change(tmp_path, "b", ["auth", "billing"], "2024-01-01T00:00:00+00:00")
+    _add_change(tmp_path, "c", ["billing"], "2024-01-02T00:00:00+00:00")
+    _add_change(tmp_path, "d", ["docs"], "2024-01-04T00:00:00+00:00")
+    return tmp_path
+
+
+def test_chains_group_changes_sharing_specs(project):
+    """Changes linked through shared specs form one chain ordered by creation."""
+    assert plan_archive_chains(str(project), ["a", "b", "c", "d"]) == [["b", "c", "a"], ["d"]]
+    assert plan_archive_chains(str(project), ["a", "b", "c", "d"], skip_specs=True) == [
+        ["b"], ["c"], ["a"], ["d"]
+    ]
+
+
+def test_archive_changes_applies_every_chain(project):
+    """All changes are archived and their deltas land in the specs."""
+    outcomes = archive_changes(str(project), ["a", "b", "c", "d"], workers=4)
+
+    assert [o.name for o in outcomes] == ["b", "c", "a", "d"]
+    assert all(o.ok for o in outcomes)
+    auth = (project / "openspec" / "specs" / "auth" / "spec.md").read_text()
+    assert "### Requirement: a" in auth and "### Requirement: b" in auth
+    assert not (project / "openspec" / "changes" / "a").exists()
@@ -0,0 +1,85 @@
+"""Tests for block-aligned spec diffs and archive --dry-run."""
+
+import difflib
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.archive import archive
+from openspec.core.block_diff import diff_spec_write
+from tests.helpers.project_files import write_openspec_files
+
+HEADER = "# auth Specification\n\n## Purpose\nAuthentication.\n\n## Requirements\n\n"
+
+
+def _requirement(name, text):
+    return f"### Requirement: {name}\n{text}\n\n#### Scenario: Works\n- **WHEN** used\n- **THEN** it works\n"
+
+
+def _apply(old, unified):
+    """Apply unified-diff hunks to ``old`` to check their line numbers."""
+    lines = old.split("\n") if old else []
+    result, position = [], 0
+    for line in unified[2:]:
+        if line.startswith("@@"):
+            start = int(line.split()[1][1:].split(",")[0])
+            length = line.split()[1].split(",")
+            start = start - 1 if len(length) == 1 or length[1] != "0" else start
+            result.extend(lines[position:start])
+            position = start
+        elif line.startswith((" ", "-")):
+            assert lines[position] == line[1:]
+            position += 1
+            if line.startswith(" "):
+                result.append(line[1:])
+        else:
+            result.append(line[1:])
+    return "\n".join(result + lines[position:])
+
+
+def test_diff_touches_only_changed_blocks():
+    requirements = [_requirement(f"R{i}", f"Text {i}.") for i in range(40)]
+    old = HEADER + "\n".join(requirements)
+    updated = list(requirements)
+    updated[5] = _requirement("R5", "Text five.")
+    del updated[20]
+    updated.append(_requirement("New", "Brand new."))
+    new = HEADER + "\n".join(updated)
+
+    spec_diff = diff_spec_write("openspec/specs/auth/spec.md", old, new)
+    assert (spec_diff.added, spec_diff.modified, spec_diff.removed) == (["New"], ["R5"], ["R20"])
+    assert spec_diff.unified[:2] == ["--- a/openspec/specs/auth/spec.md", "+++ b/openspec/specs/auth/spec.md"]
+    assert _apply(old, spec_diff.unified) == new
+
+    changed = [line for line in spec_diff.unified[2:] if line[:1] in "+-"]
+    expected = [
+        line for line in difflib.unified_diff(old.split("\n"), new.split("\n"), lineterm="")
+        if line[:1] in "+-" and not line.startswith(("---", "+++"))
+    ]
+    assert changed == expected
+
+
+def test_new_and_unchanged_specs():
+    assert diff_spec_write("a.md", HEADER, HEADER).unified == []
+    created = diff_spec_write("a.md", "", HEADER + _requirement("R", "Text."))
+    assert created.added == ["R"]
+    assert _apply("", created.unified) == HEADER + _requirement("R", "Text.")
+
+
+def test_archive_all_dry_run(tmp_path, monkeypatch):
+    files = {
+        "specs/auth/spec.md": HEADER + _requirement("Login", "Users SHALL log in."),
+        "changes/add-2fa/proposal.md": "# add-2fa\n",
+        "changes/add-2fa/specs/auth/spec.md": "## ADDED Requirements\n\n" + _requirement("Two-factor", "Codes."),
+        "changes/add-billing/proposal.md": "# add-billing\n",
+        "changes/add-billing/specs/billing/spec.md": "## ADDED Requirements\n\n" + _requirement("Invoices", "Bills."),
+    }
+    write_openspec_files(tmp_path, files)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(archive, ["--all", "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "+### Requirement: Two-factor" in result.output
+    assert "+++ b/openspec/specs/billing/spec.md" in result.output
+    assert "2 change(s), 2 spec(s); requirements +2 added, ~0 modified, -0 removed" in result.output
+    assert not (tmp_path / "openspec" / "specs" / "billing").exists()
+    assert not (tmp_path / "openspec" / "changes" / "archive").exists()
@@ -0,0 +1,158 @@
+"""Tests for requirement base fingerprints."""
+
+import json
+import pytest
+
+from openspec.core.change_operations import (
+    archive_change,
+    load_spec_delta_plans,
+    ArchiveValidationError,
+)
+from openspec.core.fingerprints import (
+    canonicalize_requirement,
+    fingerprint_requirement,
+    find_stale_requirements,
+    record_base_fingerprints,
+    read_change_meta,
+)
+from openspec.core.validation import validate_project
+from tests.helpers.project_files import write_change_project
+
+
+MAIN_SPEC = """# alpha Specification
+
+## Purpose
+Alpha purpose
+
+## Requirements
+
+### Requirement: Login
+Users SHALL log in.
+
+#### Scenario: Valid credentials
+- **WHEN** credentials are valid
+- **THEN** access is granted
+
+### Requirement: Logout
+Users SHALL log out.
+
+#### Scenario: Logout
+- **WHEN** the user logs out
+- **THEN** the session ends
+"""
+
+DELTA = """## MODIFIED Requirements
+
+### Requirement: Login
+Users SHALL log in with MFA.
+
+#### Scenario: Valid credentials
+- **WHEN** credentials and code are valid
+- **THEN** access is granted
+
+## REMOVED Requirements
+
+### Requirement: Logout
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with one spec and one change targeting it."""
+    write_change_project(
+        tmp_path, "alpha", MAIN_SPEC, "add-mfa", DELTA,
+        proposal="# Add MFA\n\n## Why\nSecurity.\n\n## What Changes\n- Login\n",
+    )
+    return tmp_path
+
+
+def test_canonical_form_ignores_cosmetic_whitespace():
+    """Line endings, trailing spaces and blank runs do not change the hash."""
+    a = "### Requirement: Login\nText\n\n#### Scenario: X\n- **WHEN** y"
+    b = "###   Requirement:  Login  \r\nText   \r\n\r\n\r\n####  Scenario: X\r\n- **WHEN** y\r\n"
+    
+    assert canonicalize_requirement(a) == canonicalize_requirement(b)
+    assert fingerprint_requirement(a) == fingerprint_requirement(b)
+    assert fingerprint_requirement(a) != fingerprint_requirement(a + " changed")
+    assert fingerprint_requirement(a).startswith("sha256:")
+
+
+def test_record_stores_targets_in_meta(project):
+    """MODIFIED and REMOVED targets are fingerprinted with their text."""
+    change_dir = project / "openspec" / "changes" / "add-mfa"
+    plans = load_spec_delta_plans(str(project), change_dir)
+    
+    assert record_base_fingerprints(change_dir, plans) == 2
+    
+    meta = json.loads((change_dir / "meta.json").read_text())
+    assert set(meta["bases"]["alpha"]) == {"Login", "Logout"}
+    assert meta["bases"]["alpha"]["Login"]["operation"] == "MODIFIED"
+    assert meta["bases"]["alpha"]["Login"]["text"].startswith("### Requirement: Login")
+    assert "createdAt" in meta
+    
+    # Recording again keeps the original bases
+    assert record_base_fingerprints(change_dir, plans) == 0
+
+
+def test_archive_refuses_stale_base(project):
+    """A requirement edited after recording blocks the archive."""
+    change_dir = project / "openspec" / "changes" / "add-mfa"
+    record_base_fingerprints(change_dir, load_spec_delta_plans(str(project), change_dir))
+    
+    main_spec = project / "openspec" / "specs" / "alpha" / "spec.md"
+    edited = MAIN_SPEC.replace("Users SHALL log in.", "Users SHALL log in via SSO.")
+    main_spec.write_text(edited)
+    
+    with pytest.raises(ArchiveValidationError) as exc_info:
+        archive_change(str(project), "add-mfa")
+    
+    assert exc_info.value.errors == [
+        "alpha: MODIFIED requirement 'Login' changed in the spec since the change was authored "
+        "(run 'openspec change sync' to rebase)"
+    ]
+    assert main_spec.read_text() == edited
+    assert change_dir.exists()
+
+
+def test_validate_records_then_flags_divergence(project):
+    """Validation records bases on first run and reports drift afterwards."""
+    change_dir = project / "openspec" / "changes" / "add-mfa"
+    
+    results = validate_project(str(project), scope="add-mfa")
+    assert results[0].is_valid
+    assert "Login" in read_change_meta(change_dir)["bases"]["alpha"]
+    
+    main_spec = project / "openspec" / "specs" / "alpha" / "spec.md"
+    main_spec.write_text(MAIN_SPEC.replace("### Requirement: Logout", "### Requirement: Sign out"))
+    
+    results = validate_project(str(project), scope="add-mfa")
+    assert not results[0].is_valid
+    assert "alpha: REMOVED requirement 'Logout' no longer exists in the spec" in results[0].errors
+
+
+def test_requirements_without_base_are_not_stale(project):
+    """Missing meta.json is not treated as divergence."""
+    change_dir = project / "openspec" / "changes" / "add-mfa"
+    plans = load_spec_delta_plans(str(project), change_dir)
+    
+    assert find_stale_requirements(change_dir, plans) == []
+
+
+def test_renamed_requirements_are_parsed_and_applied(project):
+    """RENAMED pairs are fingerprinted and applied on archive."""
+    change_dir = project / "openspec" / "changes" / "add-mfa"
+    (change_dir / "specs" / "alpha" / "spec.md").write_text("""## RENAMED Requirements
+
+- FROM: `### Requirement: Logout`
+- TO: `### Requirement: Sign out`
+""")
+    plans = load_spec_delta_plans(str(project), change_dir)
+    assert plans[0].delta["renamed_requirements"] == [{"from": "Logout", "to": "Sign out"}]
+    
+    record_base_fingerprints(change_dir, plans)
+    assert read_change_meta(change_dir)["bases"]["alpha"]["Logout"]["operation"] == "RENAMED"
+    
+    archive_change(str(project), "add-mfa")
+    content = (project / "openspec" / "specs" / "alpha" / "spec.md").read_text()
+    assert "### Requirement: Sign out" in content
+    assert "### Requirement: Logout" not in content
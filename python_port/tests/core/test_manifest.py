@@ -0,0 +1,63 @@
+"""Tests for the generated-file manifest and update --check."""
+
+import os
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.init import init
+from openspec.cli.commands.update import update
+from openspec.core.manifest import check_manifest, manifest_path
+
+
+def _init(tmp_path):
+    result = CliRunner().invoke(init, [str(tmp_path), "--non-interactive", "--tools", "claude,cursor"])
+    assert result.exit_code == 0, result.output
+
+
+def test_init_records_generated_files(tmp_path):
+    """The manifest lists managed files but not the user's project.md."""
+    _init(tmp_path)
+
+    assert manifest_path(tmp_path).exists()
+    result = check_manifest(tmp_path)
+    assert result.ok
+    assert result.checked >= 5
+
+    paths = manifest_path(tmp_path).read_text()
+    assert "CLAUDE.md" in paths
+    assert ".cursor/commands/openspec-proposal.md" in paths
+    assert "openspec/project.md" not in paths
+
+
+def test_edits_outside_managed_block_are_not_drift(tmp_path):
+    """Only the marker region is compared once a file's stat has changed."""
+    _init(tmp_path)
+    (tmp_path / "openspec" / "project.md").write_text("# My project\n")
+    claude = tmp_path / "CLAUDE.md"
+    claude.write_text(claude.read_text() + "\nProject notes.\n")
+
+    assert check_manifest(tmp_path).ok
+
+
+def test_check_reports_drift_and_update_repairs_it(tmp_path):
+    """Editing a managed block or deleting a file fails --check; update restores the block."""
+    _init(tmp_path)
+    claude = tmp_path / "CLAUDE.md"
+    claude.write_text(claude.read_text().replace("<!-- OPENSPEC:END -->", "edited\n<!-- OPENSPEC:END -->"))
+    os.remove(tmp_path / ".cursor" / "commands" / "openspec-apply.md")
+
+    drift = {item.path: item.reason for item in check_manifest(tmp_path).drift}
+    assert drift == {
+        "CLAUDE.md": "managed block modified",
+        ".cursor/commands/openspec-apply.md": "missing",
+    }
+
+    runner = CliRunner()
+    result = runner.invoke(update, [str(tmp_path), "--check"])
+    assert result.exit_code != 0
+    assert "CLAUDE.md" in result.output
+
+    # update only refreshes files that still exist
+    assert runner.invoke(update, [str(tmp_path)]).exit_code == 0
+    drift = {item.path for item in check_manifest(tmp_path).drift}
+    assert drift == {".cursor/commands/openspec-apply.md"}
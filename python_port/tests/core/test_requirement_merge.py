@@ -0,0 +1,176 @@
+"""Tests for three-way requirement merging and change sync."""
+
+import pytest
+
+from openspec.core.change_operations import (
+    archive_change,
+    load_spec_delta_plans,
+    sync_change,
+    validate_spec_delta_plans,
+)
+from openspec.core.fingerprints import record_base_fingerprints, read_change_meta
+from openspec.core.requirement_merge import (
+    CONFLICT_END,
+    CONFLICT_START,
+    diff3_merge,
+    has_conflict_markers,
+    merge_requirement,
+)
+from tests.helpers.project_files import write_change_project
+
+
+BASE = """### Requirement: Tool support
+The system SHALL support configured tools.
+
+#### Scenario: Windsurf
+- **WHEN** Windsurf is selected
+- **THEN** workflows are written
+
+#### Scenario: Cursor
+- **WHEN** Cursor is selected
+- **THEN** commands are written"""
+
+
+def test_edits_to_different_scenarios_merge_cleanly():
+    """The spec edited one scenario and the change another."""
+    current = BASE.replace("workflows are written", "workflows are written to .windsurf")
+    change = BASE.replace("commands are written", "commands are written to .cursor") + (
+        "\n\n#### Scenario: Kilo\n- **WHEN** Kilo is selected\n- **THEN** workflows are written"
+    )
+
+    result = merge_requirement(BASE, current, change)
+
+    assert result.is_clean
+    assert "workflows are written to .windsurf" in result.text
+    assert "commands are written to .cursor" in result.text
+    assert result.text.index("Scenario: Cursor") < result.text.index("Scenario: Kilo")
+
+
+def test_same_line_edited_on_both_sides_conflicts():
+    """Divergent edits to the same line produce conflict markers."""
+    current = BASE.replace("SHALL support", "MUST support")
+    change = BASE.replace("SHALL support", "SHALL always support")
+
+    result = merge_requirement(BASE, current, change)
+
+    assert result.conflicts == 1
+    assert result.conflicting_parts == ["(description)"]
+    assert CONFLICT_START in result.text and CONFLICT_END in result.text
+    assert has_conflict_markers(result.text)
+
+
+def test_diff3_takes_the_changed_side():
+    """Non-overlapping line edits are combined."""
+    base = ["a", "b", "c", "d"]
+    merged, conflicts = diff3_merge(base, ["a", "B", "c", "d"], ["a", "b", "c", "D"])
+
+    assert conflicts == 0
+    assert merged == ["a", "B", "c", "D"]
+
+
+def test_diff3_handles_edits_at_the_edges():
+    """Shared prefixes and suffixes are matched directly around the edits."""
+    base = ["a", "b", "c"]
+
+    assert diff3_merge(base, ["x"] + base, base + ["y"]) == (["x", "a", "b", "c", "y"], 0)
+    assert diff3_merge(base, ["a", "c"], base) == (["a", "c"], 0)
+    assert diff3_merge([], ["x"], ["x"]) == (["x"], 0)
+    merged, conflicts = diff3_merge(base, base + ["x"], base + ["y"])
+    assert conflicts == 1 and merged[:3] == base
+
+
+MAIN_SPEC = f"""# alpha Specification
+
+## Purpose
+Alpha purpose
+
+## Requirements
+
+{BASE}
+"""
+
+DELTA = """## MODIFIED Requirements
+
+""" + BASE.replace("commands are written", "commands are written to .cursor") + "\n"
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project whose change has a recorded base."""
+    write_change_project(tmp_path, "alpha", MAIN_SPEC, "cursor-paths", DELTA, record_bases=True)
+    return tmp_path
+
+
+def test_sync_rebases_modified_requirement(project):
+    """A diverged spec is merged into the delta and the base refreshed."""
+    spec_path = project / "openspec" / "specs" / "alpha" / "spec.md"
+    spec_path.write_text(MAIN_SPEC.replace("workflows are written", "workflows are written to .windsurf"))
+    change_dir = project / "openspec" / "changes" / "cursor-paths"
+
+    outcomes = sync_change(str(project), "cursor-paths")
+
+    assert [(o.requirement, o.status) for o in outcomes] == [("Tool support", "merged")]
+    delta = (change_dir / "specs" / "alpha" / "spec.md").read_text()
+    assert "workflows are written to .windsurf" in delta
+    assert "commands are written to .cursor" in delta
+    assert delta.startswith("## MODIFIED Requirements")
+
+    base = read_change_meta(change_dir)["bases"]["alpha"]["Tool support"]
+    assert "to .windsurf" in base["text"]
+
+    # A second sync has nothing to do
+    assert [o.status for o in sync_change(str(project), "cursor-paths")] == ["up-to-date"]
+
+
+def test_synced_delta_is_applied_on_archive(project):
+    """The merged block, changed and added scenarios included, reaches the main spec."""
+    spec_path = project / "openspec" / "specs" / "alpha" / "spec.md"
+    spec_path.write_text(MAIN_SPEC.replace("workflows are written", "workflows are written to .windsurf"))
+    delta_path = project / "openspec" / "changes" / "cursor-paths" / "specs" / "alpha" / "spec.md"
+    delta_path.write_text(DELTA.rstrip("\n") + "\n\n#### Scenario: Kilo\n- **WHEN** Kilo is selected\n- **THEN** workflows are written\n")
+
+    assert [o.status for o in sync_change(str(project), "cursor-paths")] == ["merged"]
+    archive_change(str(project), "cursor-paths")
+
+    spec = spec_path.read_text()
+    assert "workflows are written to .windsurf" in spec
+    assert "commands are written to .cursor" in spec
+    assert "#### Scenario: Kilo" in spec
+    assert spec.count("### Requirement: Tool support") == 1
+
+
+def test_sync_leaves_stale_removal_for_review(project):
+    """A removed requirement edited since the change was written needs confirmation."""
+    change_dir = project / "openspec" / "changes" / "cursor-paths"
+    (change_dir / "specs" / "alpha" / "spec.md").write_text(
+        "## REMOVED Requirements\n\n### Requirement: Tool support\n**REASON:** Replaced\n"
+    )
+    record_base_fingerprints(change_dir, load_spec_delta_plans(str(project), change_dir))
+    spec_path = project / "openspec" / "specs" / "alpha" / "spec.md"
+    spec_path.write_text(MAIN_SPEC.replace("commands are written", "prompts are written"))
+    base_hash = read_change_meta(change_dir)["bases"]["alpha"]["Tool support"]["hash"]
+
+    assert [o.status for o in sync_change(str(project), "cursor-paths")] == ["needs-review"]
+    assert read_change_meta(change_dir)["bases"]["alpha"]["Tool support"]["hash"] == base_hash
+
+    assert [o.status for o in sync_change(str(project), "cursor-paths", confirm=True)] == ["confirmed"]
+    assert [o.status for o in sync_change(str(project), "cursor-paths")] == ["up-to-date"]
+
+
+def test_sync_conflict_blocks_validation(project):
+    """Conflict markers left by sync are reported until resolved."""
+    spec_path = project / "openspec" / "specs" / "alpha" / "spec.md"
+    spec_path.write_text(MAIN_SPEC.replace("commands are written", "prompts are written"))
+    change_dir = project / "openspec" / "changes" / "cursor-paths"
+
+    outcomes = sync_change(str(project), "cursor-paths")
+
+    assert outcomes[0].status == "conflict"
+    plans = load_spec_delta_plans(str(project), change_dir)
+    assert "alpha: Unresolved merge conflict markers in the delta" in validate_spec_delta_plans(plans)
+
+
+def test_sync_unknown_change(project):
+    """Syncing a missing change raises."""
+    with pytest.raises(ValueError, match="not found"):
+        sync_change(str(project), "nope")
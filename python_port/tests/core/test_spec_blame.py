@@ -0,0 +1,162 @@
+"""Tests for requirement blame over the change archive."""
+
+import json
+from datetime import date
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.blame import blame
+from openspec.core import spec_blame
+from openspec.core.change_operations import archive_change
+from openspec.core.spec_blame import blame_spec, cache_path
+from tests.helpers.project_files import add_archived_change, write_openspec_files
+
+ADD_LOGIN = """## ADDED Requirements
+
+### Requirement: Password login
+Users SHALL sign in with a password.
+
+#### Scenario: Valid password
+- **WHEN** the password matches
+- **THEN** the user is signed in
+
+#### Scenario: Wrong password
+- **WHEN** the password does not match
+- **THEN** an error is shown
+
+### Requirement: Legacy tokens
+The system SHALL accept legacy API tokens.
+"""
+
+LOCKOUT = """## MODIFIED Requirements
+
+### Requirement: Password login
+Users SHALL sign in with a password.
+
+#### ADDED Scenarios
+
+#### Scenario: Locked account
+- **WHEN** the account is locked
+- **THEN** sign-in is refused
+
+## REMOVED Requirements
+
+### Requirement: Legacy tokens
+**REASON:** Tokens are gone.
+"""
+
+RENAME = """## RENAMED Requirements
+
+- FROM: `### Requirement: Password login`
+- TO: `### Requirement: Credential login`
+"""
+
+CURRENT_SPEC = """# auth Specification
+
+## Purpose
+Authentication.
+
+## Requirements
+
+### Requirement: Credential login
+Users SHALL sign in with a password.
+
+#### Scenario: Valid password
+- **WHEN** the password matches
+- **THEN** the user is signed in
+
+#### Scenario: Wrong password
+- **WHEN** the password does not match
+- **THEN** an error is shown
+
+#### Scenario: Locked account
+- **WHEN** the account is locked
+- **THEN** sign-in is refused
+
+### Requirement: Hand-written
+Added without a change.
+"""
+
+
+def _project(tmp_path):
+    archive_dir = write_openspec_files(tmp_path, {"specs/auth/spec.md": CURRENT_SPEC}) / "changes" / "archive"
+    add_archived_change(archive_dir, "2024-01-10-add-login", ADD_LOGIN)
+    add_archived_change(archive_dir, "2024-02-20-add-lockout", LOCKOUT)
+    return archive_dir
+
+
+def test_blame_follows_adds_scenario_edits_and_renames(tmp_path):
+    archive_dir = _project(tmp_path)
+    add_archived_change(archive_dir, "2024-03-05-rename-login", RENAME)
+
+    login, hand_written = blame_spec(tmp_path, "auth")
+    assert login.to_dict() == {
+        "title": "Credential login",
+        "introducedBy": "2024-01-10-add-login",
+        "lastChangedBy": "2024-03-05-rename-login",
+        "scenarios": [
+            {"title": "Valid password", "lastChangedBy": "2024-01-10-add-login"},
+            {"title": "Wrong password", "lastChangedBy": "2024-01-10-add-login"},
+            {"title": "Locked account", "lastChangedBy": "2024-02-20-add-lockout"},
+        ],
+    }
+    assert hand_written.changed_by is None
+    assert blame_spec(tmp_path, "missing") is None
+
+
+def test_new_archives_only_replay_the_delta(tmp_path, monkeypatch):
+    """The cache is extended with newly archived changes instead of rebuilt."""
+    archive_dir = _project(tmp_path)
+    blame_spec(tmp_path, "auth")
+    assert json.loads(cache_path(tmp_path).read_text())["replayed"] == [
+        "2024-01-10-add-login", "2024-02-20-add-lockout",
+    ]
+
+    replayed = []
+    original = spec_blame._replay
+    monkeypatch.setattr(spec_blame, "_replay", lambda specs, entry, *args: (
+        replayed.append(entry.directory), original(specs, entry, *args)
+    ))
+    add_archived_change(archive_dir, "2024-03-05-rename-login", RENAME)
+    [login, _] = blame_spec(tmp_path, "auth")
+    assert replayed == ["2024-03-05-rename-login"]
+    assert login.changed_by == "2024-03-05-rename-login"
+
+    blame_spec(tmp_path, "auth")
+    assert replayed == ["2024-03-05-rename-login"]
+
+
+def test_same_day_archives_blame_the_last_applied_change(tmp_path):
+    """Archives made by archive_change on one day replay in applied order, cached or not."""
+    login_delta = ADD_LOGIN.replace("## ADDED", "## MODIFIED").split("### Requirement: Legacy")[0]
+    write_openspec_files(tmp_path, {
+        "specs/auth/spec.md": CURRENT_SPEC.replace("Credential login", "Password login"),
+        "changes/zeta/proposal.md": "# zeta\n",
+        "changes/zeta/specs/auth/spec.md": login_delta.replace("with a password", "with a passphrase"),
+        "changes/alpha/proposal.md": "# alpha\n",
+        "changes/alpha/specs/auth/spec.md": login_delta.replace("with a password", "with a passkey"),
+    })
+    today = date.today().isoformat()
+
+    archive_change(str(tmp_path), "zeta")
+    assert blame_spec(tmp_path, "auth")[0].changed_by == f"{today}-zeta"
+    archive_change(str(tmp_path), "alpha")
+    assert blame_spec(tmp_path, "auth")[0].changed_by == f"{today}-alpha"
+
+    cache_path(tmp_path).unlink()
+    assert blame_spec(tmp_path, "auth")[0].changed_by == f"{today}-alpha"
+
+
+def test_blame_command(tmp_path, monkeypatch):
+    archive_dir = _project(tmp_path)
+    add_archived_change(archive_dir, "2024-03-05-rename-login", RENAME)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(blame, ["auth", "--json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["requirements"][0]["scenarios"][2]["lastChangedBy"] == "2024-02-20-add-lockout"
+
+    result = CliRunner().invoke(blame, ["missing"])
+    assert result.exit_code != 0
+    assert "Spec 'missing' not found" in result.output
@@ -0,0 +1,119 @@
+"""Tests for the requirement-level spec diff."""
+
+import subprocess
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.diff import diff
+from openspec.core.spec_diff import diff_specs
+from openspec.core.spec_sources import load_specs
+
+OLD_SPEC = """# auth Specification
+
+## Purpose
+Authentication.
+
+## Requirements
+
+### Requirement: Password login
+Users SHALL sign in with a password.
+
+#### Scenario: Valid password
+- **WHEN** the password matches
+- **THEN** the user is signed in
+
+#### Scenario: Wrong password
+- **WHEN** the password does not match
+- **THEN** an error is shown
+
+### Requirement: Session timeout
+Sessions SHALL expire after 30 minutes of inactivity.
+
+#### Scenario: Idle session
+- **WHEN** a session is idle for 30 minutes
+- **THEN** it is closed
+
+### Requirement: Legacy tokens
+The system SHALL accept legacy API tokens.
+"""
+
+NEW_SPEC = """# auth Specification
+
+## Purpose
+Authentication.
+
+## Requirements
+
+### Requirement:   Password login
+Users SHALL sign in with a password.
+
+#### Scenario: Valid password
+- **WHEN** the password matches
+- **THEN** the user is signed in and audited
+
+#### Scenario: Locked account
+- **WHEN** the account is locked
+- **THEN** sign-in is refused
+
+### Requirement: Idle session expiry
+Sessions SHALL expire after 30 minutes of inactivity.
+
+#### Scenario: Idle session
+- **WHEN** a session is idle for 30 minutes
+- **THEN** it is closed
+
+### Requirement: Two-factor login
+Users SHALL confirm sign-in with a second factor.
+"""
+
+
+def test_diff_reports_changes_with_scenario_detail():
+    """Title matches are compared by hash; leftovers are paired as renames."""
+    [spec_diff] = diff_specs({"auth": OLD_SPEC}, {"auth": NEW_SPEC})
+
+    changes = {change.title: change.to_dict() for change in spec_diff.changes}
+    assert changes["Password login"] == {
+        "title": "Password login",
+        "status": "modified",
+        "scenarios": [
+            {"title": "Valid password", "status": "modified"},
+            {"title": "Locked account", "status": "added"},
+            {"title": "Wrong password", "status": "removed"},
+        ],
+    }
+    assert changes["Idle session expiry"]["status"] == "renamed"
+    assert changes["Idle session expiry"]["oldTitle"] == "Session timeout"
+    assert changes["Two-factor login"]["status"] == "added"
+    assert changes["Legacy tokens"]["status"] == "removed"
+
+
+def test_identical_and_cosmetic_edits_are_not_changes():
+    """Whitespace-only differences hash the same."""
+    cosmetic = OLD_SPEC.replace("Users SHALL sign in", "Users  SHALL   sign in")
+    assert diff_specs({"auth": OLD_SPEC}, {"auth": cosmetic}) == []
+    assert [d.status for d in diff_specs({}, {"auth": OLD_SPEC})] == ["added"]
+
+
+def test_diff_against_git_revision(tmp_path, monkeypatch):
+    """A git revision reads the project's specs as they were committed."""
+    spec_path = tmp_path / "openspec" / "specs" / "auth" / "spec.md"
+    spec_path.parent.mkdir(parents=True)
+    spec_path.write_text(OLD_SPEC)
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run(git + ["init", "-q"], check=True)
+    subprocess.run(git + ["add", "."], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "specs"], check=True)
+    spec_path.write_text(NEW_SPEC)
+
+    assert load_specs(tmp_path, "HEAD") == {"auth": OLD_SPEC}
+    assert load_specs(tmp_path, "HEAD:openspec/specs/auth/spec.md") == {"auth": OLD_SPEC}
+
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(diff, ["HEAD"])
+    assert result.exit_code == 0, result.output
+    assert "Session timeout → Idle session expiry" in result.output
+    assert "+ Scenario: Locked account" in result.output
+
+    result = CliRunner().invoke(diff, ["no-such-rev"])
+    assert result.exit_code != 0
+    assert "neither a path nor a git revision" in result.output
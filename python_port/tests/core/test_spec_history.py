@@ -0,0 +1,213 @@
+"""Tests for reconstructing specs as of a past date."""
+
+import json
+from datetime import date, timedelta
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.show import show
+from openspec.core import spec_history
+from openspec.core.change_operations import archive_change
+from openspec.core.spec_history import (
+    SOURCE_CURRENT,
+    SOURCE_RECORDED,
+    SOURCE_REPLAYED,
+    checkpoint_dir,
+    spec_as_of,
+    specs_as_of,
+)
+from tests.helpers.project_files import add_archived_change, write_openspec_files
+
+ADD_LOGIN = """## ADDED Requirements
+
+### Requirement: Password login
+Users SHALL sign in with a password.
+
+#### Scenario: Valid password
+- **WHEN** the password matches
+- **THEN** the user is signed in
+
+### Requirement: Legacy tokens
+The system SHALL accept legacy API tokens.
+"""
+
+LOCKOUT = """## MODIFIED Requirements
+
+### Requirement: Password login
+
+#### ADDED Scenarios
+
+#### Scenario: Locked account
+- **WHEN** the account is locked
+- **THEN** sign-in is refused
+
+## REMOVED Requirements
+
+### Requirement: Legacy tokens
+**REASON:** Tokens are gone.
+"""
+
+RENAME = """## RENAMED Requirements
+
+- FROM: `### Requirement: Password login`
+- TO: `### Requirement: Credential login`
+"""
+
+
+AUTH_SPEC = """# Auth Specification
+
+## Purpose
+Real purpose.
+
+## Requirements
+
+### Requirement: Login
+Users SHALL sign in.
+
+#### Scenario: Valid credentials
+- **WHEN** the credentials match
+- **THEN** the user is signed in
+"""
+
+
+def _project(tmp_path):
+    """Legacy archives: deltas only, no recorded pre-images."""
+    archive_dir = tmp_path / "openspec" / "changes" / "archive"
+    add_archived_change(archive_dir, "2024-01-10-add-login", ADD_LOGIN)
+    add_archived_change(archive_dir, "2024-02-20-add-lockout", LOCKOUT)
+    add_archived_change(archive_dir, "2024-03-05-rename-login", RENAME)
+    return archive_dir
+
+
+def _write_live_spec(tmp_path, content):
+    write_openspec_files(tmp_path, {"specs/auth/spec.md": content})
+
+
+def test_archive_records_pre_images_that_anchor_as_of(tmp_path):
+    """Text from before the first archived change survives exactly, title and purpose included."""
+    write_openspec_files(tmp_path, {
+        "specs/auth/spec.md": AUTH_SPEC,
+        "changes/add-2fa/proposal.md": "# add-2fa\n",
+        "changes/add-2fa/specs/auth/spec.md": ADD_LOGIN.replace("Legacy tokens", "Two-factor login").replace(
+            "The system SHALL accept legacy API tokens.",
+            "Users SHALL confirm with a code.\n\n#### Scenario: Code accepted\n- **WHEN** the code matches\n- **THEN** sign-in completes",
+        ),
+    })
+    archive_change(str(tmp_path), "add-2fa")
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+
+    before = spec_as_of(tmp_path, "auth", yesterday)
+    assert before.source == SOURCE_RECORDED and before.content == AUTH_SPEC
+
+    now = spec_as_of(tmp_path, "auth", date.today().isoformat())
+    assert now.source == SOURCE_CURRENT
+    assert now.content == (tmp_path / "openspec" / "specs" / "auth" / "spec.md").read_text()
+    assert "### Requirement: Login" in now.content and "Two-factor login" in now.content
+
+
+def test_legacy_archives_replay_and_are_checked_against_the_live_spec(tmp_path):
+    _project(tmp_path)
+    replayed = spec_history._render(specs_as_of(tmp_path, "9999-12-31")["auth"])
+    _write_live_spec(tmp_path, replayed)
+
+    assert spec_as_of(tmp_path, "auth", "2024-01-09").content is None
+
+    january = spec_as_of(tmp_path, "auth", "2024-01-10")
+    assert january.source == SOURCE_REPLAYED and january.verified
+    assert "### Requirement: Password login" in january.content
+    assert "### Requirement: Legacy tokens" in january.content
+    assert "Locked account" not in january.content
+
+    february = spec_as_of(tmp_path, "auth", "2024-02-28").content
+    assert "#### Scenario: Locked account" in february
+    assert "Legacy tokens" not in february
+
+    # A requirement the archive never saw makes the replay unverified
+    _write_live_spec(tmp_path, replayed + "\n### Requirement: Hand-written\nAdded without a change.\n")
+    assert not spec_as_of(tmp_path, "auth", "2024-02-28").verified
+
+
+def test_replay_restarts_from_recorded_pre_images(tmp_path):
+    archive_dir = _project(tmp_path)
+    _write_live_spec(tmp_path, AUTH_SPEC)
+    add_archived_change(archive_dir, "2024-04-01-reset", RENAME, preimages={"auth": AUTH_SPEC})
+
+    state = specs_as_of(tmp_path, "2024-04-01")["auth"]
+    assert state["title"] == "Auth Specification"
+    assert [req["title"] for req in state["requirements"]] == ["Login"]
+
+
+def test_checkpoints_bound_the_replay(tmp_path, monkeypatch):
+    """Later replays start from the nearest compressed checkpoint."""
+    archive_dir = _project(tmp_path)
+    monkeypatch.setattr(spec_history, "CHECKPOINT_INTERVAL", 2)
+    specs_as_of(tmp_path, "2024-12-31")
+    assert [path.name for path in checkpoint_dir(tmp_path).iterdir()] == ["checkpoint-000002.json.gz"]
+
+    applied = []
+    original = spec_history._apply
+    monkeypatch.setattr(spec_history, "_apply", lambda specs, entry, *args: (
+        applied.append(entry.directory), original(specs, entry, *args)
+    ))
+    assert specs_as_of(tmp_path, "2024-12-31")["auth"]["requirements"][0]["title"] == "Credential login"
+    assert applied == ["2024-03-05-rename-login"]
+
+    # A checkpoint whose history no longer matches is ignored
+    applied.clear()
+    add_archived_change(archive_dir, "2024-01-01-add-audit", ADD_LOGIN)
+    specs_as_of(tmp_path, "2024-01-31")
+    assert applied == ["2024-01-01-add-audit", "2024-01-10-add-login"]
+
+
+def test_show_as_of(tmp_path, monkeypatch):
+    _project(tmp_path)
+    _write_live_spec(tmp_path, AUTH_SPEC)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(show, ["auth", "--as-of", "2024-02-28", "--json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["asOf"] == "2024-02-28"
+    assert (data["source"], data["verified"]) == ("replayed", False)
+    assert data["requirements"][0]["scenarios"] == ["Valid password", "Locked account"]
+
+    result = CliRunner().invoke(show, ["auth", "--as-of", "2024-02-28"])
+    assert "Reconstructed" not in result.output
+    assert "does not reproduce the current spec" in result.output
+
+    result = CliRunner().invoke(show, ["auth", "--as-of", "2023-01-01"])
+    assert result.exit_code != 0
+    assert "did not exist on 2023-01-01" in result.output
+
+
+def _login_delta(version):
+    return f"""## MODIFIED Requirements
+
+### Requirement: Login
+Users log in {version}.
+
+#### Scenario: Valid credentials
+- **WHEN** the credentials match
+- **THEN** the user is signed in
+"""
+
+
+def test_show_as_of_uses_the_first_of_same_day_archives(tmp_path, monkeypatch):
+    """Archives applied in reverse name order on one day keep their applied order."""
+    write_openspec_files(tmp_path, {
+        "specs/auth/spec.md": AUTH_SPEC.replace("Users SHALL sign in.", "Users log in v1."),
+        "changes/zeta/proposal.md": "# zeta\n",
+        "changes/zeta/specs/auth/spec.md": _login_delta("v2"),
+        "changes/alpha/proposal.md": "# alpha\n",
+        "changes/alpha/specs/auth/spec.md": _login_delta("v3"),
+    })
+    archive_change(str(tmp_path), "zeta")
+    archive_change(str(tmp_path), "alpha")
+    monkeypatch.chdir(tmp_path)
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+
+    result = CliRunner().invoke(show, ["auth", "--as-of", yesterday])
+    assert result.exit_code == 0, result.output
+    assert "Users log in v1." in result.output
+    assert f"{date.today().isoformat()}-zeta was archived" in result.output
+    assert "v3" in spec_as_of(tmp_path, "auth", date.today().isoformat()).content
@@ -0,0 +1,94 @@
+"""Tests for previewing specs with active changes applied in memory."""
+
+import json
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.show import show
+from openspec.core.spec_overlay import SpecOverlay
+from tests.helpers.project_files import write_openspec_files
+
+MAIN_SPEC = """# auth Specification
+
+## Purpose
+Authentication.
+
+## Requirements
+
+### Requirement: Password login
+Users SHALL sign in with a password.
+
+#### Scenario: Valid password
+- **WHEN** the password matches
+- **THEN** the user is signed in
+"""
+
+ADD_2FA = """## ADDED Requirements
+
+### Requirement: Two-factor login
+Users SHALL confirm sign-in with a second factor.
+
+#### Scenario: Code accepted
+- **WHEN** the code matches
+- **THEN** the user is signed in
+"""
+
+LOCKOUT = """## MODIFIED Requirements
+
+### Requirement: Password login
+
+#### ADDED Scenarios
+
+#### Scenario: Locked account
+- **WHEN** the account is locked
+- **THEN** sign-in is refused
+"""
+
+
+def _project(tmp_path):
+    files = {
+        "specs/auth/spec.md": MAIN_SPEC,
+        "changes/add-2fa/proposal.md": "# add-2fa\n",
+        "changes/add-2fa/specs/auth/spec.md": ADD_2FA,
+        "changes/add-lockout/proposal.md": "# add-lockout\n",
+        "changes/add-lockout/specs/auth/spec.md": LOCKOUT,
+        "changes/redo-2fa/proposal.md": "# redo-2fa\n",
+        "changes/redo-2fa/specs/auth/spec.md": ADD_2FA,
+    }
+    write_openspec_files(tmp_path, files)
+
+
+def test_overlay_applies_changes_in_order_without_writing(tmp_path):
+    _project(tmp_path)
+    overlay = SpecOverlay(tmp_path, ["add-2fa", "add-lockout", "redo-2fa"])
+
+    content = overlay.read("auth")
+    assert "### Requirement: Two-factor login" in content
+    assert "#### Scenario: Locked account" in content
+    assert [(c.change, c.spec_name) for c in overlay.conflicts] == [("redo-2fa", "auth")]
+    assert "already exists" in overlay.conflicts[0].message
+
+    assert overlay.read("auth") is content
+    assert overlay.read("billing") is None
+    assert (tmp_path / "openspec" / "specs" / "auth" / "spec.md").read_text() == MAIN_SPEC
+    assert (tmp_path / "openspec" / "changes" / "add-2fa").is_dir()
+
+
+def test_show_with_changes(tmp_path, monkeypatch):
+    _project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(show, ["auth", "--with-changes", "add-lockout", "--json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["requirements"][0]["scenarios"] == ["Valid password", "Locked account"]
+    assert data["conflicts"] == []
+
+    result = CliRunner().invoke(show, ["auth", "--with-all-active"])
+    assert result.exit_code == 0, result.output
+    assert "Two-factor login" in result.output
+    assert "[redo-2fa]" in result.output
+
+    result = CliRunner().invoke(show, ["auth", "--with-changes", "nope"])
+    assert result.exit_code != 0
+    assert "Unknown active change(s): nope" in result.output
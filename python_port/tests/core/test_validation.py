@@ -184,4 +184,58 @@ def test_validate_scope_filtering(temp_project):
     # Validate with scope
     results = validate_project(str(temp_project), scope="change-1")
     assert len(results) == 1
-    assert "change-1" in results[0].file_path
\ No newline at end of file
+    assert "change-1" in results[0].file_path
+
+def test_validate_reports_structured_schema_issues(temp_project):
+    """Schema errors include the location of the offending value."""
+    
+    change_dir = temp_project / "openspec" / "changes" / "bad-delta"
+    ensure_directory(str(change_dir))
+    
+    change_content = """# Bad Delta
+
+## Configuration
+
+```json
+{
+  "name": "bad-delta",
+  "why": "This is a test change that needs to be implemented for testing purposes and validation",
+  "whatChanges": "Test changes will be made",
+  "deltas": [
+    {
+      "spec": "test-spec",
+      "operation": "UPSERT",
+      "description": "Add new spec"
+    }
+  ]
+}
+```
+"""
+    write_file(str(change_dir / "proposal.md"), change_content)
+    
+    results = validate_project(str(temp_project))
+    
+    assert not results[0].is_valid
+    assert [issue.path for issue in results[0].issues] == ["deltas.0.operation"]
+    assert "deltas.0.operation" in results[0].errors[0]
+
+
+def test_validate_without_json_does_not_import_pydantic(temp_project):
+    """Projects without JSON blocks never load pydantic."""
+    import subprocess
+    import sys
+    
+    spec_dir = temp_project / "openspec" / "specs" / "plain"
+    ensure_directory(str(spec_dir))
+    write_file(str(spec_dir / "spec.md"), "# Plain\n\n## Purpose\nPlain.\n\n## Requirements\n")
+    
+    script = (
+        "import sys\n"
+        "from openspec.core.validation import validate_project\n"
+        f"results = validate_project({str(temp_project)!r})\n"
+        "assert results[0].is_valid\n"
+        "print('pydantic' in sys.modules)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    
+    assert output.stdout.strip() == "False"
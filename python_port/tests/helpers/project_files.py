@@ -0,0 +1,64 @@
+"""Helpers for laying out OpenSpec project files in tests."""
+
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from openspec.core.archive_index import record_archive
+from openspec.core.change_operations import load_spec_delta_plans
+from openspec.core.fingerprints import record_base_fingerprints
+
+
+def write_openspec_files(project_dir: Path, files: Dict[str, str]) -> Path:
+    """Write ``{path relative to openspec/: content}`` and return the openspec directory."""
+    openspec_dir = Path(project_dir) / "openspec"
+    for relative, content in files.items():
+        path = openspec_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return openspec_dir
+
+
+def write_change_project(
+    project_dir: Path,
+    spec: str,
+    main_spec: str,
+    change: str,
+    delta: str,
+    proposal: Optional[str] = None,
+    record_bases: bool = False,
+) -> Path:
+    """Write a main spec and an active change with a delta for it; returns the change directory.
+
+    With ``record_bases`` the change's base fingerprints are recorded, as
+    validating it would.
+    """
+    files = {f"specs/{spec}/spec.md": main_spec, f"changes/{change}/specs/{spec}/spec.md": delta}
+    if proposal is not None:
+        files[f"changes/{change}/proposal.md"] = proposal
+    change_dir = write_openspec_files(project_dir, files) / "changes" / change
+    if record_bases:
+        record_base_fingerprints(change_dir, load_spec_delta_plans(str(project_dir), change_dir))
+    return change_dir
+
+
+def add_archived_change(
+    archive_dir: Path,
+    directory: str,
+    delta: str,
+    spec: str = "auth",
+    preimages: Optional[Dict[str, Optional[str]]] = None,
+) -> Path:
+    """Create an archived ``YYYY-MM-DD-<id>`` change with one delta and index it.
+
+    ``preimages`` is written to its meta.json the way ``archive_change``
+    records the spec texts a change replaced.
+    """
+    change_dir = Path(archive_dir) / directory
+    spec_file = change_dir / "specs" / spec / "spec.md"
+    spec_file.parent.mkdir(parents=True)
+    spec_file.write_text(delta)
+    if preimages is not None:
+        (change_dir / "meta.json").write_text(json.dumps({"version": 1, "bases": {}, "preimages": preimages}))
+    record_archive(archive_dir, directory[11:], change_dir)
+    return change_dir
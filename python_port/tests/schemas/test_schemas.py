@@ -135,4 +135,44 @@ def test_change_metadata():
     
     change = ChangeSchema.model_validate(data)
     assert change.metadata.version == "1.0.0"
-    assert change.metadata.format == "openspec-change"
\ No newline at end of file
+    assert change.metadata.format == "openspec-change"
+
+def test_validate_json_block_reports_locations():
+    """Raw JSON is validated directly and errors carry their location."""
+    from openspec.core.schemas.adapters import validate_json_block
+    
+    raw = b"""{
+        "name": "test-change",
+        "why": "This is a test change that needs to be implemented for testing purposes",
+        "whatChanges": "Test changes will be made",
+        "deltas": [{"spec": "test-spec", "operation": "BOGUS", "description": "x"}]
+    }"""
+    
+    model, issues = validate_json_block("change", raw)
+    
+    assert model is None
+    assert [issue.path for issue in issues] == ["deltas.0.operation"]
+    assert str(issues[0]).startswith("deltas.0.operation: ")
+
+
+def test_validate_json_block_invalid_json():
+    """Malformed JSON is reported as a structured issue, not an exception."""
+    from openspec.core.schemas.adapters import validate_json_block
+    
+    model, issues = validate_json_block("spec", "{not json")
+    
+    assert model is None
+    assert issues[0].error_type == "json_invalid"
+
+
+def test_validate_json_blocks_batch_reuses_adapters():
+    """Batch validation returns one result per block and caches adapters."""
+    from openspec.core.schemas.adapters import validate_json_blocks, get_type_adapter
+    
+    spec_json = '{"name": "s", "purpose": "p", "requirements": []}'
+    results = validate_json_blocks([("spec", spec_json), ("spec", "{}")])
+    
+    assert results[0][0].name == "s"
+    assert results[0][1] == []
+    assert {issue.path for issue in results[1][1]} == {"name", "purpose", "requirements"}
+    assert get_type_adapter("spec") is get_type_adapter("spec")
@@ -9,7 +9,10 @@ from openspec.utils.file_markers import (
     update_file_with_markers,
     has_openspec_markers,
     extract_content_between_markers,
-    _replace_content_between_markers
+    _replace_content_between_markers,
+    scan_markers,
+    update_file_blocks,
+    DEFAULT_BLOCK
 )
 from openspec.utils.file_system import read_file, write_file
 from openspec.core.config import OPENSPEC_MARKERS
@@ -209,4 +212,41 @@ After content
     assert "Just some content" in result
     assert new_content in result
     assert OPENSPEC_MARKERS["start"] in result
-    assert OPENSPEC_MARKERS["end"] in result
\ No newline at end of file
+    assert OPENSPEC_MARKERS["end"] in result
+
+
+def test_update_several_blocks_in_one_write(temp_dir):
+    """Named blocks are found in one scan and updated together."""
+    file_path = temp_dir / "test.md"
+    write_file(str(file_path), f"""# Header
+{OPENSPEC_MARKERS["start"]}
+old default
+{OPENSPEC_MARKERS["end"]}
+middle
+<!-- OPENSPEC:START:commands -->
+old commands
+<!-- OPENSPEC:END:commands -->
+footer
+""")
+    
+    scan = scan_markers(read_file(str(file_path)))
+    assert sorted(scan.blocks) == [DEFAULT_BLOCK, "commands"]
+    assert scan.body("commands") == "\nold commands\n"
+    
+    update_file_blocks(str(file_path), {DEFAULT_BLOCK: "new default", "commands": "new commands", "extra": "added"})
+    
+    updated = read_file(str(file_path))
+    assert "old" not in updated
+    assert updated.index("new default") < updated.index("middle") < updated.index("new commands")
+    assert updated.endswith("footer\n\n<!-- OPENSPEC:START:extra -->\nadded\n<!-- OPENSPEC:END:extra -->\n")
+
+
+def test_update_file_blocks_requires_existing_markers(temp_dir):
+    """Without append_missing, a file lacking the block is an error."""
+    file_path = temp_dir / "test.md"
+    write_file(str(file_path), f"{OPENSPEC_MARKERS['end']}\nmisordered\n{OPENSPEC_MARKERS['start']}\n")
+    
+    with pytest.raises(ValueError, match="Missing OpenSpec markers"):
+        update_file_blocks(str(file_path), {DEFAULT_BLOCK: "body"}, append_missing=False)
+    with pytest.raises(ValueError, match="before start marker"):
+        update_file_blocks(str(file_path), {DEFAULT_BLOCK: "body"})
@@ -16,7 +16,8 @@ from openspec.utils.file_system import (
     copy_file,
     move_file,
     delete_file,
-    delete_directory
+    delete_directory,
+    track_writes
 )
 
 
@@ -91,6 +92,35 @@ class TestFileSystem:
         assert file_path.read_text() == content
         assert (temp_dir / "nested" / "dir").is_dir()
     
+    def test_write_file_skips_identical_content(self, temp_dir):
+        """Test that rewriting identical content leaves the file untouched."""
+        import os
+        
+        file_path = temp_dir / "test.txt"
+        assert write_file(str(file_path), "Same") is True
+        os.utime(file_path, (1_000_000, 1_000_000))
+        
+        with track_writes() as report:
+            assert write_file(str(file_path), "Same") is False
+            assert file_path.stat().st_mtime == 1_000_000
+            assert write_file(str(file_path), "Diff") is True
+        
+        assert report.skipped == [str(file_path)]
+        assert report.written == [str(file_path)]
+        assert report.summary() == "1 file(s) written, 1 unchanged"
+        assert file_path.read_text() == "Diff"
+        assert [p.name for p in temp_dir.iterdir()] == ["test.txt"]
+    
+    def test_write_file_preserves_mode(self, temp_dir):
+        """Test that replacing a file keeps its permissions."""
+        file_path = temp_dir / "script.sh"
+        file_path.write_text("echo old")
+        file_path.chmod(0o755)
+        
+        write_file(str(file_path), "echo new")
+        
+        assert file_path.stat().st_mode & 0o777 == 0o755
+    
     def test_read_file_returns_content(self, temp_dir):
         """Test reading file content."""
         file_path = temp_dir / "test.txt"
@@ -0,0 +1,96 @@
+"""Tests for reading files at git revisions."""
+
+import subprocess
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.validate import validate
+from openspec.core import spec_sources
+from openspec.core.spec_sources import changed_since
+from openspec.utils.git_objects import GitObjectReader, blob_sha
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        check=True, capture_output=True,
+    )
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _project(tmp_path):
+    openspec_dir = tmp_path / "openspec"
+    _write(openspec_dir / "specs" / "auth" / "spec.md", "# auth\n")
+    _write(openspec_dir / "specs" / "billing" / "spec.md", "# billing\n")
+    _write(openspec_dir / "changes" / "add-2fa" / "proposal.md", "# add-2fa\n")
+    _write(openspec_dir / "changes" / "add-2fa" / "specs" / "auth" / "spec.md", "## ADDED Requirements\n")
+    _write(openspec_dir / "changes" / "add-invoices" / "proposal.md", "# add-invoices\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return openspec_dir
+
+
+def test_reader_lists_and_streams_blobs(tmp_path):
+    """One cat-file process serves trees and blobs; blob SHAs match git's."""
+    openspec_dir = _project(tmp_path)
+    (openspec_dir / "specs" / "auth" / "spec.md").write_text("# auth v2\n")
+    _git(tmp_path, "commit", "-q", "-am", "auth v2")
+
+    with GitObjectReader(tmp_path) as reader:
+        now = reader.list_files("HEAD", "openspec/specs")
+        before = reader.list_files("HEAD~1", "openspec/specs")
+        assert sorted(now) == ["openspec/specs/auth/spec.md", "openspec/specs/billing/spec.md"]
+        assert reader.read_blob(now["openspec/specs/auth/spec.md"]) == b"# auth v2\n"
+        assert reader.read_blob(before["openspec/specs/auth/spec.md"]) == b"# auth\n"
+        assert now["openspec/specs/billing/spec.md"] == blob_sha(b"# billing\n")
+        assert reader.list_files("HEAD", "openspec/specs/billing/spec.md") == {
+            "openspec/specs/billing/spec.md": blob_sha(b"# billing\n")
+        }
+        assert reader.list_files("HEAD", "openspec/nowhere") == {}
+        assert reader.resolve_commit("no-such-rev") is None
+        process = reader._process
+    assert process.poll() is not None
+
+
+def test_changed_since_covers_edits_untracked_files_and_dependent_changes(tmp_path):
+    """A changed spec pulls in the active changes that carry deltas for it."""
+    openspec_dir = _project(tmp_path)
+    assert changed_since(tmp_path, "HEAD").changes == set()
+
+    (openspec_dir / "specs" / "auth" / "spec.md").write_text("# auth edited\n")
+    _write(openspec_dir / "changes" / "add-export" / "proposal.md", "# add-export\n")
+
+    changed = changed_since(tmp_path, "HEAD")
+    assert changed.specs == {"auth"}
+    assert changed.changes == {"add-2fa", "add-export"}
+
+
+def test_changed_since_does_not_read_the_archive(tmp_path, monkeypatch):
+    """Archived and hidden directories are pruned before any file is hashed."""
+    openspec_dir = _project(tmp_path)
+    _write(openspec_dir / "changes" / "archive" / "2024-01-01-old" / "proposal.md", "# old\n")
+    _write(openspec_dir / "changes" / ".cache" / "blame.json", "{}")
+    hashed = []
+    monkeypatch.setattr(spec_sources, "blob_sha", lambda data: hashed.append(data) or blob_sha(data))
+
+    assert changed_since(tmp_path, "HEAD").changes == set()
+    assert b"# old\n" not in hashed and b"{}" not in hashed
+    assert len(hashed) == 5
+
+
+def test_validate_since_skips_untouched_items(tmp_path, monkeypatch):
+    _project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(validate, ["--since", "HEAD"])
+    assert result.exit_code == 0, result.output
+    assert "Nothing changed since HEAD" in result.output
+
+    result = CliRunner().invoke(validate, ["--since", "no-such-rev"])
+    assert result.exit_code != 0
+    assert "not a git revision" in result.output
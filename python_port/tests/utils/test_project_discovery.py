@@ -0,0 +1,52 @@
+"""Tests for discovering OpenSpec projects in a monorepo."""
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.update import update
+from openspec.utils.project_discovery import find_openspec_roots
+
+
+def _project(path):
+    (path / "openspec").mkdir(parents=True)
+    return path
+
+
+def test_finds_nested_projects_and_prunes_ignored_dirs(tmp_path):
+    """Nested projects are found; ignored, hidden and dependency dirs are skipped."""
+    _project(tmp_path)
+    _project(tmp_path / "packages" / "api")
+    _project(tmp_path / "packages" / "api" / "plugins" / "auth")
+    _project(tmp_path / "node_modules" / "dep")
+    _project(tmp_path / ".cache" / "copy")
+    _project(tmp_path / "generated" / "client")
+    (tmp_path / ".gitignore").write_text("generated/\n")
+
+    roots = find_openspec_roots(str(tmp_path), workers=2)
+
+    assert roots == sorted([
+        tmp_path.resolve(),
+        (tmp_path / "packages" / "api").resolve(),
+        (tmp_path / "packages" / "api" / "plugins" / "auth").resolve(),
+    ])
+
+
+def test_nested_gitignore_applies_to_its_subtree(tmp_path):
+    """A .gitignore only prunes below the directory it lives in."""
+    _project(tmp_path / "a" / "out")
+    _project(tmp_path / "b" / "out")
+    (tmp_path / "a" / ".gitignore").write_text("out\n")
+
+    assert find_openspec_roots(str(tmp_path)) == [(tmp_path / "b" / "out").resolve()]
+
+
+def test_update_recursive_refreshes_every_project(tmp_path):
+    """update --recursive writes each project's AGENTS.md and prints a summary."""
+    _project(tmp_path / "one")
+    _project(tmp_path / "two")
+
+    result = CliRunner().invoke(update, [str(tmp_path), "--recursive", "--agents"])
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "one" / "openspec" / "AGENTS.md").exists()
+    assert (tmp_path / "two" / "openspec" / "AGENTS.md").exists()
+    assert "Updated 2 project(s)" in result.output
@@ -0,0 +1,122 @@
+"""Tests for the storage backends."""
+
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from openspec.cli.commands.archive import archive
+from openspec.core.change_operations import archive_change
+from openspec.core.validation import validate_project
+from openspec.utils.git_objects import GitObjectReader
+from openspec.utils.storage import LOCAL_STORAGE, GitTreeStorage, MemoryStorage, Storage
+from tests.helpers.project_files import write_openspec_files
+
+MAIN_SPEC = """# auth Specification
+
+## Purpose
+Authentication.
+
+## Requirements
+
+### Requirement: Password login
+Users SHALL sign in with a password.
+
+#### Scenario: Valid password
+- **WHEN** the password matches
+- **THEN** the user is signed in
+"""
+
+DELTA = """## ADDED Requirements
+
+### Requirement: Two-factor login
+Users SHALL confirm sign-in with a second factor.
+
+#### Scenario: Code accepted
+- **WHEN** the code matches
+- **THEN** the user is signed in
+"""
+
+
+def _project(tmp_path):
+    files = {
+        "specs/auth/spec.md": MAIN_SPEC,
+        "changes/add-2fa/proposal.md": "# add-2fa\n\n## Why\nSafer.\n\n## What Changes\n- 2FA\n",
+        "changes/add-2fa/specs/auth/spec.md": DELTA,
+    }
+    return write_openspec_files(tmp_path, files)
+
+
+def test_incomplete_backend_cannot_be_instantiated():
+    class ReadOnlyDraft(Storage):
+        def read_text(self, path):
+            return ""
+
+    with pytest.raises(TypeError):
+        ReadOnlyDraft()
+
+
+def test_memory_storage_layers_writes_and_renames_over_base(tmp_path):
+    openspec_dir = _project(tmp_path)
+    storage = MemoryStorage(LOCAL_STORAGE)
+
+    storage.write_text(openspec_dir / "specs" / "auth" / "spec.md", "# changed\n")
+    storage.rename(openspec_dir / "changes" / "add-2fa", openspec_dir / "changes" / "archive" / "x")
+
+    assert storage.read_text(openspec_dir / "specs" / "auth" / "spec.md") == "# changed\n"
+    assert not storage.exists(openspec_dir / "changes" / "add-2fa")
+    assert storage.list_directories(openspec_dir / "changes") == ["archive"]
+    assert storage.read_text(openspec_dir / "changes" / "archive" / "x" / "specs" / "auth" / "spec.md") == DELTA
+    with pytest.raises(FileNotFoundError):
+        storage.read_text(openspec_dir / "changes" / "add-2fa" / "proposal.md")
+
+    # The disk is untouched
+    assert (openspec_dir / "specs" / "auth" / "spec.md").read_text() == MAIN_SPEC
+    assert (openspec_dir / "changes" / "add-2fa").is_dir()
+
+
+def test_archive_against_memory_storage_writes_nothing(tmp_path):
+    openspec_dir = _project(tmp_path)
+    storage = MemoryStorage(LOCAL_STORAGE)
+
+    archived_path = archive_change(str(tmp_path), "add-2fa", storage=storage)
+
+    spec_path = openspec_dir / "specs" / "auth" / "spec.md"
+    assert "Two-factor login" in storage.read_text(spec_path)
+    assert storage.is_dir(archived_path)
+    assert spec_path.read_text() == MAIN_SPEC
+    assert (openspec_dir / "changes" / "add-2fa").is_dir()
+    assert not (openspec_dir / "changes" / "archive").exists()
+
+
+def test_git_tree_storage_is_read_only(tmp_path):
+    openspec_dir = _project(tmp_path)
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run(git + ["init", "-q"], check=True)
+    subprocess.run(git + ["add", "."], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "initial"], check=True)
+    (openspec_dir / "specs" / "auth" / "spec.md").write_text("")
+
+    with GitObjectReader(tmp_path) as reader:
+        storage = GitTreeStorage(tmp_path, "HEAD", reader)
+        assert storage.read_text(openspec_dir / "specs" / "auth" / "spec.md") == MAIN_SPEC
+        assert storage.list_directories(openspec_dir / "changes") == ["add-2fa"]
+        assert storage.list_dir(openspec_dir / "nowhere") == []
+        with pytest.raises(PermissionError):
+            storage.write_text(openspec_dir / "x.md", "")
+
+        results = validate_project(str(tmp_path), storage=storage)
+        assert [result.file_type for result in results] == ["change", "spec"]
+        assert all(result.is_valid for result in results), [result.errors for result in results]
+    assert not (openspec_dir / "changes" / "add-2fa" / "meta.json").exists()
+
+
+def test_archive_dry_run_command(tmp_path, monkeypatch):
+    openspec_dir = _project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(archive, ["add-2fa", "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "+### Requirement: Two-factor login" in result.output
+    assert "no files were written" in result.output
+    assert (openspec_dir / "specs" / "auth" / "spec.md").read_text() == MAIN_SPEC
@@ -0,0 +1,70 @@
+"""Tests for the task progress scanner."""
+
+import os
+
+from click.testing import CliRunner
+
+from openspec.cli.commands.view import view
+from openspec.utils.task_progress import load_task_progress, scan_tasks
+
+TASKS = """# Tasks
+
+## 1. Implementation
+- [x] 1.1 Add the parser
+  - [X] Handle headings
+  - [ ] Handle numbered sections
+    * [ ] Deeply nested
+3 items left to check before review.
+- [ ] 1.2 Wire it up
+
+2. Documentation
+1. [x] Write the guide
++ [] Review it
+"""
+
+
+def test_scan_builds_nested_tree_by_section():
+    progress = scan_tasks(TASKS)
+
+    assert [section.title for section in progress.sections] == ["1. Implementation", "Documentation"]
+    implementation, documentation = progress.sections
+    assert (implementation.completed, implementation.total, implementation.percent) == (2, 5, 40)
+    assert (documentation.completed, documentation.total, documentation.percent) == (1, 2, 50)
+
+    parent = progress.roots[0]
+    assert parent.text == "1.1 Add the parser" and parent.done and parent.line == 4
+    assert [(child.text, child.done, child.depth) for child in parent.children] == [
+        ("Handle headings", True, 1),
+        ("Handle numbered sections", False, 1),
+    ]
+    assert parent.children[1].children[0].depth == 2
+    assert [task.text for task in progress.roots] == ["1.1 Add the parser", "1.2 Wire it up", "Write the guide", "Review it"]
+    assert (progress.completed, progress.total, progress.incomplete, progress.percent) == (3, 7, 4, 42)
+
+
+def test_load_is_cached_until_the_file_changes(tmp_path):
+    tasks_file = tmp_path / "tasks.md"
+    assert load_task_progress(tmp_path).total == 0
+
+    tasks_file.write_text("- [ ] One\n")
+    first = load_task_progress(tmp_path)
+    assert load_task_progress(tmp_path) is first
+
+    tasks_file.write_text("- [x] One\n")
+    stat = os.stat(tasks_file)
+    os.utime(tasks_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_task_progress(tmp_path).completed == 1
+
+
+def test_view_shows_task_progress(tmp_path, monkeypatch):
+    change_dir = tmp_path / "openspec" / "changes" / "add-parser"
+    change_dir.mkdir(parents=True)
+    (tmp_path / "openspec" / "specs").mkdir()
+    (change_dir / "proposal.md").write_text("# add-parser\n")
+    (change_dir / "tasks.md").write_text(TASKS)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(view, ["--format", "list"])
+    assert result.exit_code == 0, result.output
+    assert "add-parser 3/7 (42%)" in result.output
+    assert "1. Implementation: 2/5 (40%)" in result.output